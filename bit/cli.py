@@ -719,11 +719,9 @@ def package(
 
             # If no version specified, try to find any version
             if not version:
-                packages = registry.list_packages()
-                matching = [p for p in packages if p.package_id == package_id]
-                if matching:
+                pkg = next((p for p in registry.iter_packages() if p.package_id == package_id), None)
+                if pkg:
                     # Use first (most recent) version
-                    pkg = matching[0]
                     version = pkg.version
                 else:
                     console.print(f"[red]✗[/red] Package not found: {package_id}")
@@ -771,10 +769,8 @@ def package(
 
             # If no version specified, find any version
             if not version:
-                packages = registry.list_packages()
-                matching = [p for p in packages if p.package_id == package_id]
-                if matching:
-                    pkg = matching[0]
+                pkg = next((p for p in registry.iter_packages() if p.package_id == package_id), None)
+                if pkg:
                     version = pkg.version
                 else:
                     console.print(f"[red]✗[/red] Package not found: {package_id}")
@@ -1,6 +1,7 @@
 """Configuration management for Concierge."""
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Any, Dict
 from pydantic import BaseModel, Field, ConfigDict
@@ -114,6 +115,18 @@ class ConciergeConfig(BaseModel):
     workers: Dict[str, WorkerConfig] = Field(default={}, description="Worker configurations")
 
 
+@lru_cache(maxsize=1)
+def _default_template() -> ConciergeConfig:
+    """Build the all-defaults configuration once.
+
+    Callers must copy it with ``model_copy(deep=True)``; the template itself is never handed out.
+
+    Returns:
+        ConciergeConfig: Shared default configuration
+    """
+    return ConciergeConfig()
+
+
 class ConfigManager:
     """Manages Concierge configuration."""
 
@@ -127,6 +140,10 @@ class ConfigManager:
         """
         self.workspace_path = Path(workspace_path)
         self.config_file = self.workspace_path / self.CONFIG_FILE
+        # ((st_mtime_ns, st_size), raw bytes) for the last config read or written. Bytes rather
+        # than the parsed model: callers mutate what load() returns, and revalidating is cheaper
+        # than a deep copy.
+        self._raw_cache: Optional[tuple[tuple[int, int], bytes]] = None
 
     def load(self) -> ConciergeConfig:
         """Load configuration from file.
@@ -134,15 +151,52 @@ class ConfigManager:
         Returns:
             ConciergeConfig: Loaded configuration or defaults if not found
         """
-        if not self.config_file.exists():
-            return ConciergeConfig(workspace_path=str(self.workspace_path))
+        raw = self._read_raw()
+        if raw is None:
+            return self._default_config()
+
+        try:
+            # pydantic-core parses the JSON directly, with no intermediate dict
+            return ConciergeConfig.model_validate_json(raw)
+        except ValueError:
+            return self._default_config()
+
+    def _read_raw(self) -> Optional[bytes]:
+        """Read the config file, reusing the cached bytes while it is unchanged.
 
+        Returns:
+            bytes: File contents, or None if the file does not exist
+        """
         try:
-            with open(self.config_file, "r") as f:
-                data = json.load(f)
-            return ConciergeConfig(**data)
-        except (json.JSONDecodeError, ValueError):
-            return ConciergeConfig(workspace_path=str(self.workspace_path))
+            st = self.config_file.stat()
+        except FileNotFoundError:
+            return None
+
+        key = (st.st_mtime_ns, st.st_size)
+        if self._raw_cache is not None and self._raw_cache[0] == key:
+            return self._raw_cache[1]
+
+        raw = self.config_file.read_bytes()
+        self._raw_cache = (key, raw)
+        return raw
+
+    def _write_raw(self, raw: bytes) -> None:
+        """Write the config file and remember its bytes for the next read.
+
+        Args:
+            raw: Encoded JSON document
+        """
+        self.config_file.write_bytes(raw)
+        st = self.config_file.stat()
+        self._raw_cache = ((st.st_mtime_ns, st.st_size), raw)
+
+    def _default_config(self) -> ConciergeConfig:
+        """Return a fresh default configuration for this workspace.
+
+        Returns:
+            ConciergeConfig: Deep copy of the cached defaults
+        """
+        return _default_template().model_copy(deep=True, update={"workspace_path": str(self.workspace_path)})
 
     def save(self, config: ConciergeConfig) -> Path:
         """Save configuration to file.
@@ -153,10 +207,8 @@ class ConfigManager:
         Returns:
             Path: Path to saved file
         """
-        config_dict = config.model_dump(mode="json")
-
-        with open(self.config_file, "w") as f:
-            json.dump(config_dict, f, indent=2)
+        # Serialize in pydantic-core directly instead of model_dump + json.dump
+        self._write_raw(config.__pydantic_serializer__.to_json(config, indent=2))
 
         return self.config_file
 
@@ -221,14 +273,13 @@ class ConfigManager:
             worker_id: Worker ID
             updates: Configuration updates
         """
+        # Round-trip through the full model so an invalid stored config is reset, as load() does
         config = self.load()
 
-        if worker_id in config.workers:
-            worker_dict = config.workers[worker_id].model_dump()
-            worker_dict.update(updates)
-            config.workers[worker_id] = WorkerConfig(**worker_dict)
-        else:
-            config.workers[worker_id] = WorkerConfig(worker_id=worker_id, **updates)
+        current = config.workers.get(worker_id)
+        worker_dict = current.model_dump() if current is not None else {"worker_id": worker_id}
+        worker_dict.update(updates)
+        config.workers[worker_id] = WorkerConfig(**worker_dict)
 
         self.save(config)
 
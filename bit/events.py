@@ -1,13 +1,36 @@
 """Event system for pipeline execution tracking."""
 
-from datetime import datetime, UTC
 from enum import Enum
 from pathlib import Path
 from typing import Optional, Any
 import json
+import time
 
 from pydantic import BaseModel, Field, ConfigDict
 
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") for the last second seen; one tuple so
+# concurrent callers never observe a half-updated pair
+_second_prefix: tuple[int, str] = (-1, "")
+
+
+def utc_now_iso() -> str:
+    """Current UTC time as ISO 8601 with microseconds and a Z suffix.
+
+    Bursts of events land in the same second, so the formatted date/time prefix
+    is reused until the second changes. Always includes microseconds, so
+    timestamps sort lexically in creation order.
+
+    Returns:
+        str: Timestamp like 2026-02-04T12:00:00.000000Z
+    """
+    global _second_prefix
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _second_prefix
+    if seconds != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _second_prefix = (seconds, prefix)
+    return f"{prefix}.{nanos // 1000:06d}Z"
+
 
 class EventType(str, Enum):
     """Pipeline execution event types."""
@@ -75,6 +98,17 @@ class EventLog:
         with open(self.log_path, "a") as f:
             f.write(event.to_jsonl() + "\n")
 
+    def emit_batch(self, events: list[Event]) -> None:
+        """Emit several events to the log with a single open and write.
+
+        Args:
+            events: Events to log, in order
+        """
+        if not events:
+            return
+        with open(self.log_path, "a", buffering=1 << 16) as f:
+            f.writelines([event.to_jsonl() + "\n" for event in events])
+
     def read(self) -> list[Event]:
         """Read all events from log.
 
@@ -84,19 +118,54 @@ class EventLog:
         if not self.log_path.exists():
             return []
 
-        events = []
         with open(self.log_path, "r") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    data = json.loads(line)
-                    event = Event(**data)
-                    events.append(event)
-                except (json.JSONDecodeError, ValueError):
-                    # Skip malformed lines
-                    pass
+            return self._parse_lines(f)
+
+    def read_from(self, offset: int = 0) -> tuple[list[Event], int]:
+        """Read complete events appended at or after a byte offset.
+
+        The log is append-only, so a reader that remembers the returned offset
+        can pick up new events without re-parsing the whole file. A trailing
+        line without its newline (a write in progress) is left for the next call.
+
+        Args:
+            offset: Byte offset of the first unread line
+
+        Returns:
+            tuple: (events, offset just past the last complete line)
+        """
+        try:
+            with open(self.log_path, "rb") as f:
+                f.seek(offset)
+                data = f.read()
+        except FileNotFoundError:
+            return [], offset
+
+        end = data.rfind(b"\n") + 1
+        return self._parse_lines(data[:end].splitlines()), offset + end
+
+    @staticmethod
+    def _parse_lines(lines) -> list[Event]:
+        """Parse JSONL lines into events.
+
+        Args:
+            lines: Iterable of str or bytes lines
+
+        Returns:
+            list[Event]: Parsed events in order
+        """
+        events = []
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                data = json.loads(line)
+                event = Event(**data)
+                events.append(event)
+            except (json.JSONDecodeError, ValueError):
+                # Skip malformed lines
+                pass
 
         return events
 
@@ -189,7 +258,7 @@ class RunRecord(BaseModel):
         """
         import uuid
 
-        now = datetime.now(UTC).isoformat().replace('+00:00', 'Z')
+        now = utc_now_iso()
         return RunRecord(
             run_id=f"run-{uuid.uuid4()}",
             created_at=now,
@@ -1,9 +1,11 @@
 """Intent synthesis and management."""
 
 import json
+import os
 import re
 import uuid
 from datetime import datetime, UTC
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -35,6 +37,17 @@ class Intent(BaseModel):
     created_at: str = Field(description="ISO 8601 timestamp")
     intent_hash: str = Field(description="SHA256 hash of canonical intent content")
 
+    def to_canonical_json(self) -> bytes:
+        """Canonical JSON encoding used for hashing.
+
+        Re-encoded from the current fields on every call, so in-place edits to
+        constraints are always reflected.
+
+        Returns:
+            bytes: Compact, key-sorted JSON of to_canonical_dict()
+        """
+        return json.dumps(self.to_canonical_dict(), sort_keys=True, separators=(",", ":")).encode()
+
     def to_canonical_dict(self) -> dict:
         """Return dict for hashing (excludes metadata like id, hash, timestamp).
 
@@ -58,22 +71,26 @@ class IntentSynthesizer:
     # Pattern for identifying sentences
     SENTENCE_PATTERN = re.compile(r"[^.!?]*[.!?]+")
 
-    # Patterns for extracting success criteria
+    # Patterns for extracting success criteria, tried in order
     SUCCESS_PATTERNS = [
-        r"(?:should|must|needs to|will)\s+([^.!?]+[.!?])",
-        r"success (?:is|criteria|means)\s*[:-]?\s*([^.!?]+[.!?])",
-        r"(?:to achieve|goal is)\s+([^.!?]+[.!?])",
+        re.compile(r"(?:should|must|needs to|will)\s+([^.!?]+[.!?])", re.IGNORECASE),
+        re.compile(r"success (?:is|criteria|means)\s*[:-]?\s*([^.!?]+[.!?])", re.IGNORECASE),
+        re.compile(r"(?:to achieve|goal is)\s+([^.!?]+[.!?])", re.IGNORECASE),
     ]
 
-    # Patterns for extracting constraints
+    # Patterns for extracting constraints. Kept separate rather than one alternation:
+    # each pattern scans the whole text, so matches of different patterns may overlap.
     CONSTRAINT_PATTERNS = [
-        r"must (?:use|implement|have)\s+([^,.]+)",
-        r"cannot\s+([^,.]+)",
-        r"within\s+([^,.]+)",
-        r"only\s+([^,.]+)",
-        r"(?:no|never)\s+([^,.]+)",
+        re.compile(r"must (?:use|implement|have)\s+([^,.]+)", re.IGNORECASE),
+        re.compile(r"cannot\s+([^,.]+)", re.IGNORECASE),
+        re.compile(r"within\s+([^,.]+)", re.IGNORECASE),
+        re.compile(r"only\s+([^,.]+)", re.IGNORECASE),
+        re.compile(r"(?:no|never)\s+([^,.]+)", re.IGNORECASE),
     ]
 
+    # Trailing punctuation stripped from extracted constraints
+    TRAILING_PUNCT_PATTERN = re.compile(r"[,;.!?]$")
+
     @staticmethod
     def synthesize(text: str, mode: str) -> Intent:
         """Synthesize intent from user text.
@@ -85,6 +102,36 @@ class IntentSynthesizer:
         Returns:
             Intent: Synthesized intent artifact
         """
+        distilled, success, constraints, intent_hash, intent_id = IntentSynthesizer._derive(text, mode)
+
+        # Create intent; a new instance (and constraints list) per call, since callers mutate intents
+        intent = Intent(
+            intent_id=intent_id,
+            mode=mode,
+            distilled_intent=distilled,
+            success_criteria=success,
+            constraints=list(constraints),
+            created_at=datetime.now(UTC).isoformat().replace('+00:00', 'Z'),
+            intent_hash=intent_hash,
+        )
+
+        return intent
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _derive(text: str, mode: str) -> tuple[str, str, tuple[str, ...], str, str]:
+        """Extract and hash the deterministic parts of an intent.
+
+        Everything here depends only on (text, mode), so repeat synthesis of the
+        same text skips the regex passes, canonical JSON and hashing.
+
+        Args:
+            text: User-provided intent description
+            mode: Current mode name
+
+        Returns:
+            tuple: (distilled, success_criteria, constraints, intent_hash, intent_id)
+        """
         # Extract components
         distilled = IntentSynthesizer._extract_distilled_intent(text)
         success = IntentSynthesizer._extract_success_criteria(text)
@@ -108,18 +155,7 @@ class IntentSynthesizer:
             intent_hash
         ))
 
-        # Create intent
-        intent = Intent(
-            intent_id=intent_id,
-            mode=mode,
-            distilled_intent=distilled,
-            success_criteria=success,
-            constraints=constraints,
-            created_at=datetime.now(UTC).isoformat().replace('+00:00', 'Z'),
-            intent_hash=intent_hash,
-        )
-
-        return intent
+        return distilled, success, tuple(constraints), intent_hash, intent_id
 
     @staticmethod
     def _extract_distilled_intent(text: str) -> str:
@@ -158,7 +194,7 @@ class IntentSynthesizer:
             str: Extracted success criteria or placeholder
         """
         for pattern in IntentSynthesizer.SUCCESS_PATTERNS:
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
 
@@ -179,11 +215,10 @@ class IntentSynthesizer:
         constraints = set()
 
         for pattern in IntentSynthesizer.CONSTRAINT_PATTERNS:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+            for match in pattern.finditer(text):
                 constraint = match.group(1).strip()
                 # Clean up constraint
-                constraint = re.sub(r"[,;.!?]$", "", constraint)
+                constraint = IntentSynthesizer.TRAILING_PUNCT_PATTERN.sub("", constraint)
                 if constraint and len(constraint) > 2:  # Skip very short matches
                     constraints.add(constraint)
 
@@ -231,11 +266,35 @@ class IntentManager:
             Path: Path to saved file
         """
         self._ensure_artifacts_dir()
+        return self._write(intent)
+
+    def save_many(self, intents: list[Intent]) -> list[Path]:
+        """Save several intents, creating the artifacts directory once.
+
+        Each intent still gets its own file, exactly as save() writes it.
+
+        Args:
+            intents: Intents to save
+
+        Returns:
+            list[Path]: Paths to saved files, in input order
+        """
+        self._ensure_artifacts_dir()
+        return [self._write(intent) for intent in intents]
 
+    def _write(self, intent: Intent) -> Path:
+        """Write intent JSON into the (existing) artifacts directory.
+
+        Args:
+            intent: Intent to write
+
+        Returns:
+            Path: Path to written file
+        """
         intent_path = self._get_intent_path(intent.intent_hash)
 
-        with open(intent_path, "w") as f:
-            json.dump(intent.model_dump(), f, indent=2)
+        # Serialize in pydantic-core directly instead of model_dump + json.dump
+        intent_path.write_bytes(intent.__pydantic_serializer__.to_json(intent, indent=2))
 
         return intent_path
 
@@ -248,52 +307,63 @@ class IntentManager:
         Returns:
             Intent: Loaded intent or None if not found
         """
-        # Try exact match first with 16-char prefix
+        # File names carry exactly the first 16 chars, so a longer hash maps to one path
         if len(intent_hash) >= 16:
-            intent_path = self._get_intent_path(intent_hash)
-            if intent_path.exists():
-                try:
-                    with open(intent_path, "r") as f:
-                        data = json.load(f)
-                    return Intent(**data)
-                except (json.JSONDecodeError, ValueError):
-                    return None
-
-        # Try searching by partial hash
-        search_prefix = intent_hash[:min(16, len(intent_hash))]
-        pattern = f"{self.INTENT_PREFIX}{search_prefix}*.json"
-
-        matching_files = list(self.artifacts_dir.glob(pattern))
-        if matching_files:
-            # Return first match
-            try:
-                with open(matching_files[0], "r") as f:
-                    data = json.load(f)
-                return Intent(**data)
-            except (json.JSONDecodeError, ValueError):
-                return None
+            return self._read(self._get_intent_path(intent_hash))
+
+        # Shorter prefix: match scandir names directly (no glob, so the prefix needs no escaping)
+        name_prefix = f"{self.INTENT_PREFIX}{intent_hash}"
+        try:
+            with os.scandir(self.artifacts_dir) as entries:
+                for entry in entries:
+                    if entry.name.startswith(name_prefix) and entry.name.endswith(".json"):
+                        # Return first match
+                        return self._read(entry.path)
+        except FileNotFoundError:
+            pass
 
         return None
 
+    @staticmethod
+    def _read(intent_path: str | Path) -> Optional[Intent]:
+        """Parse an intent file.
+
+        Args:
+            intent_path: Path to intent JSON
+
+        Returns:
+            Intent: Parsed intent or None if missing/corrupted
+        """
+        try:
+            with open(intent_path, "rb") as f:
+                raw = f.read()
+            # pydantic-core parses the JSON directly, with no intermediate dict
+            return Intent.model_validate_json(raw)
+        except (OSError, ValueError):
+            return None
+
     def list_intents(self) -> list[Intent]:
         """List all intents in workspace, sorted by created_at descending.
 
         Returns:
             list[Intent]: All intents, newest first
         """
-        if not self.artifacts_dir.exists():
+        try:
+            # Filter on the names scandir returns instead of building a Path per glob match
+            with os.scandir(self.artifacts_dir) as entries:
+                intent_files = [
+                    entry.path for entry in entries
+                    if entry.name.startswith(self.INTENT_PREFIX) and entry.name.endswith(".json")
+                ]
+        except FileNotFoundError:
             return []
 
         intents = []
-        for intent_file in self.artifacts_dir.glob(f"{self.INTENT_PREFIX}*.json"):
-            try:
-                with open(intent_file, "r") as f:
-                    data = json.load(f)
-                intent = Intent(**data)
+        for intent_file in intent_files:
+            intent = self._read(intent_file)
+            # Skip corrupted files
+            if intent is not None:
                 intents.append(intent)
-            except (json.JSONDecodeError, ValueError):
-                # Skip corrupted files
-                pass
 
         # Sort by created_at descending (newest first)
         intents.sort(key=lambda i: i.created_at, reverse=True)
@@ -308,6 +378,6 @@ class IntentManager:
         Returns:
             bool: True if hash is valid
         """
-        canonical_json = json.dumps(intent.to_canonical_dict(), sort_keys=True, separators=(",", ":"))
-        computed_hash = Workspace.hash_content(canonical_json)
+        # Always re-encode: verification has to see the intent as it is now
+        computed_hash = Workspace.hash_content(intent.to_canonical_json())
         return computed_hash == intent.intent_hash
@@ -1,11 +1,15 @@
 """Job specification and management."""
 
 import json
+import os
 import uuid
+from contextlib import contextmanager
 from datetime import datetime, UTC
 from enum import Enum
+from functools import cached_property
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 import yaml
 from pydantic import BaseModel, Field, ConfigDict
@@ -14,6 +18,10 @@ from bit.workspace import Workspace
 from bit.intent import IntentManager
 from bit.approval import Approval, ApprovalLog
 
+# libyaml's C loader/dumper are an order of magnitude faster; not every PyYAML build has them
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class JobStatus(str, Enum):
     """Job lifecycle status."""
@@ -116,6 +124,38 @@ class JobSpec(BaseModel):
     outputs: list[JobOutput] = Field(description="Output artifacts")
     approval_gates: ApprovalGates = Field(default_factory=ApprovalGates, description="Approval gate configuration")
 
+    def __setattr__(self, name: str, value) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self.__dict__.pop("canonical_json", None)
+
+    def model_copy(self, *, update: Optional[dict] = None, deep: bool = False) -> "JobSpec":
+        """Copy the model, dropping the cached canonical encoding."""
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__dict__.pop("canonical_json", None)
+        return copied
+
+    @cached_property
+    def canonical_json(self) -> bytes:
+        """Cached canonical JSON, used when generating a job_spec_hash.
+
+        Dropped when a field is reassigned, but lists or nested inputs/outputs
+        changed in place are not detected; verification must use
+        to_canonical_json() instead.
+
+        Returns:
+            bytes: Compact, key-sorted JSON of to_canonical_dict()
+        """
+        return self.to_canonical_json()
+
+    def to_canonical_json(self) -> bytes:
+        """Canonical JSON encoding, re-encoded from the current fields on every call.
+
+        Returns:
+            bytes: Compact, key-sorted JSON of to_canonical_dict()
+        """
+        return json.dumps(self.to_canonical_dict(), sort_keys=True, separators=(",", ":")).encode()
+
     def to_canonical_dict(self) -> dict:
         """Return dict for hashing (excludes metadata).
 
@@ -127,15 +167,16 @@ class JobSpec(BaseModel):
             "intent": self.intent,
             "success_criteria": sorted(self.success_criteria),
             "constraints": sorted(self.constraints),
-            "inputs": sorted(
-                [inp.model_dump() for inp in self.inputs],
-                key=lambda x: x["name"]
-            ),
-            "outputs": sorted(
-                [out.model_dump() for out in self.outputs],
-                key=lambda x: x["name"]
-            ),
-            "approval_gates": self.approval_gates.model_dump(),
+            # Plain dict literals equal to model_dump() output, without the serializer call per item
+            "inputs": [
+                {"name": inp.name, "type": inp.type, "value": inp.value, "required": inp.required}
+                for inp in sorted(self.inputs, key=attrgetter("name"))
+            ],
+            "outputs": [
+                {"name": out.name, "type": out.type, "location": out.location}
+                for out in sorted(self.outputs, key=attrgetter("name"))
+            ],
+            "approval_gates": {"required_on": list(self.approval_gates.required_on)},
         }
 
 
@@ -168,10 +209,18 @@ class Job(BaseModel):
 
 
 class JobManager:
-    """Manages job storage and retrieval."""
+    """Manages job storage and retrieval.
+
+    State transitions (transition_to_*, approve_job, deny_job, complete_job, ...) only
+    update the Job in memory and never touch disk; call save() once the state should
+    be visible to other readers such as LogReader or list_jobs().
+    """
 
     JOBS_SUBDIR = "jobs"
     JOB_FILENAME = "job.yaml"
+    # Machine-written JSON copy of job.yaml (a workspace Sidecar document, stamped with
+    # the job.yaml it was written from); pydantic-core parses it without PyYAML.
+    SIDECAR_FILENAME = "job.json"
 
     def __init__(self, workspace_path: str):
         """Initialize job manager.
@@ -182,6 +231,8 @@ class JobManager:
         self.workspace_path = Path(workspace_path)
         self.jobs_dir = self.workspace_path / self.JOBS_SUBDIR
         self.intent_manager = IntentManager(workspace_path)
+        # job_id -> dumped job awaiting write while inside batched(); None when writing through
+        self._deferred: Optional[dict[str, dict]] = None
 
     def _ensure_job_dir(self, job_id: str) -> Path:
         """Ensure job directory exists.
@@ -217,9 +268,7 @@ class JobManager:
         Returns:
             str: SHA256 hash (hex)
         """
-        canonical = job_spec.to_canonical_dict()
-        canonical_json = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
-        return Workspace.hash_content(canonical_json)
+        return Workspace.hash_content(job_spec.canonical_json)
 
     def create_from_intent(self, intent, mode: str) -> Job:
         """Create job from intent.
@@ -269,6 +318,18 @@ class JobManager:
 
         return job
 
+    def create_many(self, intents: list, mode: str) -> list[Job]:
+        """Create one job per intent.
+
+        Args:
+            intents: Intent objects
+            mode: Current mode name
+
+        Returns:
+            list[Job]: Created jobs (not saved), in input order
+        """
+        return [self.create_from_intent(intent, mode) for intent in intents]
+
     def save(self, job: Job) -> Path:
         """Save job to yaml file.
 
@@ -278,15 +339,56 @@ class JobManager:
         Returns:
             Path: Path to saved file
         """
-        self._ensure_job_dir(job.job_id)
-        job_path = self._get_job_path(job.job_id)
+        job_dict = job.model_dump(mode="json")
+        if self._deferred is not None:
+            # Snapshot now so later in-memory changes are not written unless saved again
+            self._deferred[job.job_id] = job_dict
+            return self._get_job_path(job.job_id)
+        return self._write(job.job_id, job_dict)
+
+    def _write(self, job_id: str, job_dict: dict) -> Path:
+        """Write a dumped job to its job.yaml.
+
+        Args:
+            job_id: Job ID
+            job_dict: Job as returned by model_dump(mode="json")
+
+        Returns:
+            Path: Path to written file
+        """
+        self._ensure_job_dir(job_id)
+        job_path = self._get_job_path(job_id)
 
         with open(job_path, "w") as f:
-            job_dict = job.model_dump(mode="json")
-            yaml.dump(job_dict, f, default_flow_style=False, sort_keys=False, indent=2)
+            yaml.dump(job_dict, f, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False, indent=2)
+
+        Workspace.write_sidecar(job_path.parent / self.SIDECAR_FILENAME, job_path.stat(), json.dumps(job_dict).encode())
 
         return job_path
 
+    @contextmanager
+    def batched(self) -> Iterator["JobManager"]:
+        """Defer job writes until the block exits.
+
+        Inside the block save() only records the job's current state; each job is
+        written once on exit with the last state saved. Nested blocks flush with
+        the outermost one. Pending writes are flushed even if the block raises.
+
+        Yields:
+            JobManager: This manager
+        """
+        if self._deferred is not None:
+            yield self
+            return
+
+        self._deferred = {}
+        try:
+            yield self
+        finally:
+            pending, self._deferred = self._deferred, None
+            for job_id, job_dict in pending.items():
+                self._write(job_id, job_dict)
+
     def load(self, job_id: str) -> Optional[Job]:
         """Load job by ID.
 
@@ -301,32 +403,71 @@ class JobManager:
         if not job_path.exists():
             return None
 
+        return self._read(job_path)
+
+    def _read(self, job_path: str | Path) -> Optional[Job]:
+        """Parse a job.yaml file, preferring its JSON sidecar when it is current.
+
+        Args:
+            job_path: Path to job.yaml
+
+        Returns:
+            Job: Parsed job or None if missing/corrupted
+        """
+        job = self._read_sidecar(job_path)
+        if job is not None:
+            return job
+
         try:
-            with open(job_path, "r") as f:
-                data = yaml.safe_load(f)
+            # Raw bytes go straight to libyaml, which does its own UTF-8 decoding
+            with open(job_path, "rb") as f:
+                data = yaml.load(f.read(), Loader=_YAML_LOADER)
             return Job(**data)
-        except (yaml.YAMLError, ValueError):
+        except (OSError, yaml.YAMLError, ValueError):
             return None
 
+    def _read_sidecar(self, job_path: str | Path) -> Optional[Job]:
+        """Load the JSON sidecar next to a job.yaml if it matches that file.
+
+        job.yaml stays the source of truth: once it is edited by hand its stat
+        no longer matches the sidecar's stamp, so the sidecar is ignored until
+        the job is saved again.
+
+        Args:
+            job_path: Path to job.yaml
+
+        Returns:
+            Job: Job from the sidecar, or None to fall back to YAML
+        """
+        try:
+            yaml_st = os.stat(job_path)
+        except OSError:
+            return None
+        sidecar_path = os.path.join(os.path.dirname(job_path), self.SIDECAR_FILENAME)
+        return Workspace.read_sidecar(sidecar_path, yaml_st, Job)
+
     def list_jobs(self) -> list[Job]:
         """List all jobs, sorted by created_at descending.
 
         Returns:
             list[Job]: All jobs, newest first
         """
-        if not self.jobs_dir.exists():
+        try:
+            # scandir hands back plain names and d_type, without a Path per entry
+            with os.scandir(self.jobs_dir) as entries:
+                job_files = [
+                    os.path.join(entry.path, self.JOB_FILENAME)
+                    for entry in entries if entry.is_dir()
+                ]
+        except FileNotFoundError:
             return []
 
         jobs = []
-        for job_file in self.jobs_dir.glob(f"*/{self.JOB_FILENAME}"):
-            try:
-                with open(job_file, "r") as f:
-                    data = yaml.safe_load(f)
-                job = Job(**data)
+        for job_file in job_files:
+            job = self._read(job_file)
+            # Skip job directories without a readable job.yaml
+            if job is not None:
                 jobs.append(job)
-            except (yaml.YAMLError, ValueError):
-                # Skip corrupted files
-                pass
 
         # Sort by created_at descending (newest first)
         jobs.sort(key=lambda j: j.created_at, reverse=True)
@@ -341,7 +482,8 @@ class JobManager:
         Returns:
             bool: True if hash is valid
         """
-        computed_hash = self._compute_job_spec_hash(job.job_spec)
+        # Always re-encode: the spec may have been changed in place since it was hashed
+        computed_hash = Workspace.hash_content(job.job_spec.to_canonical_json())
         return computed_hash == job.job_spec_hash
 
     def verify_intent_hash(self, job: Job) -> bool:
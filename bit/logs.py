@@ -1,5 +1,6 @@
 """Log reading and filtering utilities."""
 
+import os
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
@@ -21,6 +22,43 @@ class LogReader:
         self.workspace_path = Path(workspace_path)
         self.job_manager = JobManager(workspace_path)
         self.plan_manager = PlanManager(workspace_path)
+        # log path -> (st_mtime_ns, st_size, parsed events); logs are append-only, so a
+        # changed file is tailed from the cached size instead of re-parsed
+        self._events_cache: dict[Path, tuple[int, int, list[Event]]] = {}
+
+    def _read_events(self, log: EventLog) -> list[Event]:
+        """Read all events from a log, reusing what was parsed on earlier calls.
+
+        Args:
+            log: Event log to read
+
+        Returns:
+            list[Event]: All logged events in order (shared; do not mutate)
+        """
+        try:
+            st = os.stat(log.log_path)
+        except OSError:
+            self._events_cache.pop(log.log_path, None)
+            return []
+
+        cached = self._events_cache.get(log.log_path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        if cached is not None and st.st_size > cached[1]:
+            new_events, end = log.read_from(cached[1])
+            events = cached[2] + new_events
+        else:
+            # First read, or the file shrank (rewritten): parse from the start
+            events, end = log.read_from(0)
+
+        if end != st.st_size:
+            # Trailing line without a newline: not safe to tail from, so read in full uncached
+            self._events_cache.pop(log.log_path, None)
+            return log.read()
+
+        self._events_cache[log.log_path] = (st.st_mtime_ns, st.st_size, events)
+        return events
 
     def get_latest_run_log(self, job_id: str) -> Optional[EventLog]:
         """Get event log for latest run of a job.
@@ -86,7 +124,7 @@ class LogReader:
         }
 
         if log:
-            events = log.read()
+            events = self._read_events(log)
             status_info["total_events"] = len(events)
 
             # Find latest event
@@ -96,9 +134,9 @@ class LogReader:
                 status_info["latest_timestamp"] = latest.timestamp
 
                 # Find current step
-                step_events = log.filter_by_type(EventType.STEP_STARTED)
-                if step_events:
-                    status_info["current_step"] = step_events[-1].step_id
+                current_step = next((e for e in reversed(events) if e.type == EventType.STEP_STARTED), None)
+                if current_step:
+                    status_info["current_step"] = current_step.step_id
 
         return status_info
 
@@ -143,14 +181,22 @@ class LogReader:
         if not log:
             return {"error": f"Run not found: {run_id}"}
 
-        events = log.read()
+        events = self._read_events(log)
 
         if not events:
             return {"run_id": run_id, "events": 0}
 
-        job_started = log.get_latest(EventType.JOB_STARTED)
-        job_completed = log.get_latest(EventType.JOB_COMPLETED)
-        job_failed = log.get_latest(EventType.JOB_FAILED)
+        # One pass over the events instead of re-reading the log per event type
+        latest: dict[EventType, Event] = {}
+        counts = {EventType.STEP_STARTED: 0, EventType.STEP_COMPLETED: 0}
+        for event in events:
+            latest[event.type] = event
+            if event.type in counts:
+                counts[event.type] += 1
+
+        job_started = latest.get(EventType.JOB_STARTED)
+        job_completed = latest.get(EventType.JOB_COMPLETED)
+        job_failed = latest.get(EventType.JOB_FAILED)
 
         summary = {
             "run_id": run_id,
@@ -162,11 +208,8 @@ class LogReader:
         }
 
         # Count step events
-        step_starts = log.filter_by_type(EventType.STEP_STARTED)
-        step_completions = log.filter_by_type(EventType.STEP_COMPLETED)
-
-        summary["steps_started"] = len(step_starts)
-        summary["steps_completed"] = len(step_completions)
+        summary["steps_started"] = counts[EventType.STEP_STARTED]
+        summary["steps_completed"] = counts[EventType.STEP_COMPLETED]
 
         return summary
 
@@ -2,11 +2,12 @@
 
 import json
 from enum import Enum
+from functools import cached_property
 from typing import Optional, Any
 from pathlib import Path
 from datetime import datetime
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, field_validator
 
 from bit.workspace import Workspace
 
@@ -22,7 +23,7 @@ class WorkerStatus(str, Enum):
 class ContractField(BaseModel):
     """Input or output contract field specification."""
 
-    model_config = ConfigDict(json_schema_extra={
+    model_config = ConfigDict(frozen=True, extra="forbid", json_schema_extra={
         "example": {
             "name": "audio_file",
             "type": "file",
@@ -40,7 +41,7 @@ class ContractField(BaseModel):
 class Contract(BaseModel):
     """Input or output contract specification."""
 
-    model_config = ConfigDict(json_schema_extra={
+    model_config = ConfigDict(frozen=True, extra="forbid", json_schema_extra={
         "example": {
             "fields": [{"name": "input_file", "type": "file", "description": "Input file", "required": True}]
         }
@@ -52,7 +53,7 @@ class Contract(BaseModel):
 class IntentSpec(BaseModel):
     """Intent matching specification."""
 
-    model_config = ConfigDict(json_schema_extra={
+    model_config = ConfigDict(frozen=True, extra="forbid", json_schema_extra={
         "example": {
             "category": "audio",
             "verbs": ["extract", "separate"],
@@ -68,11 +69,23 @@ class IntentSpec(BaseModel):
     confidence_threshold: float = Field(default=0.7, description="Minimum confidence score (0.0-1.0)")
     match_rules: list[str] = Field(default=[], description="Pattern matching rules")
 
+    @field_validator("category")
+    @classmethod
+    def _lowercase_category(cls, value: str) -> str:
+        """Normalize category to lowercase so matching never lowercases per call."""
+        return value.lower()
+
+    @field_validator("verbs", "entities")
+    @classmethod
+    def _lowercase_terms(cls, value: list[str]) -> list[str]:
+        """Normalize verbs and entities to lowercase so matching never lowercases per call."""
+        return [term.lower() for term in value]
+
 
 class Worker(BaseModel):
     """Worker specification in pipeline."""
 
-    model_config = ConfigDict(json_schema_extra={
+    model_config = ConfigDict(frozen=True, extra="forbid", json_schema_extra={
         "example": {
             "worker_id": "audio_extractor",
             "version": "1.0.0",
@@ -88,7 +101,7 @@ class Worker(BaseModel):
 class PipelineStep(BaseModel):
     """Single step in execution pipeline."""
 
-    model_config = ConfigDict(json_schema_extra={
+    model_config = ConfigDict(frozen=True, extra="forbid", json_schema_extra={
         "example": {
             "step_id": "step_1",
             "worker": {"worker_id": "audio_processor", "version": "1.0.0"},
@@ -108,7 +121,7 @@ class PipelineStep(BaseModel):
 class Pipeline(BaseModel):
     """Ordered pipeline of execution steps."""
 
-    model_config = ConfigDict(json_schema_extra={
+    model_config = ConfigDict(frozen=True, extra="forbid", json_schema_extra={
         "example": {
             "steps": [
                 {
@@ -128,7 +141,7 @@ class Pipeline(BaseModel):
 class ApprovalPolicy(BaseModel):
     """Approval policy specification."""
 
-    model_config = ConfigDict(json_schema_extra={
+    model_config = ConfigDict(frozen=True, extra="forbid", json_schema_extra={
         "example": {
             "required": False,
             "conditions": ["destructive_operation"]
@@ -142,7 +155,7 @@ class ApprovalPolicy(BaseModel):
 class VerificationRule(BaseModel):
     """Rule for verifying package execution."""
 
-    model_config = ConfigDict(json_schema_extra={
+    model_config = ConfigDict(frozen=True, extra="forbid", json_schema_extra={
         "example": {
             "name": "output_exists",
             "description": "Verify output artifact exists",
@@ -158,7 +171,7 @@ class VerificationRule(BaseModel):
 class Verification(BaseModel):
     """Verification specification."""
 
-    model_config = ConfigDict(json_schema_extra={
+    model_config = ConfigDict(frozen=True, extra="forbid", json_schema_extra={
         "example": {
             "required": True,
             "rules": []
@@ -172,7 +185,7 @@ class Verification(BaseModel):
 class FailureMode(BaseModel):
     """Failure mode specification."""
 
-    model_config = ConfigDict(json_schema_extra={
+    model_config = ConfigDict(frozen=True, extra="forbid", json_schema_extra={
         "example": {
             "error": "timeout",
             "recovery": "retry",
@@ -188,7 +201,7 @@ class FailureMode(BaseModel):
 class FailureHandling(BaseModel):
     """Failure handling specification."""
 
-    model_config = ConfigDict(json_schema_extra={
+    model_config = ConfigDict(frozen=True, extra="forbid", json_schema_extra={
         "example": {
             "modes": [
                 {"error": "timeout", "recovery": "retry", "max_retries": 3}
@@ -202,7 +215,7 @@ class FailureHandling(BaseModel):
 class ResourceProfile(BaseModel):
     """Resource requirements specification."""
 
-    model_config = ConfigDict(json_schema_extra={
+    model_config = ConfigDict(frozen=True, extra="forbid", json_schema_extra={
         "example": {
             "cpu_cores": 2,
             "gpu_required": False,
@@ -220,7 +233,7 @@ class ResourceProfile(BaseModel):
 class TaskPackage(BaseModel):
     """Complete task package specification (14 sections)."""
 
-    model_config = ConfigDict(json_schema_extra={
+    model_config = ConfigDict(frozen=True, extra="forbid", json_schema_extra={
         "example": {
             "package_id": "audio.stem_extraction",
             "version": "1.0.0",
@@ -281,22 +294,56 @@ class TaskPackage(BaseModel):
         """Return dict for hashing (excludes metadata).
 
         Returns:
-            dict: Canonical representation with sorted keys for deterministic hashing
+            dict: Canonical representation, decoded from canonical_json
         """
-        return {
-            "package_id": self.package_id,
-            "version": self.version,
-            "title": self.title,
-            "description": self.description,
-            "intent": self.intent.model_dump(),
-            "input_contract": self.input_contract.model_dump(),
-            "output_contract": self.output_contract.model_dump(),
-            "pipeline": self.pipeline.model_dump(),
-            "approval": self.approval.model_dump(),
-            "verification": self.verification.model_dump(),
-            "failure_handling": self.failure_handling.model_dump(),
-            "resources": self.resources.model_dump(),
-        }
+        return json.loads(self.canonical_json)
+
+    @cached_property
+    def canonical_json(self) -> bytes:
+        """Canonical JSON encoding used for hashing.
+
+        Computed once per instance; safe to cache because the model is frozen.
+        Keys are sorted at every level, so free-form dicts such as step params hash
+        the same regardless of insertion order.
+
+        Returns:
+            bytes: Compact, key-sorted JSON of every field except metadata
+        """
+        return json.dumps(
+            self.model_dump(mode="json", exclude={"metadata"}), sort_keys=True, separators=(",", ":")
+        ).encode()
+
+    @cached_property
+    def match_tokens(self) -> frozenset[str]:
+        """Verbs, entities and category used for planner matching.
+
+        IntentSpec lowercases these at validation time.
+
+        Returns:
+            frozenset[str]: Match tokens
+        """
+        intent = self.intent
+        return frozenset((*intent.verbs, *intent.entities, intent.category))
+
+    @cached_property
+    def verb_tokens(self) -> frozenset[str]:
+        """Intent verbs used for the planner's verb bonus (already lowercase).
+
+        Returns:
+            frozenset[str]: Verb tokens
+        """
+        return frozenset(self.intent.verbs)
+
+    def model_copy(self, *, update: dict[str, Any] | None = None, deep: bool = False):
+        """Copy the model, dropping cached derived values.
+
+        ``model_copy(update=...)`` is the only way to change a frozen model, so the
+        copy must not inherit values computed from the old fields.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        for name in ("canonical_json", "match_tokens", "verb_tokens"):
+            copied.__dict__.pop(name, None)
+        return copied
 
     def compute_hash(self) -> str:
         """Compute deterministic hash of package.
@@ -304,6 +351,4 @@ class TaskPackage(BaseModel):
         Returns:
             str: SHA256 hash (hex)
         """
-        canonical = self.to_canonical_dict()
-        canonical_json = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
-        return Workspace.hash_content(canonical_json)
+        return Workspace.hash_content(self.canonical_json)
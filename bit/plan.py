@@ -1,16 +1,39 @@
 """Execution plan models and management."""
 
+import glob
 import json
+import os
+import re
 import uuid
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from datetime import datetime, timedelta, UTC
 from pathlib import Path
 from typing import Optional, Any
 
+import pydantic_core
 import yaml
 from pydantic import BaseModel, Field, ConfigDict
 
 from bit.workspace import Workspace
-from bit.packages import Pipeline, TaskPackage
+from bit.packages import Pipeline, PipelineStep, TaskPackage, Worker, WorkerStatus
+
+# libyaml's C loader is 10x+ faster than the pure-Python one; not every build has it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Thread count for fanning out plan file reads in list_plans
+_READ_WORKERS = 8
+
+# Saved plan files are named <20-digit epoch microseconds>-<plan_id>, so names sort by age
+_TIMESTAMPED_STEM_RE = re.compile(r"^(\d{20})-(.+)$")
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+# Per-run identity fields that do not affect what a plan executes
+_PLAN_HASH_EXCLUDE = {"plan_id", "created_at", "matched_confidence"}
+
+# (mtime_ns, size) of plan files written by PlanManager.save in this process, keyed by path.
+# Only files whose stamp still matches skip validation; anything else is validated in full.
+_SAVED_STAMPS: dict[str, tuple[int, int]] = {}
 
 
 class ResolvedInput(BaseModel):
@@ -62,9 +85,9 @@ class ResourceRequirements(BaseModel):
 class ExecutionPlan(BaseModel):
     """Complete execution plan derived from package."""
 
-    model_config = ConfigDict(json_schema_extra={
+    model_config = ConfigDict(frozen=True, json_schema_extra={
         "example": {
-            "plan_id": "plan-550e8400-e29b-41d4-a716-446655440000",
+            "plan_id": "plan-550e8400e29b41d4a716446655440000",
             "created_at": "2026-02-04T12:00:00Z",
             "job_id": "job-550e8400-e29b-41d4-a716-446655440000",
             "package_id": "audio.extract",
@@ -76,7 +99,7 @@ class ExecutionPlan(BaseModel):
         }
     })
 
-    plan_id: str = Field(description="UUID v4 plan ID")
+    plan_id: str = Field(description="UUID v4 plan ID (hex form)")
     created_at: str = Field(description="ISO 8601 timestamp")
     job_id: str = Field(description="Reference to job ID")
     package_id: str = Field(description="Matched package ID")
@@ -90,16 +113,34 @@ class ExecutionPlan(BaseModel):
         """Return dict for hashing (excludes metadata).
 
         Returns:
-            dict: Canonical representation for deterministic hashing
-        """
-        return {
-            "job_id": self.job_id,
-            "package_id": self.package_id,
-            "package_version": self.package_version,
-            "resolved_inputs": self.resolved_inputs.model_dump(),
-            "pipeline": self.pipeline.model_dump(),
-            "resources": self.resources.model_dump(),
-        }
+            dict: Canonical representation, decoded from canonical_json
+        """
+        return json.loads(self.canonical_json)
+
+    @cached_property
+    def canonical_json(self) -> bytes:
+        """Canonical JSON encoding used for hashing.
+
+        Computed once per instance; safe to cache because the model is frozen.
+        Keys are sorted at every level, so free-form dicts such as step params and
+        resolved input values hash the same regardless of insertion order.
+
+        Returns:
+            bytes: Compact, key-sorted JSON excluding plan_id, created_at and matched_confidence
+        """
+        return json.dumps(
+            self.model_dump(mode="json", exclude=_PLAN_HASH_EXCLUDE), sort_keys=True, separators=(",", ":")
+        ).encode()
+
+    def model_copy(self, *, update: dict[str, Any] | None = None, deep: bool = False):
+        """Copy the model, dropping the cached canonical JSON.
+
+        ``model_copy(update=...)`` is the only way to change a frozen model, so the
+        copy must not inherit a canonical encoding computed from the old values.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__dict__.pop("canonical_json", None)
+        return copied
 
     def compute_hash(self) -> str:
         """Compute deterministic hash of plan.
@@ -107,16 +148,51 @@ class ExecutionPlan(BaseModel):
         Returns:
             str: SHA256 hash (hex)
         """
-        canonical = self.to_canonical_dict()
-        canonical_json = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
-        return Workspace.hash_content(canonical_json)
+        return Workspace.hash_content(self.canonical_json)
+
+
+def _construct_plan(data: dict) -> ExecutionPlan:
+    """Build an ExecutionPlan from trusted data without running validation.
+
+    Only used for files PlanManager.save wrote in this process, where
+    re-validating every nested model on read is wasted work. Each nested model
+    is built with ``model_construct`` so attribute access behaves exactly as
+    after validation.
+
+    Args:
+        data: Plan dict as produced by ``model_dump(mode="json")``
+
+    Returns:
+        ExecutionPlan: Constructed plan
+
+    Raises:
+        KeyError: If a required nested section is missing
+        TypeError: If data is not shaped like a plan
+    """
+    steps = []
+    for step in data["pipeline"]["steps"]:
+        worker = dict(step["worker"])
+        if "status" in worker:
+            worker["status"] = WorkerStatus(worker["status"])
+        steps.append(PipelineStep.model_construct(**{**step, "worker": Worker.model_construct(**worker)}))
+
+    return ExecutionPlan.model_construct(**{
+        **data,
+        "resolved_inputs": ResolvedInputs.model_construct(
+            inputs=[ResolvedInput.model_construct(**i) for i in data["resolved_inputs"]["inputs"]]
+        ),
+        "pipeline": Pipeline.model_construct(steps=steps),
+        "resources": ResourceRequirements.model_construct(**data["resources"]),
+    })
 
 
 class PlanManager:
     """Manages execution plan storage and retrieval."""
 
     PLANS_SUBDIR = "plans"
-    PLAN_FILENAME = "plan.yaml"
+    PLAN_SUFFIX = ".json"
+    # Suffixes recognised when reading, in lookup order; .yaml plans predate JSON storage
+    PLAN_SUFFIXES = (".json", ".yaml")
 
     def __init__(self, workspace_path: str):
         """Initialize plan manager.
@@ -139,20 +215,131 @@ class PlanManager:
         plans_dir.mkdir(parents=True, exist_ok=True)
         return plans_dir
 
-    def _get_plan_path(self, job_id: str, plan_id: str) -> Path:
-        """Get path to plan.yaml file.
+    def _get_plan_path(
+        self,
+        job_id: str,
+        plan_id: str,
+        suffix: str = PLAN_SUFFIX,
+        created_at: Optional[str] = None,
+    ) -> Path:
+        """Get path to plan file.
+
+        Args:
+            job_id: Job ID
+            plan_id: Plan ID
+            suffix: File suffix (".yaml" or ".json")
+            created_at: Plan creation timestamp; when parseable, prefixes the file name
+
+        Returns:
+            Path: Path to plan file
+        """
+        prefix = self._timestamp_prefix(created_at) if created_at else None
+        name = f"{prefix}-{plan_id}{suffix}" if prefix else f"{plan_id}{suffix}"
+        return self.workspace_path / "jobs" / job_id / self.PLANS_SUBDIR / name
+
+    @staticmethod
+    def _timestamp_prefix(created_at: str) -> Optional[str]:
+        """Encode an ISO 8601 timestamp as a fixed-width, lexically sortable prefix.
+
+        Args:
+            created_at: ISO 8601 timestamp (e.g., 2026-02-04T12:00:00Z)
+
+        Returns:
+            str: Zero-padded epoch microseconds, or None if unparseable
+        """
+        try:
+            dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=UTC)
+        micros = (dt - _EPOCH) // timedelta(microseconds=1)
+        return f"{micros:020d}" if micros >= 0 else None
+
+    def _find_plan_file(self, job_id: str, plan_id: str) -> Optional[Path]:
+        """Locate a plan file by ID, with or without a timestamp prefix.
 
         Args:
             job_id: Job ID
             plan_id: Plan ID
 
         Returns:
-            Path: Path to plan.yaml
+            Path: Path to plan file, or None if not found
         """
-        return self.workspace_path / "jobs" / job_id / self.PLANS_SUBDIR / f"{plan_id}.yaml"
+        plans_dir = self.workspace_path / "jobs" / job_id / self.PLANS_SUBDIR
+        for suffix in self.PLAN_SUFFIXES:
+            plan_path = plans_dir / f"{plan_id}{suffix}"
+            if plan_path.exists():
+                return plan_path
+            for candidate in plans_dir.glob(f"*-{glob.escape(plan_id)}{suffix}"):
+                match = _TIMESTAMPED_STEM_RE.match(candidate.stem)
+                if match and match.group(2) == plan_id:
+                    return candidate
+        return None
+
+    @staticmethod
+    def _parse_plan(raw: bytes, suffix: str, trusted: bool = False) -> Optional[ExecutionPlan]:
+        """Parse plan file contents, choosing the parser by suffix.
+
+        Args:
+            raw: File contents
+            suffix: File suffix (".json" or ".yaml")
+            trusted: Skip validation (only for files this process just saved)
+
+        Returns:
+            ExecutionPlan: Parsed plan or None if corrupted
+        """
+        try:
+            if suffix == ".json":
+                if not trusted:
+                    return ExecutionPlan.model_validate_json(raw)
+                # pydantic-core's Rust parser; roughly 2x json.loads on plan-sized documents
+                data = pydantic_core.from_json(raw)
+            else:
+                data = yaml.load(raw, Loader=_YAML_LOADER)
+            if not trusted:
+                return ExecutionPlan.model_validate(data)
+            return _construct_plan(data)
+        except (yaml.YAMLError, ValueError, TypeError, KeyError):
+            return None
+
+    @staticmethod
+    def _read_stamped(plan_path: Path) -> Optional[tuple[bytes, bool]]:
+        """Read a plan file and check whether this process saved it unchanged.
+
+        Args:
+            plan_path: Path to a .json or .yaml plan file
+
+        Returns:
+            tuple[bytes, bool]: (contents, saved by us), or None if unreadable
+        """
+        try:
+            with open(plan_path, "rb") as f:
+                st = os.fstat(f.fileno())
+                raw = f.read()
+        except OSError:
+            return None
+        return raw, _SAVED_STAMPS.get(os.fspath(plan_path)) == (st.st_mtime_ns, st.st_size)
+
+    @classmethod
+    def _read_plan_file(cls, plan_path: Path, validate: bool = False) -> Optional[ExecutionPlan]:
+        """Read and parse a single plan file.
+
+        Args:
+            plan_path: Path to a .json or .yaml plan file
+            validate: Validate even if this process saved the file
+
+        Returns:
+            ExecutionPlan: Parsed plan or None if unreadable/corrupted
+        """
+        read = cls._read_stamped(plan_path)
+        if read is None:
+            return None
+        raw, saved = read
+        return cls._parse_plan(raw, plan_path.suffix, trusted=saved and not validate)
 
     def save(self, plan: ExecutionPlan) -> Path:
-        """Save plan to yaml file.
+        """Save plan to JSON file.
 
         Args:
             plan: ExecutionPlan to save
@@ -161,35 +348,31 @@ class PlanManager:
             Path: Path to saved file
         """
         self._ensure_job_plans_dir(plan.job_id)
-        plan_path = self._get_plan_path(plan.job_id, plan.plan_id)
+        plan_path = self._get_plan_path(plan.job_id, plan.plan_id, created_at=plan.created_at)
 
-        with open(plan_path, "w") as f:
-            plan_dict = plan.model_dump(mode="json")
-            yaml.dump(plan_dict, f, default_flow_style=False, sort_keys=False, indent=2)
+        # Serialized straight from pydantic-core; no intermediate dict or YAML emitter
+        plan_path.write_bytes(plan.model_dump_json(indent=2).encode())
+        st = plan_path.stat()
+        _SAVED_STAMPS[os.fspath(plan_path)] = (st.st_mtime_ns, st.st_size)
 
         return plan_path
 
-    def load(self, job_id: str, plan_id: str) -> Optional[ExecutionPlan]:
+    def load(self, job_id: str, plan_id: str, validate: bool = False) -> Optional[ExecutionPlan]:
         """Load plan by ID.
 
         Args:
             job_id: Job ID
             plan_id: Plan ID
+            validate: Validate even if this process saved the file (other files always are)
 
         Returns:
             ExecutionPlan: Loaded plan or None if not found/corrupted
         """
-        plan_path = self._get_plan_path(job_id, plan_id)
-
-        if not plan_path.exists():
+        plan_path = self._find_plan_file(job_id, plan_id)
+        if plan_path is None:
             return None
 
-        try:
-            with open(plan_path, "r") as f:
-                data = yaml.safe_load(f)
-            return ExecutionPlan(**data)
-        except (yaml.YAMLError, ValueError):
-            return None
+        return self._read_plan_file(plan_path, validate=validate)
 
     def list_plans(self, job_id: str) -> list[ExecutionPlan]:
         """List all plans for a job.
@@ -205,16 +388,24 @@ class PlanManager:
         if not plans_dir.exists():
             return []
 
+        plan_files = [p for p in plans_dir.iterdir() if p.suffix in self.PLAN_SUFFIXES]
+
+        # Reads release the GIL, so fan them out; parsing stays on this thread
+        if len(plan_files) > 1:
+            with ThreadPoolExecutor(max_workers=min(_READ_WORKERS, len(plan_files))) as executor:
+                reads = list(executor.map(self._read_stamped, plan_files))
+        else:
+            reads = [self._read_stamped(p) for p in plan_files]
+
         plans = []
-        for plan_file in plans_dir.glob("*.yaml"):
-            try:
-                with open(plan_file, "r") as f:
-                    data = yaml.safe_load(f)
-                plan = ExecutionPlan(**data)
+        for plan_file, read in zip(plan_files, reads):
+            if read is None:
+                continue
+            raw, saved = read
+            plan = self._parse_plan(raw, plan_file.suffix, trusted=saved)
+            # Skip corrupted files
+            if plan is not None:
                 plans.append(plan)
-            except (yaml.YAMLError, ValueError):
-                # Skip corrupted files
-                pass
 
         # Sort by created_at descending (newest first)
         plans.sort(key=lambda p: p.created_at, reverse=True)
@@ -229,5 +420,25 @@ class PlanManager:
         Returns:
             ExecutionPlan: Latest plan or None if no plans exist
         """
-        plans = self.list_plans(job_id)
-        return plans[0] if plans else None
+        plans_dir = self.workspace_path / "jobs" / job_id / self.PLANS_SUBDIR
+
+        if not plans_dir.exists():
+            return None
+
+        stamped = []
+        for plan_file in plans_dir.iterdir():
+            if plan_file.suffix not in self.PLAN_SUFFIXES:
+                continue
+            if not _TIMESTAMPED_STEM_RE.match(plan_file.stem):
+                # Files without a timestamp prefix can only be ordered by parsing them all
+                plans = self.list_plans(job_id)
+                return plans[0] if plans else None
+            stamped.append(plan_file)
+
+        # Newest name first; only parse until one reads cleanly
+        for plan_file in sorted(stamped, key=lambda p: p.name, reverse=True):
+            plan = self._read_plan_file(plan_file)
+            if plan is not None:
+                return plan
+
+        return None
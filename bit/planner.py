@@ -1,15 +1,25 @@
 """Planner for matching job specs to task packages and generating execution plans."""
 
+import heapq
 import re
 import uuid
-from datetime import datetime, UTC
-from typing import Optional, Tuple
+from typing import Any, Optional, Tuple
 
+from bit.events import utc_now_iso
 from bit.job import JobSpec, Job
 from bit.packages import TaskPackage
 from bit.registry import PackageRegistry
 from bit.plan import ExecutionPlan, ResolvedInputs, ResolvedInput, ResourceRequirements
 
+_KEYWORD_RE = re.compile(r"\b\w+\b")
+_STOP_WORDS: frozenset[str] = frozenset(
+    {"the", "a", "an", "and", "or", "in", "on", "at", "to", "from", "is", "are", "be"}
+)
+
+# Above this many job inputs, build a name->value dict instead of scanning per field
+_INPUT_DICT_THRESHOLD = 4
+_MISSING = object()
+
 
 class Planner:
     """Matches job specs to task packages and generates execution plans."""
@@ -21,6 +31,35 @@ class Planner:
             registry: PackageRegistry instance for package lookup
         """
         self.registry = registry
+        self._candidate_cache: dict[Optional[str], list[TaskPackage]] = {}
+        self._candidate_cache_version = registry.version
+
+    def invalidate_cache(self) -> None:
+        """Drop cached candidate lists.
+
+        Mutations through the planner's own registry are detected automatically;
+        call this after packages change on disk by other means.
+        """
+        self._candidate_cache.clear()
+        self._candidate_cache_version = self.registry.version
+
+    def _candidates(self, category: Optional[str]) -> list[TaskPackage]:
+        """Get candidate packages for a category, cached per registry version.
+
+        Args:
+            category: Optional category filter
+
+        Returns:
+            list[TaskPackage]: Candidate packages (shared; do not mutate)
+        """
+        if self._candidate_cache_version != self.registry.version:
+            self.invalidate_cache()
+
+        candidates = self._candidate_cache.get(category)
+        if candidates is None:
+            candidates = self.registry.list_packages(category=category)
+            self._candidate_cache[category] = candidates
+        return candidates
 
     def match_package(
         self,
@@ -36,11 +75,11 @@ class Planner:
         Returns:
             Tuple[TaskPackage, float]: Matched package and confidence score, or None if no match
         """
-        # Extract keywords from intent
-        keywords = self._extract_keywords(job_spec.intent)
+        # Extract keywords from intent; deduplicated once so scoring is pure set math
+        kw_set = frozenset(self._extract_keywords(job_spec.intent))
 
         # Search for candidate packages
-        candidates = self.registry.list_packages(category=category_hint)
+        candidates = self._candidates(category_hint)
 
         if not candidates:
             return None
@@ -48,9 +87,10 @@ class Planner:
         # Score each candidate
         best_package = None
         best_score = 0.0
+        compute_score = self._compute_match_score
 
         for package in candidates:
-            score = self._compute_match_score(keywords, package)
+            score = compute_score(kw_set, package)
 
             # Check confidence threshold
             if score >= package.intent.confidence_threshold:
@@ -58,6 +98,10 @@ class Planner:
                     best_score = score
                     best_package = package
 
+                    # Scores are clamped to 1.0, so nothing later can beat this
+                    if best_score >= 1.0:
+                        break
+
         return (best_package, best_score) if best_package else None
 
     def match_packages_with_ambiguity(
@@ -73,19 +117,20 @@ class Planner:
             - If ambiguous: ([(pkg1, score1), (pkg2, score2), ...], True)
             - If no match: None
         """
-        # Extract keywords from intent
-        keywords = self._extract_keywords(job_spec.intent)
+        # Extract keywords from intent; deduplicated once so scoring is pure set math
+        kw_set = frozenset(self._extract_keywords(job_spec.intent))
 
         # Search for candidate packages
-        candidates = self.registry.list_packages(category=category_hint)
+        candidates = self._candidates(category_hint)
 
         if not candidates:
             return None
 
         # Score all candidates
         scored = []
+        compute_score = self._compute_match_score
         for package in candidates:
-            score = self._compute_match_score(keywords, package)
+            score = compute_score(kw_set, package)
 
             # Check confidence threshold
             if score >= package.intent.confidence_threshold:
@@ -94,13 +139,16 @@ class Planner:
         if not scored:
             return None
 
-        # Sort by score descending
-        scored.sort(key=lambda x: x[1], reverse=True)
+        # Only the top two decide ambiguity (multiple matches with similar scores)
+        top = heapq.nlargest(2, scored, key=lambda x: x[1])
+        is_ambiguous = len(top) > 1 and (top[0][1] - top[1][1]) < 0.1
 
-        # Check for ambiguity (multiple matches with similar scores)
-        is_ambiguous = len(scored) > 1 and (scored[0][1] - scored[1][1]) < 0.1
+        if not is_ambiguous:
+            return ([top[0]], False)
 
-        return (scored, is_ambiguous)
+        # Sort by score descending
+        scored.sort(key=lambda x: x[1], reverse=True)
+        return (scored, True)
 
     def generate_plan(
         self,
@@ -119,7 +167,7 @@ class Planner:
             ExecutionPlan: Execution plan ready for approval/execution
         """
         # Generate plan ID
-        plan_id = f"plan-{uuid.uuid4()}"
+        plan_id = f"plan-{uuid.uuid4().hex}"
 
         # Resolve inputs
         resolved_inputs = self._resolve_inputs(job.job_spec, package)
@@ -130,7 +178,7 @@ class Planner:
         # Create execution plan
         plan = ExecutionPlan(
             plan_id=plan_id,
-            created_at=datetime.now(UTC).isoformat().replace('+00:00', 'Z'),
+            created_at=utc_now_iso(),
             job_id=job.job_id,
             package_id=package.package_id,
             package_version=package.version,
@@ -142,6 +190,24 @@ class Planner:
 
         return plan
 
+    def regenerate_plan(self, plan: ExecutionPlan) -> ExecutionPlan:
+        """Issue a new plan with the same content as an earlier one.
+
+        Only valid while the job spec and package the plan was generated from are
+        unchanged (e.g. re-submitting after a denial); otherwise call generate_plan.
+        Skips input resolution and re-validation of the pipeline and resources.
+
+        Args:
+            plan: Previously generated plan
+
+        Returns:
+            ExecutionPlan: Copy with a fresh plan_id and created_at (same compute_hash)
+        """
+        return plan.model_copy(update={
+            "plan_id": f"plan-{uuid.uuid4().hex}",
+            "created_at": utc_now_iso(),
+        })
+
     @staticmethod
     def _extract_keywords(intent_text: str) -> list[str]:
         """Extract keywords from intent text.
@@ -152,48 +218,28 @@ class Planner:
         Returns:
             list[str]: List of keywords (normalized)
         """
-        # Simple keyword extraction: lowercase, remove punctuation, split on whitespace
-        text = intent_text.lower()
-        # Remove common words
-        stop_words = {"the", "a", "an", "and", "or", "in", "on", "at", "to", "from", "is", "are", "be"}
-
-        words = re.findall(r"\b\w+\b", text)
-        keywords = [w for w in words if w not in stop_words and len(w) > 2]
-
-        return keywords
+        # Simple keyword extraction: lowercase, split on word boundaries, drop short/stop words
+        return [w for w in _KEYWORD_RE.findall(intent_text.lower()) if len(w) > 2 and w not in _STOP_WORDS]
 
     @staticmethod
-    def _compute_match_score(keywords: list[str], package: TaskPackage) -> float:
+    def _compute_match_score(kw_set: frozenset[str], package: TaskPackage) -> float:
         """Compute match score between keywords and package.
 
         Args:
-            keywords: Extracted keywords
+            kw_set: Extracted keywords, deduplicated
             package: Package to score
 
         Returns:
             float: Match score (0.0-1.0)
         """
-        if not keywords:
+        if not kw_set:
             return 0.0
 
-        # Prepare package data for matching
-        package_words = set()
-        package_words.update(package.intent.verbs)
-        package_words.update(package.intent.entities)
-        package_words.add(package.intent.category)
-
-        # Convert to lowercase for comparison
-        package_words = {w.lower() for w in package_words}
-
-        # Count keyword matches
-        matches = sum(1 for kw in keywords if kw in package_words)
-
-        # Compute score (matches / total keywords)
-        base_score = matches / len(keywords) if keywords else 0.0
+        # Compute score (matched keywords / total keywords); package tokens are cached
+        base_score = len(kw_set & package.match_tokens) / len(kw_set)
 
         # Bonus for verb matches
-        verb_matches = sum(1 for v in package.intent.verbs if v.lower() in keywords)
-        verb_bonus = verb_matches * 0.2  # Each verb match adds 0.2
+        verb_bonus = len(kw_set & package.verb_tokens) * 0.2  # Each verb match adds 0.2
 
         # Combine scores (base can go 0-1, bonus can push up to 0.4+)
         score = min(1.0, base_score + verb_bonus)
@@ -213,16 +259,25 @@ class Planner:
         """
         resolved = []
 
-        # Map job inputs to package inputs
-        job_inputs = {inp.name: inp.value for inp in job_spec.inputs}
+        # Map job inputs to package inputs; small lists are cheaper to scan than to hash
+        job_inputs = (
+            {inp.name: inp.value for inp in job_spec.inputs}
+            if len(job_spec.inputs) > _INPUT_DICT_THRESHOLD
+            else None
+        )
 
         for field in package.input_contract.fields:
             # Look for matching input in job spec
-            if field.name in job_inputs:
+            if job_inputs is not None:
+                value = job_inputs.get(field.name, _MISSING)
+            else:
+                value = Planner._lookup_input(job_spec, field.name)
+
+            if value is not _MISSING:
                 resolved.append(ResolvedInput(
                     name=field.name,
                     type=field.type,
-                    value=job_inputs[field.name],
+                    value=value,
                 ))
             elif not field.required:
                 # Optional input not provided - skip
@@ -237,6 +292,19 @@ class Planner:
 
         return ResolvedInputs(inputs=resolved)
 
+    @staticmethod
+    def _lookup_input(job_spec: JobSpec, name: str) -> Any:
+        """Find a job input value by name with a linear scan.
+
+        Args:
+            job_spec: Job specification
+            name: Input name
+
+        Returns:
+            Any: Input value (last one wins on duplicate names), or _MISSING
+        """
+        return next((inp.value for inp in reversed(job_spec.inputs) if inp.name == name), _MISSING)
+
     @staticmethod
     def _compute_resources(package: TaskPackage) -> ResourceRequirements:
         """Compute aggregated resource requirements from package.
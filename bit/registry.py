@@ -1,16 +1,69 @@
 """Task package registry and management."""
 
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 import yaml
 
-from bit.packages import TaskPackage
+from bit.packages import IntentSpec, TaskPackage
+from bit.workspace import Workspace
+
+# libyaml's C loader/dumper are several times faster; not every PyYAML build has them
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Top-level keys that precede the bulky sections (contracts, pipeline, ...) in package.yaml
+# (bytes: package files are read in binary and handed to libyaml undecoded)
+_HEADER_KEYS = frozenset({b"package_id", b"version", b"title", b"description", b"intent"})
+_TOP_LEVEL_KEY_RE = re.compile(rb"^([A-Za-z_]\w*)\s*:")
+# Fast path for the common case: ASCII MAJOR.MINOR.PATCH, optionally followed by further
+# dot parts (which, as in the split-based rule, may contain anything)
+_SEMVER_RE = re.compile(r"\A[0-9]+\.[0-9]+\.[0-9]+(?:\..*)?\Z", re.DOTALL)
+
+# Thread count for loading uncached package files in list_packages
+_LOAD_WORKERS = 8
+# Below this many uncached files, loading serially beats handing work to the pool
+_PARALLEL_LOAD_MIN = 4
+
+
+@lru_cache(maxsize=1)
+def _load_pool() -> ThreadPoolExecutor:
+    """Create the package-loading thread pool on first use and reuse it afterwards.
+
+    Returns:
+        ThreadPoolExecutor: Shared pool for list_packages
+    """
+    return ThreadPoolExecutor(max_workers=_LOAD_WORKERS, thread_name_prefix="package-load")
+
+
+def _subdirs(path: str) -> list[os.DirEntry]:
+    """List immediate subdirectories, using scandir's cached d_type where possible.
+
+    Args:
+        path: Directory to scan
+
+    Returns:
+        list[os.DirEntry]: Subdirectory entries (empty if path is missing/unreadable)
+    """
+    try:
+        with os.scandir(path) as entries:
+            return [entry for entry in entries if entry.is_dir()]
+    except OSError:
+        return []
 
 
 class PackageRegistry:
     """Filesystem-based task package registry."""
 
     REGISTRY_SUBDIR = "packages"
+    INDEX_FILENAME = "_index.json"
+    # Machine-written JSON copy of package.yaml (a workspace Sidecar document, stamped with
+    # the package.yaml it was written from); pydantic-core parses it without PyYAML.
+    SIDECAR_FILENAME = "package.json"
 
     def __init__(self, workspace_path: str):
         """Initialize package registry.
@@ -20,11 +73,34 @@ class PackageRegistry:
         """
         self.workspace_path = Path(workspace_path)
         self.registry_dir = self.workspace_path / self.REGISTRY_SUBDIR
+        # Bumped on every mutation through this instance so callers can key caches on it
+        self.version = 0
+        # Parsed packages keyed by file path, valid while (mtime_ns, size) is unchanged
+        self._cache: dict[str, tuple[int, int, TaskPackage]] = {}
+        # Filter fields per package file (relative path -> row), mirrored to INDEX_FILENAME
+        self._index: Optional[dict[str, dict]] = None
+        # Directories this instance has created or confirmed, so repeat adds skip mkdir
+        self._known_dirs: set[Path] = set()
         self._ensure_registry_dir()
 
     def _ensure_registry_dir(self) -> None:
         """Ensure registry directory exists."""
         self.registry_dir.mkdir(parents=True, exist_ok=True)
+        self._known_dirs.add(self.registry_dir)
+
+    def _ensure_dir(self, path: Path) -> None:
+        """Create a directory under the registry unless it is already known to exist.
+
+        Args:
+            path: Directory to create (with parents)
+        """
+        if path in self._known_dirs:
+            return
+        path.mkdir(parents=True, exist_ok=True)
+        # Everything between path and registry_dir now exists too
+        while path not in self._known_dirs and path != path.parent:
+            self._known_dirs.add(path)
+            path = path.parent
 
     def _get_package_path(self, package_id: str, version: str) -> Path:
         """Get path to package.yaml file.
@@ -50,6 +126,204 @@ class PackageRegistry:
         category, package_name = parts
         return self.registry_dir / category / package_name / f"v{version}" / "package.yaml"
 
+    def _iter_package_files(self) -> Iterator[str]:
+        """Yield package file paths in the registry.
+
+        Walks packages/<category>/<package_name>/v<version>/ with os.scandir,
+        which avoids the Path objects and extra stats of a recursive glob.
+
+        Yields:
+            str: Path to a package.yaml (may not exist if the version dir is empty)
+        """
+        for category_entry in _subdirs(os.fspath(self.registry_dir)):
+            for name_entry in _subdirs(category_entry.path):
+                for version_entry in _subdirs(name_entry.path):
+                    if version_entry.name.startswith("v"):
+                        yield os.path.join(version_entry.path, "package.yaml")
+
+    def _load_package_file(self, package_path: str | Path) -> Optional[TaskPackage]:
+        """Load a package file, reusing the parsed package if the file is unchanged.
+
+        Args:
+            package_path: Path to package.yaml
+
+        Returns:
+            TaskPackage: Loaded package or None if missing/corrupted
+        """
+        package_path = os.fspath(package_path)
+        try:
+            st = os.stat(package_path)
+        except OSError:
+            self._cache.pop(package_path, None)
+            return None
+
+        cached = self._cache.get(package_path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        package = self._load_sidecar(package_path, st)
+        if package is None:
+            try:
+                # Raw bytes go straight to libyaml, which does its own UTF-8 decoding
+                with open(package_path, "rb") as f:
+                    data = yaml.load(f.read(), Loader=_YAML_LOADER)
+                package = TaskPackage.model_validate(data)
+            except (OSError, yaml.YAMLError, ValueError, TypeError):
+                return None
+
+        # Packages are frozen, so sharing one instance between callers is safe
+        self._cache[package_path] = (st.st_mtime_ns, st.st_size, package)
+        return package
+
+    def _load_sidecar(self, package_path: str, yaml_st: os.stat_result) -> Optional[TaskPackage]:
+        """Load the JSON sidecar next to a package.yaml if it matches that file.
+
+        package.yaml stays the source of truth: once it is edited by hand its
+        stat no longer matches the sidecar's stamp, so the sidecar is ignored
+        until the package is re-added.
+
+        Args:
+            package_path: Path to package.yaml
+            yaml_st: Stat of package.yaml
+
+        Returns:
+            TaskPackage: Package from the sidecar, or None to fall back to YAML
+        """
+        sidecar_path = os.path.join(os.path.dirname(package_path), self.SIDECAR_FILENAME)
+        return Workspace.read_sidecar(sidecar_path, yaml_st, TaskPackage)
+
+    @staticmethod
+    def _peek_header(package_path: str) -> Optional[dict]:
+        """Parse only the header (identity + intent) of a package file.
+
+        Reads lines until the first top-level key outside the header, so the
+        contracts and pipeline are never parsed.
+
+        Args:
+            package_path: Path to package.yaml
+
+        Returns:
+            dict: {"package_id", "version", "intent": IntentSpec}, or None if the
+            header cannot be read (callers fall back to a full load)
+        """
+        lines = []
+        try:
+            with open(package_path, "rb") as f:
+                for line in f:
+                    match = _TOP_LEVEL_KEY_RE.match(line)
+                    if match and match.group(1) not in _HEADER_KEYS:
+                        break
+                    lines.append(line)
+            header = yaml.load(b"".join(lines), Loader=_YAML_LOADER)
+            return {
+                "package_id": str(header["package_id"]),
+                "version": str(header["version"]),
+                "intent": IntentSpec.model_validate(header["intent"]),
+            }
+        except (OSError, yaml.YAMLError, ValueError, TypeError, KeyError):
+            return None
+
+    @staticmethod
+    def _index_row(source: TaskPackage | dict, st: os.stat_result) -> dict:
+        """Build the index row for a package file.
+
+        Args:
+            source: Parsed package, or a header from _peek_header
+            st: Stat of the package file, used to detect stale rows
+
+        Returns:
+            dict: Index row with the fields list/search filter on
+        """
+        if isinstance(source, TaskPackage):
+            package_id, version, intent = source.package_id, source.version, source.intent
+        else:
+            package_id, version, intent = source["package_id"], source["version"], source["intent"]
+        return {
+            "package_id": package_id,
+            "version": version,
+            "category": intent.category,
+            "verbs": intent.verbs,
+            "entities": intent.entities,
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+        }
+
+    def _load_index(self) -> dict[str, dict]:
+        """Load the on-disk index, or start an empty one if missing/corrupted.
+
+        Returns:
+            dict[str, dict]: Index rows keyed by path relative to registry_dir
+        """
+        if self._index is None:
+            try:
+                data = json.loads((self.registry_dir / self.INDEX_FILENAME).read_bytes())
+                self._index = data["packages"] if isinstance(data, dict) else {}
+            except (OSError, ValueError, KeyError):
+                self._index = {}
+        return self._index
+
+    def _save_index(self) -> None:
+        """Write the index atomically so concurrent readers never see a partial file."""
+        index_path = self.registry_dir / self.INDEX_FILENAME
+        tmp_path = index_path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps({"packages": self._load_index()}, separators=(",", ":")))
+        os.replace(tmp_path, index_path)
+
+    def _scan_index(self) -> list[tuple[str, dict]]:
+        """Pair package files with their index rows, refreshing stale rows.
+
+        Files whose (mtime_ns, size) match their row are not parsed at all.
+        New or changed files are parsed once and their rows rewritten; rows
+        for deleted or corrupted files are dropped.
+
+        The whole registry is always walked: a package's intent category need
+        not match its directory, so callers filter rows by category instead.
+
+        Returns:
+            list[tuple[str, dict]]: (package file path, index row) pairs
+        """
+        index = self._load_index()
+        root = os.fspath(self.registry_dir)
+        rows = []
+        seen = set()
+        changed = False
+
+        def visit(package_file: str, key: str) -> None:
+            nonlocal changed
+            try:
+                st = os.stat(package_file)
+            except OSError:
+                # Missing file: forget any old row
+                changed |= index.pop(key, None) is not None
+                return
+
+            row = index.get(key)
+            if row is None or row["mtime_ns"] != st.st_mtime_ns or row["size"] != st.st_size:
+                # Peek the header first; a broken body is caught when the package is loaded in full
+                source = self._peek_header(package_file) or self._load_package_file(package_file)
+                if source is None:
+                    # Corrupted file: skip it and forget any old row
+                    changed |= index.pop(key, None) is not None
+                    return
+                row = self._index_row(source, st)
+                index[key] = row
+                changed = True
+
+            seen.add(key)
+            rows.append((package_file, row))
+
+        for package_file in self._iter_package_files():
+            visit(package_file, package_file[len(root) + 1:])
+
+        # Forget rows for files that vanished from the registry
+        for key in [k for k in index if k not in seen]:
+            del index[key]
+            changed = True
+
+        if changed:
+            self._save_index()
+        return rows
+
     def add_package(self, package: TaskPackage) -> Path:
         """Add package to registry.
 
@@ -68,13 +342,30 @@ class PackageRegistry:
             raise FileExistsError(f"Package already exists: {package.package_id} v{package.version}")
 
         # Create directory structure
-        package_path.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(package_path.parent)
 
         # Save package
-        with open(package_path, "w") as f:
-            package_dict = package.model_dump(mode="json")
-            yaml.dump(package_dict, f, default_flow_style=False, sort_keys=False, indent=2)
-
+        package_dict = package.model_dump(mode="json")
+        try:
+            f = open(package_path, "w")
+        except FileNotFoundError:
+            # A known directory was removed behind our back; forget them all and recreate
+            self._known_dirs.clear()
+            self._ensure_dir(package_path.parent)
+            f = open(package_path, "w")
+        with f:
+            yaml.dump(package_dict, f, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False, indent=2)
+
+        yaml_st = package_path.stat()
+        Workspace.write_sidecar(
+            package_path.parent / self.SIDECAR_FILENAME, yaml_st, package.__pydantic_serializer__.to_json(package)
+        )
+
+        self._cache.pop(os.fspath(package_path), None)
+        key = os.path.relpath(package_path, self.registry_dir)
+        self._load_index()[key] = self._index_row(package, yaml_st)
+        self._save_index()
+        self.version += 1
         return package_path
 
     def get_package(self, package_id: str, version: str) -> Optional[TaskPackage]:
@@ -87,17 +378,7 @@ class PackageRegistry:
         Returns:
             TaskPackage: Loaded package or None if not found
         """
-        package_path = self._get_package_path(package_id, version)
-
-        if not package_path.exists():
-            return None
-
-        try:
-            with open(package_path, "r") as f:
-                data = yaml.safe_load(f)
-            return TaskPackage(**data)
-        except (yaml.YAMLError, ValueError):
-            return None
+        return self._load_package_file(self._get_package_path(package_id, version))
 
     def list_packages(self, category: Optional[str] = None) -> list[TaskPackage]:
         """List all packages, optionally filtered by category.
@@ -108,34 +389,65 @@ class PackageRegistry:
         Returns:
             list[TaskPackage]: All matching packages
         """
-        packages = []
+        package_files = self._matching_package_files(category)
 
-        if not self.registry_dir.exists():
-            return []
+        # File reads release the GIL, so fan out loads when enough files are not cached yet
+        uncached = sum(1 for path in package_files if path not in self._cache)
+        if uncached >= _PARALLEL_LOAD_MIN:
+            packages = list(_load_pool().map(self._load_package_file, package_files))
+        else:
+            packages = [self._load_package_file(path) for path in package_files]
 
-        # Find all package.yaml files
-        for package_file in self.registry_dir.glob("*/*/v*/package.yaml"):
-            try:
-                with open(package_file, "r") as f:
-                    data = yaml.safe_load(f)
-                package = TaskPackage(**data)
+        # Skip corrupted files
+        return [package for package in packages if package is not None]
+
+    def iter_packages(self, category: Optional[str] = None) -> Iterator[TaskPackage]:
+        """Yield packages one at a time, optionally filtered by category.
+
+        Packages are loaded lazily, so callers that stop early never parse the rest.
 
-                # Filter by category if specified
-                if category and package.intent.category != category:
-                    continue
+        Args:
+            category: Optional category filter (e.g., "audio")
+
+        Yields:
+            TaskPackage: Matching packages
+        """
+        for package_file in self._matching_package_files(category):
+            package = self._load_package_file(package_file)
+
+            # Skip corrupted files
+            if package is not None:
+                yield package
 
-                packages.append(package)
-            except (yaml.YAMLError, ValueError):
-                # Skip corrupted files
-                pass
+    def _matching_package_files(self, category: Optional[str] = None) -> list[str]:
+        """Package files whose index row matches a category, in scan order.
 
-        return packages
+        Args:
+            category: Optional category filter (any case)
+
+        Returns:
+            list[str]: Paths to package.yaml files
+        """
+        if not self.registry_dir.exists():
+            return []
+
+        # Package categories are stored lowercase
+        if category:
+            category = category.lower()
+
+        # Filter on index rows; only matching packages are loaded in full
+        return [
+            package_file
+            for package_file, row in self._scan_index()
+            if not category or row["category"] == category
+        ]
 
     def search_packages(
         self,
         category: Optional[str] = None,
         verbs: Optional[list[str]] = None,
         entities: Optional[list[str]] = None,
+        limit: Optional[int] = None,
     ) -> list[TaskPackage]:
         """Search packages by multiple criteria.
 
@@ -143,31 +455,40 @@ class PackageRegistry:
             category: Filter by intent category
             verbs: Filter by intent verbs (any match)
             entities: Filter by intent entities (any match)
+            limit: Stop after this many matches (no packages past it are loaded)
 
         Returns:
             list[TaskPackage]: Matching packages
         """
-        candidates = self.list_packages(category)
         results = []
+        if limit is not None and limit <= 0:
+            return results
+
+        # Package intent terms are stored lowercase; build the query sets once per search
+        if category:
+            category = category.lower()
+        verbs_set = frozenset(verb.lower() for verb in verbs) if verbs else None
+        entities_set = frozenset(entity.lower() for entity in entities) if entities else None
 
-        for package in candidates:
+        # Filter on index rows; only matching packages are loaded in full
+        for package_file, row in self._scan_index():
             # Check category
-            if category and package.intent.category != category:
+            if category and row["category"] != category:
                 continue
 
-            # Check verbs
-            if verbs:
-                has_verb = any(verb in package.intent.verbs for verb in verbs)
-                if not has_verb:
-                    continue
+            # Check verbs (any match)
+            if verbs_set is not None and verbs_set.isdisjoint(row["verbs"]):
+                continue
 
-            # Check entities
-            if entities:
-                has_entity = any(entity in package.intent.entities for entity in entities)
-                if not has_entity:
-                    continue
+            # Check entities (any match)
+            if entities_set is not None and entities_set.isdisjoint(row["entities"]):
+                continue
 
-            results.append(package)
+            package = self._load_package_file(package_file)
+            if package is not None:
+                results.append(package)
+                if limit is not None and len(results) >= limit:
+                    break
 
         return results
 
@@ -208,17 +529,20 @@ class PackageRegistry:
         # Check step inputs reference contract or other step outputs
         available_names = input_names.copy()
         for step in package.pipeline.steps:
-            for input_name in step.inputs:
-                if input_name not in available_names:
-                    errors.append(f"Step {step.step_id} references undefined input: {input_name}")
+            # Set check first; only walk the inputs (in order) when something is missing
+            if not available_names.issuperset(step.inputs):
+                errors.extend(
+                    f"Step {step.step_id} references undefined input: {input_name}"
+                    for input_name in step.inputs
+                    if input_name not in available_names
+                )
 
             # Add outputs to available names for next steps
             available_names.update(step.outputs)
 
         # Check final outputs are produced
-        for output_name in output_names:
-            if output_name not in available_names:
-                errors.append(f"Output {output_name} not produced by any pipeline step")
+        for output_name in output_names - available_names:
+            errors.append(f"Output {output_name} not produced by any pipeline step")
 
         return errors
 
@@ -232,6 +556,12 @@ class PackageRegistry:
         Returns:
             bool: True if valid semver format
         """
+        if _SEMVER_RE.match(version):
+            return True
+
+        # Everything else gets the original rule: the first three dot-separated parts must
+        # parse with int(), which also allows signs, surrounding whitespace, underscores and
+        # non-ASCII digits. The regex only short-circuits inputs this rule accepts.
         parts = version.split(".")
         if len(parts) < 3:
             return False
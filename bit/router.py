@@ -1,14 +1,20 @@
 """Router for pipeline execution."""
 
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, Any
 import uuid
-from datetime import datetime, UTC
 
 from bit.plan import ExecutionPlan
-from bit.events import Event, EventType, EventLog, RunRecord
+from bit.events import Event, EventType, EventLog, RunRecord, utc_now_iso
 from bit.workers_stub import WorkerStub, EchoWorker, FileWorker, CounterWorker
 
+# (worker, input_names, params, step_id, worker_id, started_payload); worker is None when unknown
+CompiledStep = tuple[Optional[WorkerStub], tuple[str, ...], dict[str, Any], str, str, dict[str, Any]]
+
+# Compiled plans kept per router; least recently executed ones are dropped first
+_COMPILED_CACHE_SIZE = 32
+
 
 class RuntimeContext:
     """Runtime state during pipeline execution."""
@@ -75,6 +81,42 @@ class Router:
             workspace_path: Workspace root path
         """
         self.workspace_path = Path(workspace_path)
+        self._compiled: OrderedDict[str, tuple[ExecutionPlan, list[CompiledStep]]] = OrderedDict()
+
+    def _compile(self, plan: ExecutionPlan) -> list[CompiledStep]:
+        """Flatten plan steps into tuples for the execution loop.
+
+        Everything here is fixed by the plan, so it is computed once per plan
+        object and reused on re-execution. Only the most recently executed
+        plans are kept, so a long-lived router does not pin every plan it ran.
+
+        Args:
+            plan: ExecutionPlan to compile
+
+        Returns:
+            list[CompiledStep]: One tuple per pipeline step, in order
+        """
+        cached = self._compiled.get(plan.plan_id)
+        if cached is not None and cached[0] is plan:
+            self._compiled.move_to_end(plan.plan_id)
+            return cached[1]
+
+        compiled = [
+            (
+                self._get_worker(step.worker.worker_id),
+                tuple(step.inputs),
+                step.params,
+                step.step_id,
+                step.worker.worker_id,
+                {"worker_id": step.worker.worker_id},
+            )
+            for step in plan.pipeline.steps
+        ]
+        self._compiled[plan.plan_id] = (plan, compiled)
+        self._compiled.move_to_end(plan.plan_id)
+        if len(self._compiled) > _COMPILED_CACHE_SIZE:
+            self._compiled.popitem(last=False)
+        return compiled
 
     def execute_plan(self, plan: ExecutionPlan) -> tuple[bool, RunRecord]:
         """Execute plan sequentially.
@@ -92,14 +134,17 @@ class Router:
         logs_dir = self.workspace_path / "jobs" / plan.job_id / "logs"
         log_path = logs_dir / f"{run_record.run_id}.jsonl"
         event_log = EventLog(log_path)
+        # Events are buffered and written in one batch when the run ends (either way)
+        events: list[Event] = []
 
-        # Initialize context with resolved inputs
-        context = RuntimeContext()
-        for resolved_input in plan.resolved_inputs.inputs:
-            context.set(resolved_input.name, resolved_input.value)
+        # Initialize runtime state with resolved inputs; a plain dict keeps the step loop
+        # free of RuntimeContext method calls
+        state: dict[str, Any] = {
+            resolved_input.name: resolved_input.value for resolved_input in plan.resolved_inputs.inputs
+        }
 
         # Emit job started event
-        event_log.emit(Event(
+        events.append(Event(
             type=EventType.JOB_STARTED,
             timestamp=run_record.created_at,
             run_id=run_record.run_id,
@@ -108,70 +153,68 @@ class Router:
         ))
 
         # Execute pipeline steps
+        run_id = run_record.run_id
+        job_id = plan.job_id
         try:
-            for step in plan.pipeline.steps:
+            for worker, input_names, params, step_id, worker_id, started_payload in self._compile(plan):
                 # Emit step started event
-                event_log.emit(Event(
+                events.append(Event(
                     type=EventType.STEP_STARTED,
-                    timestamp=self._now(),
-                    run_id=run_record.run_id,
-                    job_id=plan.job_id,
-                    step_id=step.step_id,
-                    payload={"worker_id": step.worker.worker_id},
+                    timestamp=utc_now_iso(),
+                    run_id=run_id,
+                    job_id=job_id,
+                    step_id=step_id,
+                    payload=started_payload,
                 ))
 
                 # Collect step inputs from context
-                step_inputs = {}
-                for input_name in step.inputs:
-                    if context.has(input_name):
-                        step_inputs[input_name] = context.get(input_name)
-                    else:
-                        raise ValueError(f"Step {step.step_id}: Input not found in context: {input_name}")
+                try:
+                    step_inputs = {input_name: state[input_name] for input_name in input_names}
+                except KeyError as e:
+                    raise ValueError(f"Step {step_id}: Input not found in context: {e.args[0]}") from None
 
                 # Invoke worker
-                worker = self._get_worker(step.worker.worker_id)
                 if not worker:
-                    raise ValueError(f"Step {step.step_id}: Unknown worker: {step.worker.worker_id}")
+                    raise ValueError(f"Step {step_id}: Unknown worker: {worker_id}")
 
-                step_outputs = worker.execute(step_inputs, step.params)
+                step_outputs = worker.execute(step_inputs, params)
 
                 # Write outputs to context
-                for output_name, output_value in step_outputs.items():
-                    context.set(output_name, output_value)
+                state.update(step_outputs)
 
                 # Emit step completed event
-                event_log.emit(Event(
+                events.append(Event(
                     type=EventType.STEP_COMPLETED,
-                    timestamp=self._now(),
-                    run_id=run_record.run_id,
-                    job_id=plan.job_id,
-                    step_id=step.step_id,
-                    worker_id=step.worker.worker_id,
+                    timestamp=utc_now_iso(),
+                    run_id=run_id,
+                    job_id=job_id,
+                    step_id=step_id,
+                    worker_id=worker_id,
                     payload={"outputs": step_outputs},
                 ))
 
             # Emit job completed event
-            now = self._now()
+            now = utc_now_iso()
             run_record.status = "completed"
             run_record.completed_at = now
 
-            event_log.emit(Event(
+            events.append(Event(
                 type=EventType.JOB_COMPLETED,
                 timestamp=now,
                 run_id=run_record.run_id,
                 job_id=plan.job_id,
-                payload={"context": context.to_dict()},
+                payload={"context": state.copy()},
             ))
 
             return True, run_record
 
         except Exception as e:
             # Emit job failed event
-            now = self._now()
+            now = utc_now_iso()
             run_record.status = "failed"
             run_record.completed_at = now
 
-            event_log.emit(Event(
+            events.append(Event(
                 type=EventType.JOB_FAILED,
                 timestamp=now,
                 run_id=run_record.run_id,
@@ -181,6 +224,9 @@ class Router:
 
             return False, run_record
 
+        finally:
+            event_log.emit_batch(events)
+
     @staticmethod
     def _get_worker(worker_id: str) -> Optional[WorkerStub]:
         """Get worker by ID.
@@ -192,12 +238,3 @@ class Router:
             WorkerStub: Worker or None if not found
         """
         return Router.WORKERS.get(worker_id)
-
-    @staticmethod
-    def _now() -> str:
-        """Get current ISO 8601 timestamp.
-
-        Returns:
-            str: Current timestamp
-        """
-        return datetime.now(UTC).isoformat().replace('+00:00', 'Z')
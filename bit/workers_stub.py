@@ -1,10 +1,11 @@
 """Stub worker implementations for testing."""
 
 from abc import ABC, abstractmethod
-from datetime import datetime, UTC
 from pathlib import Path
 from typing import Any
 
+from bit.events import utc_now_iso
+
 
 class WorkerStub(ABC):
     """Abstract base class for stub workers."""
@@ -42,7 +43,7 @@ class EchoWorker(WorkerStub):
         add_timestamp = params.get("timestamp", True)
 
         if add_timestamp:
-            now = datetime.now(UTC).isoformat().replace('+00:00', 'Z')
+            now = utc_now_iso()
             output = f"{message} [echoed at {now}]"
         else:
             output = f"{message} [echoed]"
@@ -53,6 +54,11 @@ class EchoWorker(WorkerStub):
 class FileWorker(WorkerStub):
     """File copy worker that copies files."""
 
+    def __init__(self):
+        """Initialize file worker."""
+        # Destination directories already created or seen, so repeat runs skip the exists check
+        self._known_dirs: set[Path] = set()
+
     def execute(self, inputs: dict[str, Any], params: dict[str, Any]) -> dict[str, Any]:
         """Copy a file from source to destination.
 
@@ -78,13 +84,23 @@ class FileWorker(WorkerStub):
 
         # In a real worker, we would copy the file
         # For stub, we just record the operation
-        if not dest_path.parent.exists():
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
+        dest_dir = dest_path.parent
+        if dest_dir not in self._known_dirs:
+            dest_dir.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(dest_dir)
 
         # Create a marker file to indicate copy was performed
-        dest_path.touch()
-
-        return {"copied_file": str(dest_path.absolute())}
+        try:
+            dest_path.touch()
+        except FileNotFoundError:
+            # Directory was removed since it was recorded; recreate it once
+            dest_dir.mkdir(parents=True, exist_ok=True)
+            dest_path.touch()
+
+        # absolute() calls getcwd(); skip it for paths that are already absolute
+        if not dest_path.is_absolute():
+            dest_path = dest_path.absolute()
+        return {"copied_file": str(dest_path)}
 
 
 class SleepWorker(WorkerStub):
@@ -3,12 +3,13 @@
 import json
 import os
 from pathlib import Path
-from typing import Optional
-from datetime import datetime, UTC
+from typing import Generic, Optional, TypeVar
 import hashlib
 
 from pydantic import BaseModel, Field, ConfigDict
 
+from bit.events import utc_now_iso
+
 
 class WorkspaceConfig(BaseModel):
     """Workspace metadata and configuration."""
@@ -26,6 +27,16 @@ class WorkspaceConfig(BaseModel):
     version: str = "1.0"
 
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class Sidecar(BaseModel, Generic[ModelT]):
+    """Machine-written JSON copy of a hand-editable source file (e.g. package.yaml)."""
+
+    stamp: tuple[int, int] = Field(description="(st_mtime_ns, st_size) of the source file it was written from")
+    data: ModelT = Field(description="Parsed contents of the source file")
+
+
 class Workspace:
     """Manages workspace structure and validation."""
 
@@ -35,18 +46,26 @@ class Workspace:
     def __init__(self, workspace_path: str):
         self.path = Path(workspace_path)
         self.config_file = self.path / self.CONFIG_FILE
+        # ((st_mtime_ns, st_size), parsed config) for the last config read or written
+        self._config_cache: Optional[tuple[tuple[int, int], WorkspaceConfig]] = None
 
-    def initialize(self) -> WorkspaceConfig:
+    def initialize(self, skip_existing: bool = False) -> WorkspaceConfig:
         """Create workspace structure and config.
 
+        Args:
+            skip_existing: Return the existing config instead of raising when the
+                workspace is already initialized; nothing on disk is touched
+
         Returns:
             WorkspaceConfig: Configuration of initialized workspace
 
         Raises:
-            FileExistsError: If workspace already exists
+            FileExistsError: If workspace already exists and skip_existing is False
         """
         # Check if workspace is already initialized in this dir
-        if (self.path / self.CONFIG_FILE).exists():
+        if self.config_file.exists():
+            if skip_existing:
+                return self.load_config()
             raise FileExistsError(f"Workspace already exists at {self.path}")
 
         # Create root directory if needed
@@ -59,13 +78,14 @@ class Workspace:
         # Create config
         config = WorkspaceConfig(
             workspace_path=str(self.path.absolute()),
-            created_at=datetime.now(UTC).isoformat().replace('+00:00', 'Z')
+            created_at=utc_now_iso()
         )
 
         # Write config
         with open(self.config_file, "w") as f:
             json.dump(config.model_dump(), f, indent=2)
 
+        self._config_cache = (self._config_key(), config)
         return config
 
     def validate(self) -> bool:
@@ -91,11 +111,9 @@ class Workspace:
             if not subdir_path.is_dir():
                 raise ValueError(f"Missing subdirectory: {subdir}")
 
-        # Validate config is valid JSON/Pydantic
+        # Validate config is valid JSON/Pydantic (parsed once, shared with load_config)
         try:
-            with open(self.config_file, "r") as f:
-                data = json.load(f)
-            WorkspaceConfig(**data)
+            self.load_config()
         except (json.JSONDecodeError, ValueError) as e:
             raise ValueError(f"Invalid config: {e}")
 
@@ -104,21 +122,81 @@ class Workspace:
     def load_config(self) -> WorkspaceConfig:
         """Load workspace config.
 
+        The parsed config is reused until the file's mtime or size changes.
+
         Returns:
             WorkspaceConfig: Current workspace configuration
         """
-        with open(self.config_file, "r") as f:
-            data = json.load(f)
-        return WorkspaceConfig(**data)
+        key = self._config_key()
+        if self._config_cache is not None and self._config_cache[0] == key:
+            return self._config_cache[1]
+
+        # pydantic-core parses the JSON directly, with no intermediate dict
+        config = WorkspaceConfig.model_validate_json(self.config_file.read_bytes())
+        self._config_cache = (key, config)
+        return config
+
+    def _config_key(self) -> tuple[int, int]:
+        """Cache key for the config file.
+
+        Returns:
+            tuple: (st_mtime_ns, st_size)
+        """
+        st = self.config_file.stat()
+        return st.st_mtime_ns, st.st_size
 
     @staticmethod
-    def hash_content(content: str) -> str:
+    def hash_content(content: str | bytes) -> str:
         """Generate deterministic hash of content.
 
         Args:
-            content: Text to hash
+            content: Text or pre-encoded bytes to hash
 
         Returns:
-            str: Hex hash
+            str: SHA256 hash (hex)
         """
-        return hashlib.sha256(content.encode()).hexdigest()
+        if isinstance(content, str):
+            content = content.encode()
+        # Content addressing only; stored intent/job/package hashes depend on this staying SHA256
+        return hashlib.sha256(content, usedforsecurity=False).hexdigest()
+
+    @staticmethod
+    def write_sidecar(sidecar_path: str | Path, source_st: os.stat_result, data_json: bytes) -> None:
+        """Write a Sidecar document for a source file that was just written.
+
+        Args:
+            sidecar_path: Path of the sidecar file
+            source_st: Stat of the source file, taken after writing it
+            data_json: The source's contents, already encoded as a JSON object
+        """
+        stamp = json.dumps([source_st.st_mtime_ns, source_st.st_size]).encode()
+        with open(sidecar_path, "wb") as f:
+            f.write(b'{"stamp":' + stamp + b',"data":' + data_json + b"}")
+
+    @staticmethod
+    def read_sidecar(
+        sidecar_path: str | Path, source_st: os.stat_result, model: type[ModelT]
+    ) -> Optional[ModelT]:
+        """Load a sidecar if it was written from the source file as it is now.
+
+        The source stays the source of truth: once it is edited by hand its stat
+        no longer matches the sidecar's stamp, so the sidecar is ignored until it
+        is written again.
+
+        Args:
+            sidecar_path: Path of the sidecar file
+            source_st: Current stat of the source file
+            model: Model stored in the sidecar's data
+
+        Returns:
+            ModelT: Sidecar contents, or None if missing, stale or unreadable
+        """
+        try:
+            with open(sidecar_path, "rb") as f:
+                # pydantic-core parses stamp and data in one pass, with no intermediate dict
+                sidecar = Sidecar[model].model_validate_json(f.read())
+        except (OSError, ValueError):
+            return None
+        if sidecar.stamp != (source_st.st_mtime_ns, source_st.st_size):
+            return None
+        return sidecar.data
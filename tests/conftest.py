@@ -0,0 +1,59 @@
+"""Shared pytest fixtures."""
+
+import shutil
+
+import pytest
+
+from bit.modes import SessionManager
+from bit.workspace import Workspace
+
+
+def _copy_workspace(template, ws_path) -> str:
+    """Copy a template workspace and point its config at the new location.
+
+    Returns:
+        str: Workspace root path
+    """
+    shutil.copytree(template, ws_path)
+
+    ws = Workspace(str(ws_path))
+    config = ws.load_config().model_copy(update={"workspace_path": str(ws_path.absolute())})
+    ws.config_file.write_text(config.model_dump_json(indent=2))
+    return str(ws_path)
+
+
+@pytest.fixture(scope="session")
+def _ws_template(tmp_path_factory):
+    """Initialize one workspace per session for tests to copy."""
+    template = tmp_path_factory.mktemp("ws_tpl")
+    Workspace(str(template)).initialize()
+    return template
+
+
+@pytest.fixture(scope="session")
+def _code_ws_template(tmp_path_factory, _ws_template):
+    """Session template with the active mode already set to "code"."""
+    template = tmp_path_factory.mktemp("code_ws_tpl") / "ws"
+    _copy_workspace(_ws_template, template)
+    SessionManager(str(template)).set_mode("code")
+    return template
+
+
+@pytest.fixture
+def initialized_workspace(tmp_path, _ws_template):
+    """Fresh initialized workspace, copied from the session template.
+
+    Returns:
+        str: Workspace root path
+    """
+    return _copy_workspace(_ws_template, tmp_path / "ws")
+
+
+@pytest.fixture
+def code_workspace(tmp_path, _code_ws_template):
+    """Fresh initialized workspace in "code" mode, copied from the session template.
+
+    Returns:
+        str: Workspace root path
+    """
+    return _copy_workspace(_code_ws_template, tmp_path / "ws")
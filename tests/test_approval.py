@@ -1,10 +1,10 @@
 """Tests for approval and authorization system."""
 
 import pytest
-from tempfile import TemporaryDirectory
+from pathlib import Path
 
-from bit.workspace import Workspace
 from bit.approval import Approval, ApprovalDecision, ApprovalLog
+from bit.intent import IntentSynthesizer
 from bit.job import Job, JobStatus, JobSpec, JobManager
 
 
@@ -108,101 +108,78 @@ class TestApprovalLog:
         assert log.is_denied("plan-1") is True
         assert log.is_denied("plan-2") is False
 
-    def test_approval_log_serialization(self):
-        """Test serializing and deserializing approval log."""
+    @pytest.mark.parametrize("records", [
+        [],
+        [("plan-1", "user1", "grant"), ("plan-1", "user2", "deny")],
+        [("plan-1", "a", "deny"), ("plan-2", "b", "grant"), ("plan-1", "c", "grant")],
+        [("plan-ü", "user ☕", "grant"), ("plan-ü", "", "deny"), ("p", "x" * 200, "grant")],
+        [(f"plan-{i % 3}", f"user{i}", "grant" if i % 2 else "deny") for i in range(8)],
+    ])
+    def test_approval_log_serialization(self, records):
+        """Test to_list/from_list round-trips and preserves per-plan latest decisions."""
         log = ApprovalLog()
-
-        approval1 = Approval.grant("plan-1", "user1")
-        approval2 = Approval.deny("plan-1", "user2")
-
-        log.add(approval1)
-        log.add(approval2)
+        for plan_id, approver, action in records:
+            log.add(getattr(Approval, action)(plan_id, approver))
 
         # Serialize
         data = log.to_list()
-
-        assert len(data) == 2
-        assert data[0]["plan_id"] == "plan-1"
+        assert len(data) == len(records)
 
         # Deserialize
         log2 = ApprovalLog.from_list(data)
 
-        assert len(log2.approvals) == 2
-        assert log2.get_latest("plan-1").decision == ApprovalDecision.DENIED
+        assert log2.to_list() == data
+        for plan_id in {plan_id for plan_id, _, _ in records}:
+            assert log2.get_latest(plan_id) == log.get_latest(plan_id)
 
 
-class TestJobStateTransitions:
-    """Tests for job state machine transitions."""
+@pytest.fixture(scope="module")
+def workspace(tmp_path_factory):
+    """Workspace path that is never created.
 
-    @pytest.fixture
-    def workspace(self):
-        """Create temporary workspace for testing."""
-        with TemporaryDirectory() as tmpdir:
-            ws = Workspace(tmpdir)
-            ws.initialize()
-            yield tmpdir
+    Transitions and approvals only mutate the in-memory Job; nothing here
+    reads or writes the workspace, so no filesystem setup is needed (see
+    test_state_machine_does_not_touch_disk).
+    """
+    return str(tmp_path_factory.mktemp("transitions") / "ws")
 
-    @pytest.fixture
-    def job_manager(self, workspace):
-        """Create job manager for testing."""
-        return JobManager(workspace)
 
-    @pytest.fixture
-    def sample_job(self, job_manager):
-        """Create a sample job for testing."""
-        from bit.intent import IntentSynthesizer
+@pytest.fixture(scope="module")
+def job_manager(workspace):
+    """Job manager shared by the module; it holds only workspace paths, no job state."""
+    return JobManager(workspace)
 
-        intent = IntentSynthesizer.synthesize("Test intent", "test")
-        job = job_manager.create_from_intent(intent, "test")
-        return job
 
-    def test_job_transition_draft_to_planned(self, job_manager, sample_job):
-        """Test DRAFT -> PLANNED transition."""
-        assert sample_job.status == JobStatus.DRAFT
+@pytest.fixture(scope="module")
+def draft_job(job_manager):
+    """DRAFT job template shared by the transition table (copy before mutating)."""
+    intent = IntentSynthesizer.synthesize("Test intent", "test")
+    return job_manager.create_from_intent(intent, "test")
 
-        job_updated = job_manager.transition_to_planned(sample_job)
 
-        assert job_updated.status == JobStatus.PLANNED
-
-    def test_job_transition_planned_to_approved(self, job_manager, sample_job):
-        """Test PLANNED -> APPROVED transition."""
-        sample_job.status = JobStatus.PLANNED
-
-        job_updated = job_manager.approve_job(sample_job, "plan-1")
-
-        assert job_updated.status == JobStatus.APPROVED
-
-    def test_job_transition_approved_to_running(self, job_manager, sample_job):
-        """Test APPROVED -> RUNNING transition."""
-        sample_job.status = JobStatus.APPROVED
-
-        job_updated = job_manager.transition_to_running(sample_job)
-
-        assert job_updated.status == JobStatus.RUNNING
-
-    def test_job_transition_running_to_completed(self, job_manager, sample_job):
-        """Test RUNNING -> COMPLETED transition."""
-        sample_job.status = JobStatus.RUNNING
-
-        job_updated = job_manager.complete_job(sample_job)
-
-        assert job_updated.status == JobStatus.COMPLETED
-
-    def test_job_transition_to_failed(self, job_manager, sample_job):
-        """Test transition to FAILED status."""
-        sample_job.status = JobStatus.RUNNING
-
-        job_updated = job_manager.fail_job(sample_job)
-
-        assert job_updated.status == JobStatus.FAILED
-
-    def test_job_transition_to_halted(self, job_manager, sample_job):
-        """Test transition to HALTED status."""
-        sample_job.status = JobStatus.RUNNING
-
-        job_updated = job_manager.halt_job(sample_job)
+class TestJobStateTransitions:
+    """Tests for job state machine transitions."""
 
-        assert job_updated.status == JobStatus.HALTED
+    @pytest.fixture
+    def sample_job(self, draft_job):
+        """Fresh DRAFT job for testing."""
+        return draft_job.model_copy(deep=True)
+
+    @pytest.mark.parametrize("from_status,method,args,to_status", [
+        (JobStatus.DRAFT, "transition_to_planned", (), JobStatus.PLANNED),
+        (JobStatus.PLANNED, "approve_job", ("plan-1",), JobStatus.APPROVED),
+        (JobStatus.APPROVED, "transition_to_running", (), JobStatus.RUNNING),
+        (JobStatus.RUNNING, "complete_job", (), JobStatus.COMPLETED),
+        (JobStatus.RUNNING, "fail_job", (), JobStatus.FAILED),
+        (JobStatus.RUNNING, "halt_job", (), JobStatus.HALTED),
+    ])
+    def test_job_transition(self, job_manager, draft_job, from_status, method, args, to_status):
+        """Test each valid state transition."""
+        job = draft_job.model_copy(update={"status": from_status}, deep=True)
+
+        job_updated = getattr(job_manager, method)(job, *args)
+
+        assert job_updated.status == to_status
 
     def test_job_invalid_transition(self, job_manager, sample_job):
         """Test invalid state transition raises error."""
@@ -281,3 +258,13 @@ class TestJobStateTransitions:
         # RUNNING -> COMPLETED
         sample_job = job_manager.complete_job(sample_job)
         assert sample_job.status == JobStatus.COMPLETED
+
+    def test_state_machine_does_not_touch_disk(self, workspace, job_manager, sample_job):
+        """Test transitions and approval records stay in memory (no persistence)."""
+        sample_job = job_manager.transition_to_planned(sample_job)
+        job_manager.deny_job(sample_job, "plan-0")
+        sample_job = job_manager.approve_job(sample_job, "plan-1")
+        sample_job = job_manager.transition_to_running(sample_job)
+        job_manager.halt_job(sample_job)
+
+        assert not Path(workspace).exists()
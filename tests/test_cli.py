@@ -1,76 +1,94 @@
 """Tests for CLI module."""
 
-import json
-import tempfile
-from pathlib import Path
+import re
 
+import pytest
 from typer.testing import CliRunner
 
+from bit import cli
 from bit.cli import app
+from bit.intent import IntentManager, IntentSynthesizer
+from bit.modes import SessionManager
 from bit.workspace import Workspace
 
 runner = CliRunner()
 
+# Intent hash as printed by 'bit intent synth' ("Hash: abc123def...")
+_HASH_RE = re.compile(r"Hash:\s*(\S+)")
 
-def test_init_creates_workspace():
+
+def call_command(capsys, command, *args, **kwargs):
+    """Call a command function directly, skipping Click's context build and arg parsing.
+
+    For tests of command behavior rather than argument handling. Every option
+    must be passed explicitly, since the defaults are typer.Option objects.
+
+    Returns:
+        tuple: (exit code, captured stdout)
+    """
+    with pytest.raises(SystemExit) as exc_info:
+        command(*args, **kwargs)
+    return exc_info.value.code, capsys.readouterr().out
+
+
+def run_app_exit_code(args):
+    """Run the app in standalone mode (as the bit script does) and return its exit code.
+
+    For tests that only check the exit code; skips CliRunner's stream capture.
+    """
+    with pytest.raises(SystemExit) as exc_info:
+        app(args, prog_name="bit")
+    return exc_info.value.code
+
+
+def test_init_creates_workspace(tmp_path):
     """Test 'bit init' creates workspace."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        result = runner.invoke(app, ["init", tmpdir])
+    result = runner.invoke(app, ["init", str(tmp_path)])
 
-        assert result.exit_code == 0
-        assert "Workspace initialized" in result.stdout
+    assert result.exit_code == 0
+    assert "Workspace initialized" in result.stdout
 
-        # Verify structure
-        ws = Workspace(tmpdir)
-        assert ws.validate() is True
+    # Verify structure
+    ws = Workspace(str(tmp_path))
+    assert ws.validate() is True
 
 
-def test_init_fails_if_exists():
+def test_init_fails_if_exists(initialized_workspace, capsys):
     """Test 'bit init' fails if workspace exists."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Initialize once
-        runner.invoke(app, ["init", tmpdir])
+    exit_code, out = call_command(capsys, cli.init, initialized_workspace)
 
-        # Try again
-        result = runner.invoke(app, ["init", tmpdir])
+    assert exit_code == 1
+    assert "already exists" in out
 
-        assert result.exit_code == 1
-        assert "already exists" in result.stdout or "already exists" in result.stderr
 
-
-def test_ws_validate_success():
+def test_ws_validate_success(initialized_workspace):
     """Test 'bit ws validate' on valid workspace."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        ws = Workspace(tmpdir)
-        ws.initialize()
-
-        result = runner.invoke(app, ["ws", "validate", "--path", tmpdir])
+    result = runner.invoke(app, ["ws", "validate", "--path", initialized_workspace])
 
-        assert result.exit_code == 0
-        assert "valid" in result.stdout
+    assert result.exit_code == 0
+    assert "valid" in result.stdout
 
 
-def test_ws_validate_fails_missing():
+def test_ws_validate_fails_missing(capsys):
     """Test 'bit ws validate' fails if workspace missing."""
-    result = runner.invoke(app, ["ws", "validate", "--path", "/nonexistent"])
+    exit_code, _ = call_command(capsys, cli.ws, "validate", path="/nonexistent")
 
-    assert result.exit_code == 1
+    assert exit_code == 1
 
 
-def test_ws_open():
+def test_ws_open(initialized_workspace):
     """Test 'bit ws open' sets active workspace."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        ws = Workspace(tmpdir)
-        ws.initialize()
-
-        result = runner.invoke(app, ["ws", "open", "--path", tmpdir])
+    result = runner.invoke(app, ["ws", "open", "--path", initialized_workspace])
 
-        assert result.exit_code == 0
-        assert "opened" in result.stdout
+    assert result.exit_code == 0
+    assert "opened" in result.stdout
 
 
-def test_ws_show_requires_open():
+def test_ws_show_requires_open(monkeypatch):
     """Test 'bit ws show' requires open workspace."""
+    # Earlier tests may have opened a workspace that still exists on disk
+    monkeypatch.setattr("bit.cli._active_workspace", None)
+
     result = runner.invoke(app, ["ws", "show"])
 
     # Without open, should fail
@@ -84,267 +102,182 @@ def test_mode_list():
     result = runner.invoke(app, ["mode", "list"])
 
     assert result.exit_code == 0
-    assert "chat" in result.stdout
-    assert "code" in result.stdout
-    assert "snap" in result.stdout
-    assert "xform" in result.stdout
+    stdout = result.stdout
+    missing = [name for name in ("chat", "code", "snap", "xform") if name not in stdout]
+    assert not missing, f"modes missing from output: {missing}"
 
 
-def test_mode_set():
+def test_mode_set(initialized_workspace):
     """Test 'bit mode set' changes active mode."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        ws = Workspace(tmpdir)
-        ws.initialize()
-
-        result = runner.invoke(app, ["mode", "set", "--name", "code", "--path", tmpdir])
+    result = runner.invoke(app, ["mode", "set", "--name", "code", "--path", initialized_workspace])
 
-        assert result.exit_code == 0
-        assert "code" in result.stdout
+    assert result.exit_code == 0
+    assert "code" in result.stdout
 
 
-def test_mode_set_invalid():
+def test_mode_set_invalid(initialized_workspace, capsys):
     """Test 'bit mode set' fails for invalid mode."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        ws = Workspace(tmpdir)
-        ws.initialize()
-
-        result = runner.invoke(app, ["mode", "set", "--name", "invalid", "--path", tmpdir])
+    exit_code, out = call_command(capsys, cli.mode, "set", name="invalid", path=initialized_workspace)
 
-        assert result.exit_code == 1
-        assert "Invalid mode" in result.stdout
+    assert exit_code == 1
+    assert "Invalid mode" in out
 
 
 def test_mode_set_requires_path():
     """Test 'bit mode set' requires --path."""
-    result = runner.invoke(app, ["mode", "set", "--name", "code"])
+    # Rejected as a usage error before any workspace access, so no workspace is needed
+    assert run_app_exit_code(["mode", "set", "--name", "code"]) == 2
 
-    assert result.exit_code != 0
 
-
-def test_mode_show():
+def test_mode_show(initialized_workspace):
     """Test 'bit mode show' displays current mode."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        ws = Workspace(tmpdir)
-        ws.initialize()
-
-        result = runner.invoke(app, ["mode", "show", "--path", tmpdir])
+    result = runner.invoke(app, ["mode", "show", "--path", initialized_workspace])
 
-        assert result.exit_code == 0
-        assert "chat" in result.stdout  # Default mode
+    assert result.exit_code == 0
+    assert "chat" in result.stdout  # Default mode
 
 
-def test_mode_show_after_set():
+def test_mode_show_after_set(initialized_workspace):
     """Test 'bit mode show' reflects set mode."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        ws = Workspace(tmpdir)
-        ws.initialize()
-
-        # Set mode
-        runner.invoke(app, ["mode", "set", "--name", "snap", "--path", tmpdir])
-
-        # Show should reflect change
-        result = runner.invoke(app, ["mode", "show", "--path", tmpdir])
+    # Set mode
+    runner.invoke(app, ["mode", "set", "--name", "snap", "--path", initialized_workspace])
 
-        assert result.exit_code == 0
-        assert "snap" in result.stdout
+    # Show should reflect change
+    result = runner.invoke(app, ["mode", "show", "--path", initialized_workspace])
 
+    assert result.exit_code == 0
+    assert "snap" in result.stdout
 
-def test_mode_persists_across_commands():
-    """Test mode persists across separate CLI invocations."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        ws = Workspace(tmpdir)
-        ws.initialize()
 
-        # Set mode in one invocation
-        runner.invoke(app, ["mode", "set", "--name", "xform", "--path", tmpdir])
+def test_mode_persists_across_commands(initialized_workspace):
+    """Test mode persisted to the workspace is seen by a separate CLI invocation."""
+    # Persist mode outside the CLI (the CLI set path is covered by test_mode_show_after_set)
+    SessionManager(initialized_workspace).set_mode("xform")
 
-        # Check in another invocation
-        result = runner.invoke(app, ["mode", "show", "--path", tmpdir])
+    # Check in a fresh invocation
+    result = runner.invoke(app, ["mode", "show", "--path", initialized_workspace])
 
-        assert result.exit_code == 0
-        assert "xform" in result.stdout
+    assert result.exit_code == 0
+    assert "xform" in result.stdout
 
 
 # Intent command tests
 
-def test_intent_synth_basic():
+def test_intent_synth_basic(initialized_workspace):
     """Test 'bit intent synth' creates intent."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        ws = Workspace(tmpdir)
-        ws.initialize()
+    result = runner.invoke(app, ["intent", "synth", "--text", "Create auth system", "--path", initialized_workspace])
 
-        result = runner.invoke(app, ["intent", "synth", "--text", "Create auth system", "--path", tmpdir])
-
-        assert result.exit_code == 0
-        assert "Intent synthesized" in result.stdout
-        assert "Hash:" in result.stdout
-        assert "Distilled:" in result.stdout
+    assert result.exit_code == 0
+    assert "Intent synthesized" in result.stdout
+    assert "Hash:" in result.stdout
+    assert "Distilled:" in result.stdout
 
 
-def test_intent_synth_requires_text():
+def test_intent_synth_requires_text(initialized_workspace):
     """Test 'bit intent synth' requires --text."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        ws = Workspace(tmpdir)
-        ws.initialize()
-
-        result = runner.invoke(app, ["intent", "synth", "--path", tmpdir])
+    # The workspace is validated before --text is checked, so it must be real; a missing
+    # workspace would exit 1 rather than with the usage error asserted here
+    assert run_app_exit_code(["intent", "synth", "--path", initialized_workspace]) == 2
 
-        assert result.exit_code != 0
 
-
-def test_intent_synth_deterministic():
+def test_intent_synth_deterministic(initialized_workspace):
     """Test 'bit intent synth' produces same hash for same text."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        ws = Workspace(tmpdir)
-        ws.initialize()
-
-        text = "Create user authentication with OAuth2"
-
-        result1 = runner.invoke(app, ["intent", "synth", "--text", text, "--path", tmpdir])
-        result2 = runner.invoke(app, ["intent", "synth", "--text", text, "--path", tmpdir])
-
-        assert result1.exit_code == 0
-        assert result2.exit_code == 0
+    text = "Create user authentication with OAuth2"
 
-        # Extract hash from output (format: "Hash: abc123def...")
-        def extract_hash(output):
-            for line in output.split("\n"):
-                if "Hash:" in line:
-                    return line.split("Hash:")[-1].strip()
-            return None
+    result = runner.invoke(app, ["intent", "synth", "--text", text, "--path", initialized_workspace])
 
-        hash1 = extract_hash(result1.stdout)
-        hash2 = extract_hash(result2.stdout)
+    assert result.exit_code == 0
 
-        assert hash1 == hash2
+    # Re-synthesizing in-process (default mode is chat) must give the same hash;
+    # clear the derivation cache so each call derives the intent from scratch
+    IntentSynthesizer._derive.cache_clear()
+    expected = IntentSynthesizer.synthesize(text, "chat").intent_hash
+    assert _HASH_RE.search(result.stdout).group(1) == expected
+    IntentSynthesizer._derive.cache_clear()
+    assert IntentSynthesizer.synthesize(text, "chat").intent_hash == expected
 
 
-def test_intent_synth_includes_mode():
+def test_intent_synth_includes_mode(initialized_workspace):
     """Test synthesized intent includes current mode."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        ws = Workspace(tmpdir)
-        ws.initialize()
-
-        # Set mode to code
-        runner.invoke(app, ["mode", "set", "--name", "code", "--path", tmpdir])
+    # Set mode to code
+    runner.invoke(app, ["mode", "set", "--name", "code", "--path", initialized_workspace])
 
-        result = runner.invoke(app, ["intent", "synth", "--text", "Test intent", "--path", tmpdir])
+    result = runner.invoke(app, ["intent", "synth", "--text", "Test intent", "--path", initialized_workspace])
 
-        assert result.exit_code == 0
-        assert "Mode: code" in result.stdout
+    assert result.exit_code == 0
+    assert "Mode: code" in result.stdout
 
 
-def test_intent_list_empty():
+def test_intent_list_empty(initialized_workspace):
     """Test 'bit intent list' on empty workspace."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        ws = Workspace(tmpdir)
-        ws.initialize()
+    result = runner.invoke(app, ["intent", "list", "--path", initialized_workspace])
 
-        result = runner.invoke(app, ["intent", "list", "--path", tmpdir])
-
-        assert result.exit_code == 0
-        assert "No intents found" in result.stdout
+    assert result.exit_code == 0
+    assert "No intents found" in result.stdout
 
 
-def test_intent_list_multiple():
+def test_intent_list_multiple(initialized_workspace):
     """Test 'bit intent list' shows all intents."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        ws = Workspace(tmpdir)
-        ws.initialize()
+    # Create intents
+    runner.invoke(app, ["intent", "synth", "--text", "First intent", "--path", initialized_workspace])
+    runner.invoke(app, ["intent", "synth", "--text", "Second intent", "--path", initialized_workspace])
 
-        # Create intents
-        runner.invoke(app, ["intent", "synth", "--text", "First intent", "--path", tmpdir])
-        runner.invoke(app, ["intent", "synth", "--text", "Second intent", "--path", tmpdir])
+    result = runner.invoke(app, ["intent", "list", "--path", initialized_workspace])
 
-        result = runner.invoke(app, ["intent", "list", "--path", tmpdir])
-
-        assert result.exit_code == 0
-        assert "Intents" in result.stdout
-        # Should show 2 intents in table
+    assert result.exit_code == 0
+    assert "Intents" in result.stdout
+    # Should show 2 intents in table
 
 
-def test_intent_show_by_hash():
+def test_intent_show_by_hash(initialized_workspace):
     """Test 'bit intent show' displays intent."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        ws = Workspace(tmpdir)
-        ws.initialize()
-
-        # Create intent
-        result = runner.invoke(app, ["intent", "synth", "--text", "Test intent", "--path", tmpdir])
-        assert result.exit_code == 0
-
-        # Extract hash
-        hash_value = None
-        for line in result.stdout.split("\n"):
-            if "Hash:" in line:
-                hash_value = line.split("Hash:")[-1].strip()
-                break
-
-        assert hash_value
+    # Create intent in-process; only the show command goes through the CLI
+    intent = IntentSynthesizer.synthesize("Test intent", "chat")
+    IntentManager(initialized_workspace).save(intent)
+    hash_value = intent.intent_hash
 
-        # Show intent
-        show_result = runner.invoke(app, ["intent", "show", "--hash", hash_value, "--path", tmpdir])
+    # Show intent
+    show_result = runner.invoke(app, ["intent", "show", "--hash", hash_value, "--path", initialized_workspace])
 
-        assert show_result.exit_code == 0
-        assert "Intent" in show_result.stdout
+    assert show_result.exit_code == 0
+    assert "Intent" in show_result.stdout
 
 
-def test_intent_show_nonexistent():
+def test_intent_show_nonexistent(initialized_workspace, capsys):
     """Test 'bit intent show' fails for nonexistent hash."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        ws = Workspace(tmpdir)
-        ws.initialize()
+    exit_code, out = call_command(
+        capsys, cli.intent, "show", text=None, hash_value="nonexistent", path=initialized_workspace
+    )
 
-        result = runner.invoke(app, ["intent", "show", "--hash", "nonexistent", "--path", tmpdir])
+    assert exit_code == 1
+    assert "not found" in out
 
-        assert result.exit_code == 1
-        assert "not found" in result.stdout
 
-
-def test_intent_show_requires_hash():
+def test_intent_show_requires_hash(initialized_workspace):
     """Test 'bit intent show' requires --hash."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        ws = Workspace(tmpdir)
-        ws.initialize()
-
-        result = runner.invoke(app, ["intent", "show", "--path", tmpdir])
+    # As with synth, the workspace must be real for the --hash check to be reached
+    assert run_app_exit_code(["intent", "show", "--path", initialized_workspace]) == 2
 
-        assert result.exit_code != 0
 
-
-def test_intent_verify_valid():
+def test_intent_verify_valid(initialized_workspace):
     """Test 'bit intent verify' validates correct hash."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        ws = Workspace(tmpdir)
-        ws.initialize()
-
-        # Create intent
-        result = runner.invoke(app, ["intent", "synth", "--text", "Test intent", "--path", tmpdir])
-        assert result.exit_code == 0
+    # Create intent in-process; only the verify command goes through the CLI
+    intent = IntentSynthesizer.synthesize("Test intent", "chat")
+    IntentManager(initialized_workspace).save(intent)
+    hash_value = intent.intent_hash
 
-        # Extract hash
-        hash_value = None
-        for line in result.stdout.split("\n"):
-            if "Hash:" in line:
-                hash_value = line.split("Hash:")[-1].strip()
-                break
+    # Verify
+    verify_result = runner.invoke(app, ["intent", "verify", "--hash", hash_value, "--path", initialized_workspace])
 
-        assert hash_value
+    assert verify_result.exit_code == 0
+    assert "valid" in verify_result.stdout.lower()
 
-        # Verify
-        verify_result = runner.invoke(app, ["intent", "verify", "--hash", hash_value, "--path", tmpdir])
 
-        assert verify_result.exit_code == 0
-        assert "valid" in verify_result.stdout.lower()
-
-
-def test_intent_verify_nonexistent():
+def test_intent_verify_nonexistent(initialized_workspace, capsys):
     """Test 'bit intent verify' fails for nonexistent hash."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        ws = Workspace(tmpdir)
-        ws.initialize()
-
-        result = runner.invoke(app, ["intent", "verify", "--hash", "nonexistent", "--path", tmpdir])
+    exit_code, out = call_command(
+        capsys, cli.intent, "verify", text=None, hash_value="nonexistent", path=initialized_workspace
+    )
 
-        assert result.exit_code == 1
-        assert "not found" in result.stdout
+    assert exit_code == 1
+    assert "not found" in out
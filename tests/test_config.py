@@ -2,9 +2,7 @@
 
 import pytest
 from pathlib import Path
-from tempfile import TemporaryDirectory
 
-from bit.workspace import Workspace
 from bit.config import (
     ConciergeConfig,
     ConfigManager,
@@ -16,75 +14,66 @@ from bit.config import (
 )
 
 
-class TestConfigModels:
-    """Tests for configuration models."""
-
-    def test_create_planner_config(self):
-        """Test creating planner configuration."""
-        config = PlannerConfig(confidence_threshold=0.8, max_candidates=10)
-
-        assert config.confidence_threshold == 0.8
-        assert config.max_candidates == 10
-
-    def test_create_router_config(self):
-        """Test creating router configuration."""
-        config = RouterConfig(max_parallel_steps=4)
-
-        assert config.max_parallel_steps == 4
-        assert config.enable_event_logging is True
-
-    def test_create_approval_config(self):
-        """Test creating approval configuration."""
-        config = ApprovalConfig(require_approval_by_default=True)
-
-        assert config.require_approval_by_default is True
-
-    def test_create_cache_config(self):
-        """Test creating cache configuration."""
-        config = CacheConfig(enable_caching=False)
+@pytest.fixture(scope="class")
+def sub_configs():
+    """Sub-configurations validated once per class; copy before composing."""
+    return {
+        "planner": PlannerConfig(confidence_threshold=0.75),
+        "router": RouterConfig(max_parallel_steps=2),
+        "workers": {
+            "worker1": WorkerConfig(worker_id="worker1"),
+            "worker2": WorkerConfig(worker_id="worker2", enabled=False),
+        },
+    }
 
-        assert config.enable_caching is False
 
-    def test_create_worker_config(self):
-        """Test creating worker configuration."""
-        config = WorkerConfig(
-            worker_id="test_worker",
-            timeout_seconds=600,
-            retry_count=5,
-        )
-
-        assert config.worker_id == "test_worker"
-        assert config.timeout_seconds == 600
-        assert config.retry_count == 5
+class TestConfigModels:
+    """Tests for configuration models."""
 
-    def test_create_full_config(self):
+    @pytest.mark.parametrize("cls,kwargs,expected", [
+        (PlannerConfig, {"confidence_threshold": 0.8, "max_candidates": 10},
+         {"confidence_threshold": 0.8, "max_candidates": 10}),
+        (RouterConfig, {"max_parallel_steps": 4},
+         {"max_parallel_steps": 4, "enable_event_logging": True}),
+        (ApprovalConfig, {"require_approval_by_default": True},
+         {"require_approval_by_default": True}),
+        (CacheConfig, {"enable_caching": False},
+         {"enable_caching": False}),
+        (WorkerConfig, {"worker_id": "test_worker", "timeout_seconds": 600, "retry_count": 5},
+         {"worker_id": "test_worker", "timeout_seconds": 600, "retry_count": 5}),
+    ], ids=["planner", "router", "approval", "cache", "worker"])
+    def test_create_sub_config(self, cls, kwargs, expected):
+        """Test creating each sub-configuration model."""
+        config = cls(**kwargs)
+
+        for name, value in expected.items():
+            assert getattr(config, name) == value
+
+    def test_create_full_config(self, sub_configs):
         """Test creating complete configuration."""
+        # Model instances are not revalidated or copied on assignment, so copy the shared ones
         config = ConciergeConfig(
             version="1.0.0",
             workspace_path="/workspace",
-            planner=PlannerConfig(confidence_threshold=0.75),
-            router=RouterConfig(max_parallel_steps=2),
-            workers={
-                "worker1": WorkerConfig(worker_id="worker1"),
-                "worker2": WorkerConfig(worker_id="worker2", enabled=False),
-            },
+            planner=sub_configs["planner"].model_copy(),
+            router=sub_configs["router"].model_copy(),
+            workers={worker_id: worker.model_copy() for worker_id, worker in sub_configs["workers"].items()},
         )
 
         assert config.version == "1.0.0"
         assert config.planner.confidence_threshold == 0.75
+        assert config.router.max_parallel_steps == 2
         assert len(config.workers) == 2
+        assert config.workers["worker2"].enabled is False
 
 
 class TestConfigManager:
     """Tests for ConfigManager."""
 
     @pytest.fixture
-    def workspace(self):
-        """Create temporary workspace for testing."""
-        with TemporaryDirectory() as tmpdir:
-            ws = Workspace(tmpdir)
-            ws.initialize()
-            yield tmpdir
+    def workspace(self, initialized_workspace):
+        """Initialized workspace copied from the session template."""
+        return initialized_workspace
 
     @pytest.fixture
     def config_manager(self, workspace):
@@ -99,6 +88,28 @@ class TestConfigManager:
         assert config.planner is not None
         assert config.router is not None
 
+    def test_default_config_not_shared(self, config_manager):
+        """Test that mutating a loaded default does not leak into the next load."""
+        config = config_manager.load()
+        config.planner.confidence_threshold = 0.99
+        config.workers["w"] = WorkerConfig(worker_id="w")
+
+        fresh = config_manager.load()
+
+        assert fresh.planner.confidence_threshold == 0.7
+        assert fresh.workers == {}
+        assert fresh.workspace_path == str(config_manager.workspace_path)
+
+    @pytest.mark.parametrize("content", [b"{not json", b"[1, 2]", b'{"planner": {"max_candidates": "many"}}'])
+    def test_load_invalid_config_returns_defaults(self, config_manager, content):
+        """Test that malformed or invalid config files fall back to defaults."""
+        config_manager.config_file.write_bytes(content)
+
+        config = config_manager.load()
+
+        assert config.planner.max_candidates == 5
+        assert config.workspace_path == str(config_manager.workspace_path)
+
     def test_save_and_load_config(self, config_manager):
         """Test saving and loading configuration."""
         config = ConciergeConfig(
@@ -177,6 +188,36 @@ class TestConfigManager:
         assert worker_config.timeout_seconds == 600
         assert worker_config.retry_count == 5
 
+    def test_update_worker_config_patches_existing_worker(self, config_manager):
+        """Test updating one worker keeps its other fields and the rest of the config."""
+        config_manager.update_planner_config({"confidence_threshold": 0.66})
+        config_manager.update_worker_config("w", {"timeout_seconds": 10, "retry_count": 1})
+
+        config_manager.update_worker_config("w", {"retry_count": 7})
+
+        config = config_manager.load()
+        assert config.planner.confidence_threshold == 0.66
+        assert config.workers["w"].timeout_seconds == 10
+        assert config.workers["w"].retry_count == 7
+
+    def test_update_worker_config_validates_updates(self, config_manager):
+        """Test invalid worker updates are rejected without writing."""
+        with pytest.raises(ValueError):
+            config_manager.update_worker_config("w", {"timeout_seconds": "soon"})
+
+        assert config_manager.get_worker_config("w") is None
+
+    def test_update_worker_config_resets_invalid_config(self, config_manager):
+        """Test a config that is valid JSON but not a valid ConciergeConfig is reset on update."""
+        config_manager.config_file.write_text('{"planner": {"confidence_threshold": "high"}, "workers": {}}')
+
+        config_manager.update_worker_config("w", {"retry_count": 2})
+
+        raw = config_manager.config_file.read_bytes()
+        assert raw == config_manager.load().model_dump_json(indent=2).encode()
+        assert config_manager.load().planner.confidence_threshold == PlannerConfig().confidence_threshold
+        assert config_manager.get_worker_config("w").retry_count == 2
+
     def test_enable_worker(self, config_manager):
         """Test enabling a worker."""
         config = config_manager.load()
@@ -231,6 +272,16 @@ class TestConfigManager:
 
         assert planner_config.confidence_threshold == 0.88
 
+    def test_load_sees_external_edit(self, config_manager):
+        """Test that an out-of-band change to the file is picked up despite the cache."""
+        config_manager.update_planner_config({"confidence_threshold": 0.6})
+        assert config_manager.get_planner_config().confidence_threshold == 0.6
+
+        other = ConfigManager(config_manager.workspace_path)
+        other.update_planner_config({"confidence_threshold": 0.65, "max_candidates": 12})
+
+        assert config_manager.get_planner_config().max_candidates == 12
+
     def test_worker_config_with_resource_limits(self, config_manager):
         """Test worker configuration with resource limits."""
         config_manager.update_worker_config("gpu_worker", {
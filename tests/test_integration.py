@@ -2,9 +2,7 @@
 
 import pytest
 from pathlib import Path
-from tempfile import TemporaryDirectory
 
-from bit.workspace import Workspace
 from bit.modes import SessionManager
 from bit.intent import IntentSynthesizer, IntentManager
 from bit.job import JobManager, JobStatus
@@ -16,18 +14,52 @@ from bit.router import Router
 from bit.logs import LogReader
 
 
+@pytest.fixture(scope="session")
+def echo_pkg_template():
+    """Validated single-step echo package; tests specialize it with model_copy."""
+    return TaskPackage(
+        package_id="test.echo",
+        version="1.0.0",
+        title="Echo Test",
+        description="Test echo package",
+        intent=IntentSpec(
+            category="test",
+            verbs=["echo", "test"],
+            entities=["message"],
+            confidence_threshold=0.5,
+        ),
+        input_contract=Contract(),
+        output_contract=Contract(),
+        pipeline=Pipeline(steps=[
+            PipelineStep(
+                step_id="step_1",
+                worker=Worker(worker_id="echo_worker", version="1.0.0"),
+                inputs=[],
+                outputs=["output"],
+                params={"timestamp": True},
+            )
+        ]),
+        approval=ApprovalPolicy(),
+        verification=Verification(),
+        failure_handling=FailureHandling(),
+        resources=ResourceProfile(),
+    )
+
+
 class TestCompleteWorkflow:
     """Integration tests for complete workflow."""
 
     @pytest.fixture
-    def workspace(self):
-        """Create and initialize a workspace."""
-        with TemporaryDirectory() as tmpdir:
-            ws = Workspace(tmpdir)
-            ws.initialize()
-            yield tmpdir
-
-    def test_end_to_end_workflow(self, workspace):
+    def workspace(self, initialized_workspace):
+        """Initialized workspace copied from the session template."""
+        return initialized_workspace
+
+    @pytest.fixture
+    def code_mode_workspace(self, code_workspace):
+        """Workspace copied from the session template already in "code" mode."""
+        return code_workspace
+
+    def test_end_to_end_workflow(self, workspace, echo_pkg_template):
         """Test complete workflow: intent → job → plan → approve → run."""
         # 1. Set up mode
         session = SessionManager(workspace)
@@ -44,43 +76,15 @@ class TestCompleteWorkflow:
         job_manager = JobManager(workspace)
         job = job_manager.create_from_intent(intent_synth, "code")
         assert job.status == JobStatus.DRAFT
-        job_manager.save(job)
 
         # 4. Set up package registry with test echo package
         registry = PackageRegistry(workspace)
-        pkg = TaskPackage(
-            package_id="test.echo",
-            version="1.0.0",
-            title="Echo Test",
-            description="Test echo package",
-            intent=IntentSpec(
-                category="test",
-                verbs=["echo", "test"],
-                entities=["message"],
-                confidence_threshold=0.5,
-            ),
-            input_contract=Contract(),
-            output_contract=Contract(),
-            pipeline=Pipeline(steps=[
-                PipelineStep(
-                    step_id="step_1",
-                    worker=Worker(worker_id="echo_worker", version="1.0.0"),
-                    inputs=[],
-                    outputs=["output"],
-                    params={"timestamp": True},
-                )
-            ]),
-            approval=ApprovalPolicy(),
-            verification=Verification(),
-            failure_handling=FailureHandling(),
-            resources=ResourceProfile(),
-        )
+        pkg = echo_pkg_template
         registry.add_package(pkg)
 
         # 5. Transition job to PLANNED
         job = job_manager.transition_to_planned(job)
         assert job.status == JobStatus.PLANNED
-        job_manager.save(job)
 
         # 6. Generate plan
         planner = Planner(registry)
@@ -97,12 +101,10 @@ class TestCompleteWorkflow:
         # 7. Approve job
         job = job_manager.approve_job(job, plan.plan_id, approver="test_user", note="Approved for testing")
         assert job.status == JobStatus.APPROVED
-        job_manager.save(job)
 
         # 8. Transition to RUNNING
         job = job_manager.transition_to_running(job)
         assert job.status == JobStatus.RUNNING
-        job_manager.save(job)
 
         # 9. Execute plan
         router = Router(workspace)
@@ -114,6 +116,7 @@ class TestCompleteWorkflow:
         # 10. Verify completion
         job = job_manager.complete_job(job)
         assert job.status == JobStatus.COMPLETED
+        # Transitions only change the in-memory job; LogReader reads it from disk
         job_manager.save(job)
 
         # 11. Check logs
@@ -123,23 +126,18 @@ class TestCompleteWorkflow:
         assert status["status"] == "completed"
         assert "current_step" in status or "latest_event" in status
 
-    def test_multi_step_pipeline(self, workspace):
+    def test_multi_step_pipeline(self, code_mode_workspace, echo_pkg_template):
         """Test workflow with multiple pipeline steps."""
-        # Set up workspace
-        session = SessionManager(workspace)
-        session.set_mode("code")
+        workspace = code_mode_workspace
 
         # Create a multi-step package
         registry = PackageRegistry(workspace)
-        pkg = TaskPackage(
-            package_id="test.multi",
-            version="1.0.0",
-            title="Multi-Step Test",
-            description="Test package with multiple steps",
-            intent=IntentSpec(category="test", verbs=["test", "multi"]),
-            input_contract=Contract(),
-            output_contract=Contract(),
-            pipeline=Pipeline(steps=[
+        pkg = echo_pkg_template.model_copy(update={
+            "package_id": "test.multi",
+            "title": "Multi-Step Test",
+            "description": "Test package with multiple steps",
+            "intent": IntentSpec(category="test", verbs=["test", "multi"]),
+            "pipeline": Pipeline(steps=[
                 PipelineStep(
                     step_id="step_1",
                     worker=Worker(worker_id="echo_worker", version="1.0.0"),
@@ -155,11 +153,7 @@ class TestCompleteWorkflow:
                     params={"timestamp": False},
                 ),
             ]),
-            approval=ApprovalPolicy(),
-            verification=Verification(),
-            failure_handling=FailureHandling(),
-            resources=ResourceProfile(),
-        )
+        })
         registry.add_package(pkg)
 
         # Create intent and job
@@ -169,7 +163,6 @@ class TestCompleteWorkflow:
 
         job_manager = JobManager(workspace)
         job = job_manager.create_from_intent(intent, "code")
-        job_manager.save(job)
 
         # Plan and execute
         planner = Planner(registry)
@@ -194,34 +187,16 @@ class TestCompleteWorkflow:
         assert summary["steps_started"] == 2
         assert summary["steps_completed"] == 2
 
-    def test_approval_denial_workflow(self, workspace):
+    def test_approval_denial_workflow(self, code_mode_workspace, echo_pkg_template):
         """Test workflow with plan denial and retry."""
-        # Set up
-        session = SessionManager(workspace)
-        session.set_mode("code")
+        workspace = code_mode_workspace
 
         registry = PackageRegistry(workspace)
-        pkg = TaskPackage(
-            package_id="test.echo",
-            version="1.0.0",
-            title="Echo",
-            description="Echo",
-            intent=IntentSpec(category="test"),
-            input_contract=Contract(),
-            output_contract=Contract(),
-            pipeline=Pipeline(steps=[
-                PipelineStep(
-                    step_id="step_1",
-                    worker=Worker(worker_id="echo_worker", version="1.0.0"),
-                    inputs=[],
-                    outputs=[],
-                )
-            ]),
-            approval=ApprovalPolicy(),
-            verification=Verification(),
-            failure_handling=FailureHandling(),
-            resources=ResourceProfile(),
-        )
+        pkg = echo_pkg_template.model_copy(update={
+            "title": "Echo",
+            "description": "Echo",
+            "intent": IntentSpec(category="test"),
+        })
         registry.add_package(pkg)
 
         # Create job
@@ -232,7 +207,6 @@ class TestCompleteWorkflow:
         job_manager = JobManager(workspace)
         job = job_manager.create_from_intent(intent, "code")
         job = job_manager.transition_to_planned(job)
-        job_manager.save(job)
 
         # Generate first plan
         planner = Planner(registry)
@@ -246,16 +220,15 @@ class TestCompleteWorkflow:
         # Deny first plan
         job = job_manager.deny_job(job, plan1.plan_id, approver="reviewer", reason="Needs adjustment")
         assert job.status == JobStatus.PLANNED  # Should stay in PLANNED
-        job_manager.save(job)
 
-        # Generate second plan
-        plan2 = planner.generate_plan(job, package, confidence)
+        # Generate second plan; job spec and package are unchanged, so reuse plan1's content
+        plan2 = planner.regenerate_plan(plan1)
+        assert plan2.plan_id != plan1.plan_id
         plan_manager.save(plan2)
 
         # Approve second plan
         job = job_manager.approve_job(job, plan2.plan_id, approver="reviewer", note="Approved on retry")
         assert job.status == JobStatus.APPROVED
-        job_manager.save(job)
 
         # Verify approval log
         approval_log = job_manager.get_approval_log(job)
@@ -264,21 +237,20 @@ class TestCompleteWorkflow:
         assert len(all_approvals) == 1
         assert all_approvals[0].decision.value == "denied"
 
-    def test_job_listing_and_discovery(self, workspace):
+    def test_job_listing_and_discovery(self, code_mode_workspace):
         """Test listing and discovering jobs."""
-        # Create multiple jobs
-        session = SessionManager(workspace)
-        session.set_mode("code")
+        workspace = code_mode_workspace
 
+        # Create multiple jobs
         job_manager = JobManager(workspace)
         intent_manager = IntentManager(workspace)
 
-        for i in range(3):
-            intent = IntentSynthesizer.synthesize(f"Test job {i}", "code")
-            intent_manager.save(intent)
+        intents = [IntentSynthesizer.synthesize(f"Test job {i}", "code") for i in range(3)]
+        intent_manager.save_many(intents)
 
-            job = job_manager.create_from_intent(intent, "code")
-            job_manager.save(job)
+        with job_manager.batched():
+            for job in job_manager.create_many(intents, "code"):
+                job_manager.save(job)
 
         # List jobs
         jobs = job_manager.list_jobs()
@@ -291,32 +263,38 @@ class TestCompleteWorkflow:
         """Test searching package registry."""
         registry = PackageRegistry(workspace)
 
-        # Add multiple packages
+        # Add multiple packages. Only lookup is under test here, so skip validation for
+        # the bulky sections, which are built once and shared between packages. The intent
+        # is validated: it normalizes the category and verbs the registry indexes.
+        pipeline = Pipeline.model_construct(steps=[
+            PipelineStep.model_construct(
+                step_id="step_1",
+                worker=Worker.model_construct(worker_id="test", version="1.0.0"),
+                inputs=[],
+                outputs=[],
+            )
+        ])
+        sections = {
+            "input_contract": Contract.model_construct(),
+            "output_contract": Contract.model_construct(),
+            "pipeline": pipeline,
+            "approval": ApprovalPolicy.model_construct(),
+            "verification": Verification.model_construct(),
+            "failure_handling": FailureHandling.model_construct(),
+            "resources": ResourceProfile.model_construct(),
+        }
         for i, (category, verbs) in enumerate([
             ("audio", ["extract", "analyze"]),
             ("audio", ["convert", "encode"]),
             ("video", ["edit", "process"]),
         ]):
-            pkg = TaskPackage(
+            pkg = TaskPackage.model_construct(
                 package_id=f"{category}.pkg{i}",
                 version="1.0.0",
                 title=f"Package {i}",
                 description="Test",
                 intent=IntentSpec(category=category, verbs=verbs),
-                input_contract=Contract(),
-                output_contract=Contract(),
-                pipeline=Pipeline(steps=[
-                    PipelineStep(
-                        step_id="step_1",
-                        worker=Worker(worker_id="test", version="1.0.0"),
-                        inputs=[],
-                        outputs=[],
-                    )
-                ]),
-                approval=ApprovalPolicy(),
-                verification=Verification(),
-                failure_handling=FailureHandling(),
-                resources=ResourceProfile(),
+                **sections,
             )
             registry.add_package(pkg)
 
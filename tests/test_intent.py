@@ -1,26 +1,27 @@
 """Tests for intent module."""
 
 import json
-import tempfile
 from pathlib import Path
 
 import pytest
 
 from bit.intent import Intent, IntentSynthesizer, IntentManager
-from bit.modes import SessionManager
-from bit.workspace import Workspace
 
 
 @pytest.fixture
-def temp_workspace():
-    """Create a temporary initialized workspace."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        ws = Workspace(tmpdir)
-        ws.initialize()
-        # Set mode to code for tests
-        session = SessionManager(tmpdir)
-        session.set_mode("code")
-        yield tmpdir
+def temp_workspace(code_workspace):
+    """Initialized workspace in "code" mode, copied from the session template."""
+    return code_workspace
+
+
+@pytest.fixture(scope="module")
+def intent_pool():
+    """Intents synthesized once per module for the manager tests.
+
+    Shared across tests: copy with ``model_copy`` before mutating.
+    """
+    texts = ["First intent", "Second intent", "Third intent", "Test intent", "Test"]
+    return tuple(IntentSynthesizer.synthesize(text, "code") for text in texts)
 
 
 # Intent model tests
@@ -152,6 +153,8 @@ def test_synthesizer_synthesis_deterministic():
     mode = "code"
 
     intent1 = IntentSynthesizer.synthesize(text, mode)
+    # Drop the memoized derivation so the second call really recomputes
+    IntentSynthesizer._derive.cache_clear()
     intent2 = IntentSynthesizer.synthesize(text, mode)
 
     assert intent1.intent_hash == intent2.intent_hash
@@ -159,6 +162,21 @@ def test_synthesizer_synthesis_deterministic():
     assert intent1.distilled_intent == intent2.distilled_intent
 
 
+def test_synthesizer_cached_derivation_matches_cold():
+    """Test cached synthesis matches a cold run and hands out independent intents."""
+    text = "Create user authentication system. Must use OAuth2."
+    cached = IntentSynthesizer.synthesize(text, "code")
+
+    IntentSynthesizer._derive.cache_clear()
+    cold = IntentSynthesizer.synthesize(text, "code")
+
+    assert cold.intent_hash == cached.intent_hash
+    assert cold.intent_id == cached.intent_id
+
+    cold.constraints.append("extra")
+    assert IntentSynthesizer.synthesize(text, "code").constraints == cached.constraints
+
+
 def test_synthesizer_different_text_different_hash():
     """Test that different text produces different hash."""
     intent1 = IntentSynthesizer.synthesize("Create auth", "code")
@@ -192,9 +210,9 @@ def test_synthesizer_constraint_order_doesnt_matter():
 
 # IntentManager tests
 
-def test_manager_save_creates_file(temp_workspace):
+def test_manager_save_creates_file(temp_workspace, intent_pool):
     """Test saving intent creates file."""
-    intent = IntentSynthesizer.synthesize("Test intent", "code")
+    intent = intent_pool[3]
     manager = IntentManager(temp_workspace)
 
     path = manager.save(intent)
@@ -204,9 +222,9 @@ def test_manager_save_creates_file(temp_workspace):
     assert path.suffix == ".json"
 
 
-def test_manager_save_file_location(temp_workspace):
+def test_manager_save_file_location(temp_workspace, intent_pool):
     """Test intent saved to artifacts directory."""
-    intent = IntentSynthesizer.synthesize("Test intent", "code")
+    intent = intent_pool[3]
     manager = IntentManager(temp_workspace)
 
     path = manager.save(intent)
@@ -215,9 +233,20 @@ def test_manager_save_file_location(temp_workspace):
     assert str(intent.intent_hash[:16]) in path.name
 
 
-def test_manager_load_by_hash(temp_workspace):
+def test_manager_save_many(temp_workspace, intent_pool):
+    """Test save_many writes one loadable file per intent, in order."""
+    intents = list(intent_pool[:3])
+    manager = IntentManager(temp_workspace)
+
+    paths = manager.save_many(intents)
+
+    assert [p.name for p in paths] == [f"intent_{i.intent_hash[:16]}.json" for i in intents]
+    assert all(manager.load(i.intent_hash) == i for i in intents)
+
+
+def test_manager_load_by_hash(temp_workspace, intent_pool):
     """Test loading intent by hash."""
-    intent = IntentSynthesizer.synthesize("Test intent", "code")
+    intent = intent_pool[3]
     manager = IntentManager(temp_workspace)
     manager.save(intent)
 
@@ -228,9 +257,9 @@ def test_manager_load_by_hash(temp_workspace):
     assert loaded.distilled_intent == intent.distilled_intent
 
 
-def test_manager_load_by_partial_hash(temp_workspace):
+def test_manager_load_by_partial_hash(temp_workspace, intent_pool):
     """Test loading intent by partial hash (first 16 chars)."""
-    intent = IntentSynthesizer.synthesize("Test intent", "code")
+    intent = intent_pool[3]
     manager = IntentManager(temp_workspace)
     manager.save(intent)
 
@@ -241,16 +270,24 @@ def test_manager_load_by_partial_hash(temp_workspace):
     assert loaded.intent_id == intent.intent_id
 
 
-def test_manager_load_nonexistent():
+def test_manager_load_by_short_prefix(temp_workspace, intent_pool):
+    """Test loading intent by a prefix shorter than the 16 chars in the filename."""
+    manager = IntentManager(temp_workspace)
+    manager.save_many(list(intent_pool[:3]))
+    intent = intent_pool[1]
+
+    loaded = manager.load(intent.intent_hash[:8])
+
+    assert loaded == intent
+
+
+def test_manager_load_nonexistent(temp_workspace):
     """Test loading nonexistent intent returns None."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        ws = Workspace(tmpdir)
-        ws.initialize()
-        manager = IntentManager(tmpdir)
+    manager = IntentManager(temp_workspace)
 
-        loaded = manager.load("nonexistent_hash_123456789")
+    loaded = manager.load("nonexistent_hash_123456789")
 
-        assert loaded is None
+    assert loaded is None
 
 
 def test_manager_load_invalid_json(temp_workspace):
@@ -276,13 +313,11 @@ def test_manager_list_intents_empty(temp_workspace):
     assert intents == []
 
 
-def test_manager_list_intents(temp_workspace):
+def test_manager_list_intents(temp_workspace, intent_pool):
     """Test listing multiple intents."""
     manager = IntentManager(temp_workspace)
 
-    intent1 = IntentSynthesizer.synthesize("First intent", "code")
-    intent2 = IntentSynthesizer.synthesize("Second intent", "code")
-    intent3 = IntentSynthesizer.synthesize("Third intent", "code")
+    intent1, intent2, intent3 = intent_pool[:3]
 
     manager.save(intent1)
     manager.save(intent2)
@@ -294,13 +329,12 @@ def test_manager_list_intents(temp_workspace):
     assert all(isinstance(i, Intent) for i in intents)
 
 
-def test_manager_list_intents_sorted(temp_workspace):
+def test_manager_list_intents_sorted(temp_workspace, intent_pool):
     """Test list_intents returns intents sorted by created_at (newest first)."""
     manager = IntentManager(temp_workspace)
 
-    # Create intents (created_at will be auto-set)
-    intent1 = IntentSynthesizer.synthesize("First", "code")
-    intent2 = IntentSynthesizer.synthesize("Second", "code")
+    # Pool intents were synthesized in order, so created_at is ascending
+    intent1, intent2 = intent_pool[:2]
 
     manager.save(intent1)
     # Intents are sorted newest first, so list should have intent2 first
@@ -312,9 +346,9 @@ def test_manager_list_intents_sorted(temp_workspace):
     assert len(intents) == 2
 
 
-def test_manager_verify_hash_valid(temp_workspace):
+def test_manager_verify_hash_valid(temp_workspace, intent_pool):
     """Test hash verification for valid intent."""
-    intent = IntentSynthesizer.synthesize("Test intent", "code")
+    intent = intent_pool[3]
     manager = IntentManager(temp_workspace)
     manager.save(intent)
 
@@ -323,9 +357,9 @@ def test_manager_verify_hash_valid(temp_workspace):
     assert is_valid is True
 
 
-def test_manager_verify_hash_invalid(temp_workspace):
+def test_manager_verify_hash_invalid(temp_workspace, intent_pool):
     """Test hash verification fails for tampered intent."""
-    intent = IntentSynthesizer.synthesize("Test intent", "code")
+    intent = intent_pool[3].model_copy()
     manager = IntentManager(temp_workspace)
     manager.save(intent)
 
@@ -337,6 +371,30 @@ def test_manager_verify_hash_invalid(temp_workspace):
     assert is_valid is False
 
 
+def test_manager_verify_hash_after_reassignment(temp_workspace, intent_pool):
+    """Test a verified intent fails verification once a field is reassigned."""
+    intent = intent_pool[3].model_copy()
+    manager = IntentManager(temp_workspace)
+
+    assert manager.verify_hash(intent) is True
+
+    intent.constraints = ["Added later"]
+
+    assert manager.verify_hash(intent) is False
+
+
+def test_manager_verify_hash_after_in_place_mutation(temp_workspace, intent_pool):
+    """Test a verified intent fails verification once a list field is changed in place."""
+    intent = intent_pool[3].model_copy(deep=True)
+    manager = IntentManager(temp_workspace)
+
+    assert manager.verify_hash(intent) is True
+
+    intent.constraints.append("Added later")
+
+    assert manager.verify_hash(intent) is False
+
+
 def test_manager_verify_hash_constraint_order_ignored(temp_workspace):
     """Test that constraint order doesn't affect hash verification."""
     intent = IntentSynthesizer.synthesize("Must use X and Y", "code")
@@ -353,9 +411,9 @@ def test_manager_verify_hash_constraint_order_ignored(temp_workspace):
     assert is_valid is True
 
 
-def test_manager_save_preserves_json(temp_workspace):
+def test_manager_save_preserves_json(temp_workspace, intent_pool):
     """Test that saved intent can be read back as valid JSON."""
-    intent = IntentSynthesizer.synthesize("Test", "code")
+    intent = intent_pool[4]
     manager = IntentManager(temp_workspace)
     path = manager.save(intent)
 
@@ -399,6 +457,8 @@ def test_integration_determinism_across_invocations(temp_workspace):
     # Synthesize 5 times
     hashes = []
     for _ in range(5):
+        # Clear the memoized derivation so every invocation recomputes the hash
+        IntentSynthesizer._derive.cache_clear()
         intent = IntentSynthesizer.synthesize(text, mode)
         hashes.append(intent.intent_hash)
 
@@ -1,7 +1,6 @@
 """Tests for job module."""
 
 import json
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -19,29 +18,25 @@ from bit.job import (
     InputType,
     OutputType,
 )
-from bit.modes import SessionManager
-from bit.workspace import Workspace
 
 
 @pytest.fixture
-def temp_workspace():
-    """Create a temporary initialized workspace."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        ws = Workspace(tmpdir)
-        ws.initialize()
-        # Set mode to code for tests
-        session = SessionManager(tmpdir)
-        session.set_mode("code")
-        yield tmpdir
+def temp_workspace(code_workspace):
+    """Initialized workspace in "code" mode, copied from the session template."""
+    return code_workspace
+
+
+@pytest.fixture(scope="module")
+def intent_pool():
+    """Intents synthesized once per module; copy before use."""
+    texts = ["Create user authentication system. Must use OAuth2."]
+    return tuple(IntentSynthesizer.synthesize(text, "code") for text in texts)
 
 
 @pytest.fixture
-def sample_intent(temp_workspace):
+def sample_intent(temp_workspace, intent_pool):
     """Create a sample intent in workspace."""
-    intent = IntentSynthesizer.synthesize(
-        "Create user authentication system. Must use OAuth2.",
-        "code"
-    )
+    intent = intent_pool[0].model_copy(deep=True)
     manager = IntentManager(temp_workspace)
     manager.save(intent)
     return intent
@@ -321,6 +316,43 @@ def test_job_spec_hash_empty_lists():
     assert len(hash_val) == 64
 
 
+def test_job_spec_hash_pinned_with_inputs_and_outputs():
+    """Test the canonical form of inputs/outputs, and so stored hashes, does not drift."""
+    spec = JobSpec(
+        title="T",
+        intent="i",
+        success_criteria=["b", "a"],
+        constraints=["z"],
+        inputs=[
+            JobInput(name="n2", type=InputType.FILE, value="/x"),
+            JobInput(name="n1", type=InputType.INTEGER, value=3, required=False),
+        ],
+        outputs=[
+            JobOutput(name="o", type=OutputType.FOLDER, location="a/"),
+            JobOutput(name="a", type=OutputType.FILE, location="b.txt"),
+        ]
+    )
+
+    assert JobManager._compute_job_spec_hash(spec) == "f5b2e773e342292075bb2d10ee4e218884013905c4032c6a59bf801421a7c706"
+
+
+def test_job_spec_hash_tracks_field_reassignment():
+    """Test cached canonical encoding is dropped when a field is reassigned or copied."""
+    spec = JobSpec(
+        title="Test",
+        intent="Test intent",
+        success_criteria=["A"],
+        outputs=[JobOutput(name="artifacts", type=OutputType.FOLDER, location="artifacts/")]
+    )
+    original = JobManager._compute_job_spec_hash(spec)
+    copied = spec.model_copy(update={"constraints": ["X"]})
+
+    spec.constraints = ["X"]
+
+    assert JobManager._compute_job_spec_hash(spec) != original
+    assert JobManager._compute_job_spec_hash(copied) == JobManager._compute_job_spec_hash(spec)
+
+
 # ============================================================================
 # JobManager Tests (12 tests)
 # ============================================================================
@@ -348,24 +380,15 @@ def test_job_manager_create_from_intent_success_criteria_wrapped(temp_workspace,
     assert len(job.job_spec.success_criteria) > 0
 
 
-def test_job_manager_create_from_intent_has_output():
+def test_job_manager_create_from_intent_has_output(temp_workspace, sample_intent):
     """Test job spec has default artifacts output."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        ws = Workspace(tmpdir)
-        ws.initialize()
-        session = SessionManager(tmpdir)
-        session.set_mode("code")
-
-        intent = IntentSynthesizer.synthesize("Test intent", "code")
-        IntentManager(tmpdir).save(intent)
-
-        manager = JobManager(tmpdir)
-        job = manager.create_from_intent(intent, "code")
+    manager = JobManager(temp_workspace)
+    job = manager.create_from_intent(sample_intent, "code")
 
-        assert len(job.job_spec.outputs) > 0
-        assert job.job_spec.outputs[0].name == "artifacts"
-        assert job.job_spec.outputs[0].type == OutputType.FOLDER
-        assert job.job_spec.outputs[0].location == "artifacts/"
+    assert len(job.job_spec.outputs) > 0
+    assert job.job_spec.outputs[0].name == "artifacts"
+    assert job.job_spec.outputs[0].type == OutputType.FOLDER
+    assert job.job_spec.outputs[0].location == "artifacts/"
 
 
 def test_job_manager_create_from_intent_unique_ids(temp_workspace, sample_intent):
@@ -410,6 +433,23 @@ def test_job_manager_save_valid_yaml(temp_workspace, sample_intent):
     assert data["status"] == "draft"
 
 
+def test_job_manager_load_reads_json_sidecar_while_yaml_unchanged(temp_workspace, sample_intent, monkeypatch):
+    """Test the JSON sidecar replaces YAML parsing until job.yaml is edited."""
+    manager = JobManager(temp_workspace)
+    job = manager.create_from_intent(sample_intent, "code")
+    path = manager.save(job)
+    sidecar = json.loads((path.parent / JobManager.SIDECAR_FILENAME).read_bytes())
+    assert sidecar["stamp"] == [path.stat().st_mtime_ns, path.stat().st_size]
+    assert sidecar["data"]["job_id"] == job.job_id
+
+    monkeypatch.setattr("bit.job.yaml.load", lambda *a, **k: pytest.fail("YAML parsed"))
+    assert manager.load(job.job_id) == job
+
+    monkeypatch.undo()
+    path.write_text(path.read_text().replace("status: draft", "status: planned"))
+    assert manager.load(job.job_id).status == JobStatus.PLANNED
+
+
 def test_job_manager_load_by_id(temp_workspace, sample_intent):
     """Test loading job by ID."""
     manager = JobManager(temp_workspace)
@@ -422,13 +462,29 @@ def test_job_manager_load_by_id(temp_workspace, sample_intent):
     assert loaded.status == JobStatus.DRAFT
 
 
-def test_job_manager_load_nonexistent():
+def test_job_manager_batched_writes_last_saved_state(temp_workspace, sample_intent):
+    """Test batched() defers writes and flushes the last saved state once."""
+    manager = JobManager(temp_workspace)
+    job = manager.create_from_intent(sample_intent, "code")
+
+    with manager.batched():
+        path = manager.save(job)
+        manager.transition_to_planned(job)
+        manager.save(job)
+        with manager.batched():
+            assert not path.exists()
+        assert not path.exists()
+        # Unsaved changes after the last save are not written
+        job.status = JobStatus.FAILED
+
+    assert path.exists()
+    assert manager.load(job.job_id).status == JobStatus.PLANNED
+
+
+def test_job_manager_load_nonexistent(temp_workspace):
     """Test loading nonexistent job returns None."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        ws = Workspace(tmpdir)
-        ws.initialize()
-        manager = JobManager(tmpdir)
-        assert manager.load("job-nonexistent") is None
+    manager = JobManager(temp_workspace)
+    assert manager.load("job-nonexistent") is None
 
 
 def test_job_manager_load_corrupted_file(temp_workspace):
@@ -501,6 +557,22 @@ def test_verify_job_spec_hash_tampered(temp_workspace, sample_intent):
     assert manager.verify_job_spec_hash(job) is False
 
 
+def test_verify_job_spec_hash_in_place_mutation(temp_workspace, sample_intent):
+    """Test verification catches list and nested output changes made in place."""
+    manager = JobManager(temp_workspace)
+    job = manager.create_from_intent(sample_intent, "code")
+    assert manager.verify_job_spec_hash(job) is True
+
+    job.job_spec.constraints.append("Added later")
+    assert manager.verify_job_spec_hash(job) is False
+
+    job.job_spec.constraints.pop()
+    assert manager.verify_job_spec_hash(job) is True
+
+    job.job_spec.outputs[0].location = "elsewhere/"
+    assert manager.verify_job_spec_hash(job) is False
+
+
 def test_verify_intent_hash_valid(temp_workspace, sample_intent):
     """Test verifying valid intent hash."""
     manager = JobManager(temp_workspace)
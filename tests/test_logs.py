@@ -2,7 +2,6 @@
 
 import pytest
 from pathlib import Path
-from tempfile import TemporaryDirectory
 
 from bit.workspace import Workspace
 from bit.logs import LogReader
@@ -16,12 +15,10 @@ class TestLogReader:
     """Tests for LogReader."""
 
     @pytest.fixture
-    def workspace(self):
+    def workspace(self, tmp_path):
         """Create temporary workspace for testing."""
-        with TemporaryDirectory() as tmpdir:
-            ws = Workspace(tmpdir)
-            ws.initialize()
-            yield tmpdir
+        Workspace(str(tmp_path)).initialize()
+        return str(tmp_path)
 
     @pytest.fixture
     def log_reader(self, workspace):
@@ -149,6 +146,38 @@ class TestLogReader:
         assert summary["steps_started"] == 1
         assert summary["steps_completed"] == 1
 
+    def test_get_run_summary_tails_appended_events(self, workspace, log_reader, monkeypatch):
+        """Test a second summary parses only the events appended since the first."""
+        job_id = "test-job-1"
+        run_record = self._create_sample_log(workspace, job_id)
+        log = log_reader.get_run_log(job_id, run_record.run_id)
+
+        assert log_reader.get_run_summary(job_id, run_record.run_id)["total_events"] == 4
+
+        log.emit(Event(
+            type=EventType.STEP_STARTED,
+            timestamp="2026-02-04T00:00:04Z",
+            run_id=run_record.run_id,
+            job_id=job_id,
+            step_id="step-2",
+        ))
+        # Half-written line: ignored by the tail, but still seen by a full read
+        with open(log.log_path, "a") as f:
+            f.write('{"type": "step.completed"')
+
+        offsets = []
+        original_read_from = EventLog.read_from
+        monkeypatch.setattr(
+            EventLog, "read_from", lambda self, offset=0: offsets.append(offset) or original_read_from(self, offset)
+        )
+
+        summary = log_reader.get_run_summary(job_id, run_record.run_id)
+
+        assert offsets and offsets[0] > 0
+        assert summary["total_events"] == 5
+        assert summary["steps_started"] == 2
+        assert summary["steps_completed"] == 1
+
     def test_print_events_all(self, workspace, log_reader, capsys):
         """Test printing all events."""
         job_id = "test-job-1"
@@ -1,7 +1,6 @@
 """Tests for modes module."""
 
 import json
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -19,12 +18,10 @@ from bit.workspace import Workspace
 
 
 @pytest.fixture
-def temp_workspace():
+def temp_workspace(tmp_path):
     """Create a temporary initialized workspace."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        ws = Workspace(tmpdir)
-        ws.initialize()
-        yield tmpdir
+    Workspace(str(tmp_path)).initialize()
+    return str(tmp_path)
 
 
 # Mode catalog tests
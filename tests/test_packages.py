@@ -1,9 +1,11 @@
 """Tests for task package models and registry."""
 
 import json
+import shutil
 import pytest
 from pathlib import Path
-from tempfile import TemporaryDirectory
+
+from pydantic import ValidationError
 
 from bit.packages import (
     TaskPackage,
@@ -240,17 +242,134 @@ class TestTaskPackage:
 
         assert pkg1.compute_hash() != pkg2.compute_hash()
 
+    def test_package_hash_pinned(self):
+        """Test the canonical encoding is stable across runs and pydantic upgrades."""
+        pkg = TaskPackage(
+            package_id="test.basic",
+            version="1.0.0",
+            title="Test",
+            description="Test package",
+            intent=IntentSpec(category="test", verbs=["run"]),
+            input_contract=Contract(),
+            output_contract=Contract(),
+            pipeline=Pipeline(steps=[
+                PipelineStep(
+                    step_id="step_1",
+                    worker=Worker(worker_id="test", version="1.0.0"),
+                    inputs=[],
+                    outputs=[],
+                    params={"b": 1, "a": 2},
+                )
+            ]),
+            approval=ApprovalPolicy(),
+            verification=Verification(),
+            failure_handling=FailureHandling(),
+            resources=ResourceProfile(),
+            metadata={"created_at": "2026-02-04T00:00:00Z"},
+        )
+
+        # Keys sorted at every level, compact separators (the original json.dumps encoding)
+        assert pkg.canonical_json.startswith(b'{"approval":{"conditions":[],"required":false},"description"')
+        assert b'"params":{"a":2,"b":1}' in pkg.canonical_json
+        assert b"metadata" not in pkg.canonical_json
+        assert pkg.compute_hash() == "8c2594a174df7645f3809e677b310939a309dddaebc4fa4da8d600ce2f4e879e"
+
+    def test_package_hash_ignores_params_key_order(self):
+        """Test packages differing only in step params insertion order hash the same."""
+        def make(params):
+            return TaskPackage(
+                package_id="test.basic",
+                version="1.0.0",
+                title="Test",
+                description="Test package",
+                intent=IntentSpec(category="test"),
+                input_contract=Contract(),
+                output_contract=Contract(),
+                pipeline=Pipeline(steps=[
+                    PipelineStep(
+                        step_id="step_1",
+                        worker=Worker(worker_id="test", version="1.0.0"),
+                        inputs=[],
+                        outputs=[],
+                        params=params,
+                    )
+                ]),
+                approval=ApprovalPolicy(),
+                verification=Verification(),
+                failure_handling=FailureHandling(),
+                resources=ResourceProfile(),
+            )
+
+        forward = make({"a": 1, "b": {"x": 1, "y": 2}})
+        backward = make({"b": {"y": 2, "x": 1}, "a": 1})
+
+        assert forward.compute_hash() == backward.compute_hash()
+
+    def test_package_is_frozen_and_copy_rehashes(self):
+        """Test packages are immutable and model_copy drops the cached hash input."""
+        pkg = TaskPackage(
+            package_id="test.basic",
+            version="1.0.0",
+            title="Test",
+            description="Test package",
+            intent=IntentSpec(category="test"),
+            input_contract=Contract(),
+            output_contract=Contract(),
+            pipeline=Pipeline(steps=[]),
+            approval=ApprovalPolicy(),
+            verification=Verification(),
+            failure_handling=FailureHandling(),
+            resources=ResourceProfile(),
+        )
+        original_hash = pkg.compute_hash()
+
+        with pytest.raises(ValidationError):
+            pkg.title = "Changed"
+
+        assert pkg.compute_hash() == original_hash
+        assert pkg.model_copy(update={"title": "Changed"}).compute_hash() != original_hash
+
+    def test_package_submodels_frozen_and_strict(self):
+        """Test nested package models reject mutation and unknown keys."""
+        worker = Worker(worker_id="test", version="1.0.0")
+
+        with pytest.raises(ValidationError):
+            worker.version = "2.0.0"
+        with pytest.raises(ValidationError):
+            Worker(worker_id="test", version="1.0.0", unknown="x")
+
+    def test_package_match_tokens(self):
+        """Test cached match tokens are lowercased verbs, entities and category."""
+        pkg = TaskPackage(
+            package_id="audio.extract",
+            version="1.0.0",
+            title="Extract",
+            description="Extract stems",
+            intent=IntentSpec(category="Audio", verbs=["Extract", "split"], entities=["Stems"]),
+            input_contract=Contract(),
+            output_contract=Contract(),
+            pipeline=Pipeline(steps=[]),
+            approval=ApprovalPolicy(),
+            verification=Verification(),
+            failure_handling=FailureHandling(),
+            resources=ResourceProfile(),
+        )
+
+        assert pkg.intent.category == "audio"
+        assert pkg.intent.verbs == ["extract", "split"]
+        assert pkg.match_tokens == frozenset({"audio", "extract", "split", "stems"})
+        assert pkg.verb_tokens == frozenset({"extract", "split"})
+        assert "match_tokens" not in pkg.model_dump()
+
 
 class TestPackageRegistry:
     """Tests for PackageRegistry."""
 
     @pytest.fixture
-    def workspace(self):
+    def workspace(self, tmp_path):
         """Create temporary workspace for testing."""
-        with TemporaryDirectory() as tmpdir:
-            ws = Workspace(tmpdir)
-            ws.initialize()
-            yield tmpdir
+        Workspace(str(tmp_path)).initialize()
+        return str(tmp_path)
 
     @pytest.fixture
     def registry(self, workspace):
@@ -353,6 +472,276 @@ class TestPackageRegistry:
         assert retrieved.package_id == "test.basic"
         assert retrieved.version == "1.0.0"
 
+    def test_get_package_cached_until_file_changes(self, registry):
+        """Test repeated lookups reuse the parsed package until the file changes."""
+        pkg = TaskPackage(
+            package_id="test.cached",
+            version="1.0.0",
+            title="Cached",
+            description="Test package",
+            intent=IntentSpec(category="test"),
+            input_contract=Contract(),
+            output_contract=Contract(),
+            pipeline=Pipeline(steps=[]),
+            approval=ApprovalPolicy(),
+            verification=Verification(),
+            failure_handling=FailureHandling(),
+            resources=ResourceProfile(),
+        )
+        path = registry.add_package(pkg)
+
+        first = registry.get_package("test.cached", "1.0.0")
+        assert registry.get_package("test.cached", "1.0.0") is first
+        assert registry.list_packages()[0] is first
+
+        path.write_text(path.read_text().replace("title: Cached", "title: Edited on disk"))
+
+        assert registry.get_package("test.cached", "1.0.0").title == "Edited on disk"
+
+    def test_get_package_reads_json_sidecar_while_yaml_unchanged(self, workspace, registry, monkeypatch):
+        """Test the JSON sidecar replaces YAML parsing until package.yaml is edited."""
+        pkg = TaskPackage(
+            package_id="test.sidecar",
+            version="1.0.0",
+            title="Sidecar",
+            description="Test package",
+            intent=IntentSpec(category="test"),
+            input_contract=Contract(),
+            output_contract=Contract(),
+            pipeline=Pipeline(steps=[]),
+            approval=ApprovalPolicy(),
+            verification=Verification(),
+            failure_handling=FailureHandling(),
+            resources=ResourceProfile(),
+        )
+        path = registry.add_package(pkg)
+        sidecar = json.loads((path.parent / PackageRegistry.SIDECAR_FILENAME).read_bytes())
+        assert sidecar["stamp"] == [path.stat().st_mtime_ns, path.stat().st_size]
+        assert sidecar["data"]["package_id"] == "test.sidecar"
+
+        fresh = PackageRegistry(workspace)
+        monkeypatch.setattr("bit.registry.yaml.load", lambda *a, **k: pytest.fail("YAML parsed"))
+        assert fresh.get_package("test.sidecar", "1.0.0") == pkg
+
+        monkeypatch.undo()
+        path.write_text(path.read_text().replace("title: Sidecar", "title: Edited"))
+        assert PackageRegistry(workspace).get_package("test.sidecar", "1.0.0").title == "Edited"
+
+    def test_yaml_load_handles_non_ascii_bytes(self, workspace, registry):
+        """Test package.yaml with non-ASCII text loads from raw bytes (no sidecar)."""
+        pkg = TaskPackage(
+            package_id="text.cafe",
+            version="1.0.0",
+            title="Café ☕",
+            description="Tëst package",
+            intent=IntentSpec(category="text", verbs=["brew"]),
+            input_contract=Contract(),
+            output_contract=Contract(),
+            pipeline=Pipeline(steps=[]),
+            approval=ApprovalPolicy(),
+            verification=Verification(),
+            failure_handling=FailureHandling(),
+            resources=ResourceProfile(),
+        )
+        path = registry.add_package(pkg)
+        (path.parent / PackageRegistry.SIDECAR_FILENAME).unlink()
+        (registry.registry_dir / PackageRegistry.INDEX_FILENAME).unlink()
+
+        fresh = PackageRegistry(workspace)
+        assert fresh.get_package("text.cafe", "1.0.0") == pkg
+        assert [p.title for p in fresh.search_packages(verbs=["brew"])] == ["Café ☕"]
+
+    def test_index_filters_without_parsing(self, workspace, registry, monkeypatch):
+        """Test the on-disk index answers category filters without parsing packages."""
+        for package_id, category in [("audio.trim", "audio"), ("video.cut", "video")]:
+            registry.add_package(TaskPackage(
+                package_id=package_id,
+                version="1.0.0",
+                title=package_id,
+                description="Test package",
+                intent=IntentSpec(category=category, verbs=["cut"]),
+                input_contract=Contract(),
+                output_contract=Contract(),
+                pipeline=Pipeline(steps=[]),
+                approval=ApprovalPolicy(),
+                verification=Verification(),
+                failure_handling=FailureHandling(),
+                resources=ResourceProfile(),
+            ))
+
+        assert (Path(workspace) / "packages" / PackageRegistry.INDEX_FILENAME).exists()
+
+        fresh = PackageRegistry(workspace)
+        loaded = []
+        original_load = fresh._load_package_file
+        monkeypatch.setattr(fresh, "_load_package_file", lambda path: loaded.append(path) or original_load(path))
+
+        results = fresh.list_packages(category="video")
+
+        assert [p.package_id for p in results] == ["video.cut"]
+        assert len(loaded) == 1
+
+    def test_iter_packages_and_search_limit_load_lazily(self, workspace, registry, monkeypatch):
+        """Test iter_packages and search_packages(limit=...) stop loading once satisfied."""
+        for name in ["a", "b", "c"]:
+            registry.add_package(TaskPackage(
+                package_id=f"audio.{name}",
+                version="1.0.0",
+                title=name,
+                description="Test package",
+                intent=IntentSpec(category="audio", verbs=["cut"]),
+                input_contract=Contract(),
+                output_contract=Contract(),
+                pipeline=Pipeline(steps=[]),
+                approval=ApprovalPolicy(),
+                verification=Verification(),
+                failure_handling=FailureHandling(),
+                resources=ResourceProfile(),
+            ))
+
+        fresh = PackageRegistry(workspace)
+        loaded = []
+        original_load = fresh._load_package_file
+        monkeypatch.setattr(fresh, "_load_package_file", lambda path: loaded.append(path) or original_load(path))
+
+        first = next(fresh.iter_packages("audio"))
+        assert first.intent.category == "audio"
+        assert len(loaded) == 1
+
+        loaded.clear()
+        assert len(fresh.search_packages(verbs=["cut"], limit=2)) == 2
+        assert len(loaded) == 2
+        assert fresh.search_packages(verbs=["cut"], limit=0) == []
+
+    def test_list_packages_parallel_load_matches_iter_order(self, workspace, registry, monkeypatch):
+        """Test the thread-pooled cold load returns the same packages in scan order."""
+        for i in range(12):
+            registry.add_package(TaskPackage(
+                package_id=f"data.p{i:02d}",
+                version="1.0.0",
+                title=f"p{i}",
+                description="Test package",
+                intent=IntentSpec(category="data"),
+                input_contract=Contract(),
+                output_contract=Contract(),
+                pipeline=Pipeline(steps=[]),
+                approval=ApprovalPolicy(),
+                verification=Verification(),
+                failure_handling=FailureHandling(),
+                resources=ResourceProfile(),
+            ))
+
+        cold = PackageRegistry(workspace).list_packages()
+        sequential = list(PackageRegistry(workspace).iter_packages())
+
+        assert len(cold) == 12
+        assert [p.package_id for p in cold] == [p.package_id for p in sequential]
+
+        # Another cold listing reuses the pool instead of starting new threads
+        monkeypatch.setattr("bit.registry.ThreadPoolExecutor", lambda *a, **k: pytest.fail("new pool"))
+        assert len(PackageRegistry(workspace).list_packages()) == 12
+
+    def test_list_by_category_on_fresh_registry(self, workspace, registry):
+        """Test a category-filtered listing finds mismatched package_ids before any full scan."""
+        for package_id, category in [("audio.trim", "audio"), ("misc.tool", "audio"), ("video.cut", "video")]:
+            registry.add_package(TaskPackage(
+                package_id=package_id,
+                version="1.0.0",
+                title=package_id,
+                description="Test package",
+                intent=IntentSpec(category=category),
+                input_contract=Contract(),
+                output_contract=Contract(),
+                pipeline=Pipeline(steps=[]),
+                approval=ApprovalPolicy(),
+                verification=Verification(),
+                failure_handling=FailureHandling(),
+                resources=ResourceProfile(),
+            ))
+        (registry.registry_dir / PackageRegistry.INDEX_FILENAME).unlink()
+
+        fresh = PackageRegistry(workspace)
+
+        assert sorted(p.package_id for p in fresh.list_packages(category="audio")) == ["audio.trim", "misc.tool"]
+        assert sorted(p.package_id for p in fresh.search_packages(category="audio")) == ["audio.trim", "misc.tool"]
+        assert [p.package_id for p in fresh.list_packages(category="video")] == ["video.cut"]
+
+    def test_category_lookup_follows_rewritten_package(self, registry):
+        """Test the category lookup is rebuilt when a package's category changes on disk."""
+        for package_id in ["audio.trim", "misc.tool"]:
+            registry.add_package(TaskPackage(
+                package_id=package_id,
+                version="1.0.0",
+                title=package_id,
+                description="Test package",
+                intent=IntentSpec(category="audio"),
+                input_contract=Contract(),
+                output_contract=Contract(),
+                pipeline=Pipeline(steps=[]),
+                approval=ApprovalPolicy(),
+                verification=Verification(),
+                failure_handling=FailureHandling(),
+                resources=ResourceProfile(),
+            ))
+        assert len(registry.list_packages(category="audio")) == 2
+
+        path = registry._get_package_path("misc.tool", "1.0.0")
+        path.write_text(path.read_text().replace("category: audio", "category: video"))
+
+        assert [p.package_id for p in registry.list_packages(category="audio")] == ["audio.trim"]
+        assert [p.package_id for p in registry.list_packages(category="video")] == ["misc.tool"]
+
+    def test_index_picks_up_files_added_outside_registry(self, workspace, registry):
+        """Test package files copied in by hand are indexed on the next scan."""
+        pkg = TaskPackage(
+            package_id="file.copy",
+            version="1.0.0",
+            title="Copy",
+            description="Test package",
+            intent=IntentSpec(category="file", verbs=["copy"]),
+            input_contract=Contract(),
+            output_contract=Contract(),
+            pipeline=Pipeline(steps=[]),
+            approval=ApprovalPolicy(),
+            verification=Verification(),
+            failure_handling=FailureHandling(),
+            resources=ResourceProfile(),
+        )
+        assert registry.list_packages() == []
+
+        path = Path(workspace) / "packages" / "file" / "copy" / "v1.0.0" / "package.yaml"
+        path.parent.mkdir(parents=True)
+        path.write_text(json.dumps(pkg.model_dump(mode="json")))
+
+        assert [p.package_id for p in registry.search_packages(verbs=["copy"])] == ["file.copy"]
+
+    def test_search_peeks_header_before_full_load(self, workspace, registry, monkeypatch):
+        """Test search filters unindexed files by header and only fully loads matches."""
+        base = Path(workspace) / "packages" / "file"
+        for name, verb in [("zip", "compress"), ("broken", "compress"), ("copy", "duplicate")]:
+            path = base / name / "v1.0.0" / "package.yaml"
+            path.parent.mkdir(parents=True)
+            path.write_text(
+                f"package_id: file.{name}\n"
+                "version: 1.0.0\n"
+                "intent:\n"
+                "  category: file\n"
+                f"  verbs:\n  - {verb}\n"
+                "pipeline: [unclosed\n"
+            )
+
+        header = PackageRegistry._peek_header(str(base / "zip" / "v1.0.0" / "package.yaml"))
+        assert header["package_id"] == "file.zip"
+        assert header["intent"].verbs == ["compress"]
+
+        loaded = []
+        original_load = registry._load_package_file
+        monkeypatch.setattr(registry, "_load_package_file", lambda path: loaded.append(path) or original_load(path))
+
+        # Bodies are corrupted, so matches are dropped on full load; non-matches are never loaded
+        assert registry.search_packages(verbs=["compress"]) == []
+        assert len(loaded) == 2
+
     def test_get_package_not_found(self, registry):
         """Test retrieving non-existent package returns None."""
         result = registry.get_package("nonexistent.pkg", "1.0.0")
@@ -446,6 +835,9 @@ class TestPackageRegistry:
         results = registry.search_packages(verbs=["copy"])
         assert len(results) == 1
 
+        # Package terms are normalized to lowercase, so queries are case-insensitive
+        assert len(registry.search_packages(category="TEST", verbs=["Copy"])) == 1
+
         results = registry.search_packages(verbs=["delete"])
         assert len(results) == 0
 
@@ -601,6 +993,44 @@ class TestPackageRegistry:
         assert len(errors) > 0
         assert "undefined" in errors[0].lower()
 
+    def test_validate_package_undefined_inputs_in_order(self, registry):
+        """Test undefined inputs are reported per step in declaration order."""
+        pkg = TaskPackage(
+            package_id="test.invalid",
+            version="1.0.0",
+            title="Invalid",
+            description="Invalid package",
+            intent=IntentSpec(category="test"),
+            input_contract=Contract(fields=[
+                ContractField(name="a", type="string", description="A"),
+            ]),
+            output_contract=Contract(),
+            pipeline=Pipeline(steps=[
+                PipelineStep(
+                    step_id="step_1",
+                    worker=Worker(worker_id="test", version="1.0.0"),
+                    inputs=["z", "a", "y"],
+                    outputs=["b"],
+                ),
+                PipelineStep(
+                    step_id="step_2",
+                    worker=Worker(worker_id="test", version="1.0.0"),
+                    inputs=["b", "x"],
+                    outputs=["c"],
+                ),
+            ]),
+            approval=ApprovalPolicy(),
+            verification=Verification(),
+            failure_handling=FailureHandling(),
+            resources=ResourceProfile(),
+        )
+
+        assert registry.validate_package(pkg) == [
+            "Step step_1 references undefined input: z",
+            "Step step_1 references undefined input: y",
+            "Step step_2 references undefined input: x",
+        ]
+
     def test_validate_package_unproduce_output(self, registry):
         """Test validation fails when output is not produced."""
         pkg = TaskPackage(
@@ -667,3 +1097,63 @@ class TestPackageRegistry:
         assert "extract" in str(path)
         assert "v2.1.3" in str(path)
         assert "package.yaml" in str(path)
+
+    def test_add_package_recreates_removed_known_dir(self, registry):
+        """Test a cached directory removed behind the registry's back is recreated."""
+        def make(version):
+            return TaskPackage(
+                package_id="audio.trim",
+                version=version,
+                title="Trim",
+                description="Test package",
+                intent=IntentSpec(category="audio", verbs=["trim"]),
+                input_contract=Contract(),
+                output_contract=Contract(),
+                pipeline=Pipeline(steps=[]),
+                approval=ApprovalPolicy(),
+                verification=Verification(),
+                failure_handling=FailureHandling(),
+                resources=ResourceProfile(),
+            )
+
+        registry.add_package(make("1.0.0"))
+        assert registry.registry_dir / "audio" / "trim" in registry._known_dirs
+
+        shutil.rmtree(registry.registry_dir / "audio")
+        registry.add_package(make("1.0.1"))
+
+        assert registry.get_package("audio.trim", "1.0.1") is not None
+
+    @pytest.mark.parametrize("version,valid", [
+        ("1.0.0", True),
+        ("10.20.30", True),
+        ("1.0.0.4", True),
+        ("1.0", False),
+        ("1.0.x", False),
+        ("1.0.0-beta", False),
+        ("v1.0.0", False),
+        ("", False),
+    ])
+    def test_is_valid_semver(self, version, valid):
+        """Test semver check on the first three dot-separated parts."""
+        assert PackageRegistry._is_valid_semver(version) is valid
+
+    @pytest.mark.parametrize("version", [
+        "1.0.0", "1.0.0.", "1.0.0.x y", "1.0.0.x\ny", "1.0.0\n", "\n1.0.0", "1.0.0 ",
+        " 1.0.0", "+1.0.0", "-1.0.0", "1_0.0.0", "1__0.0.0", "\u0661.\u0662.\u0663",
+        "\u00b2.0.0", "1..0", "1.0", "1.0.0-beta", "", ".", "..", "1.0.0\n.x", "0x1.0.0",
+    ])
+    def test_is_valid_semver_matches_split_rule(self, version):
+        """Test the regex fast path never changes what the split/int() rule accepts."""
+        def split_rule(v):
+            parts = v.split(".")
+            if len(parts) < 3:
+                return False
+            for part in parts[:3]:
+                try:
+                    int(part)
+                except ValueError:
+                    return False
+            return True
+
+        assert PackageRegistry._is_valid_semver(version) is split_rule(version)
@@ -1,7 +1,8 @@
 """Tests for planner and plan models."""
 
+import json
 import pytest
-from tempfile import TemporaryDirectory
+import yaml
 from pathlib import Path
 
 from bit.workspace import Workspace
@@ -28,12 +29,10 @@ class TestPlanner:
     """Tests for Planner class."""
 
     @pytest.fixture
-    def workspace(self):
+    def workspace(self, tmp_path):
         """Create temporary workspace for testing."""
-        with TemporaryDirectory() as tmpdir:
-            ws = Workspace(tmpdir)
-            ws.initialize()
-            yield tmpdir
+        Workspace(str(tmp_path)).initialize()
+        return str(tmp_path)
 
     @pytest.fixture
     def registry(self, workspace):
@@ -200,6 +199,56 @@ class TestPlanner:
             # May or may not be ambiguous depending on exact scores
             assert isinstance(is_ambiguous, bool)
 
+    def test_planner_caches_candidates_per_registry_version(self, planner, registry, monkeypatch):
+        """Test candidate lists are cached until the registry changes."""
+        calls = []
+        original_list = registry.list_packages
+        monkeypatch.setattr(
+            registry, "list_packages", lambda category=None: calls.append(category) or original_list(category)
+        )
+        job_spec = JobSpec(
+            title="Test Echo",
+            intent="Echo the message",
+            success_criteria=["Output"],
+            inputs=[],
+            outputs=[],
+        )
+
+        planner.match_package(job_spec)
+        planner.match_packages_with_ambiguity(job_spec)
+        assert calls == [None]
+
+        original = registry.get_package("test.echo", "1.0.0")
+        registry.add_package(original.model_copy(update={"version": "1.1.0"}))
+        planner.match_package(job_spec)
+        assert calls == [None, None]
+
+        planner.invalidate_cache()
+        planner.match_package(job_spec)
+        assert calls == [None, None, None]
+
+    def test_planner_ambiguity_result_shape(self, planner, registry):
+        """Test unambiguous matches return only the best; ambiguous return all, sorted."""
+        job_spec = JobSpec(
+            title="Test Echo",
+            intent="Echo the message",
+            success_criteria=["Output"],
+            inputs=[],
+            outputs=[],
+        )
+
+        matches, is_ambiguous = planner.match_packages_with_ambiguity(job_spec)
+        assert is_ambiguous is False
+        assert [p.package_id for p, _ in matches] == ["test.echo"]
+
+        original = registry.get_package("test.echo", "1.0.0")
+        registry.add_package(original.model_copy(update={"package_id": "test.echo_twin"}))
+
+        matches, is_ambiguous = planner.match_packages_with_ambiguity(job_spec)
+        assert is_ambiguous is True
+        assert len(matches) == 2
+        assert matches[0][1] >= matches[1][1]
+
     def test_planner_generate_plan(self, planner, registry):
         """Test generating execution plan."""
         # Create a job
@@ -242,9 +291,15 @@ class TestPlanner:
         assert plan.matched_confidence == confidence
         assert len(plan.pipeline.steps) > 0
 
+        # Re-issuing the plan keeps its content but not its identity
+        again = planner.regenerate_plan(plan)
+        assert again.plan_id != plan.plan_id
+        assert again.compute_hash() == plan.compute_hash()
+        assert again.resolved_inputs == plan.resolved_inputs
+
     def test_planner_compute_match_score(self):
         """Test match score computation."""
-        keywords = ["echo", "message"]
+        keywords = frozenset(["echo", "message"])
 
         pkg = TaskPackage(
             package_id="test.echo",
@@ -329,17 +384,55 @@ class TestPlanner:
         assert resolved.inputs[0].name == "message"
         assert resolved.inputs[0].value == "Hello"
 
+    @pytest.mark.parametrize("input_count", [2, 8])
+    def test_planner_resolve_inputs_scan_and_dict_paths(self, input_count):
+        """Test small (linear scan) and large (dict) input lists resolve identically."""
+        job_spec = JobSpec(
+            title="Test",
+            intent="Test",
+            success_criteria=["Success"],
+            inputs=[
+                JobInput(name=f"in_{i}", type=InputType.STRING, value=f"v{i}")
+                for i in range(input_count)
+            ],
+            outputs=[],
+        )
+
+        pkg = TaskPackage(
+            package_id="test.echo",
+            version="1.0.0",
+            title="Echo",
+            description="Echo",
+            intent=IntentSpec(category="test"),
+            input_contract=Contract(fields=[
+                ContractField(name="in_1", type="string", description="Provided"),
+                ContractField(name="missing", type="string", description="Required, absent"),
+                ContractField(name="optional", type="string", description="Optional", required=False),
+            ]),
+            output_contract=Contract(),
+            pipeline=Pipeline(steps=[]),
+            approval=ApprovalPolicy(),
+            verification=Verification(),
+            failure_handling=FailureHandling(),
+            resources=ResourceProfile(),
+        )
+
+        resolved = Planner._resolve_inputs(job_spec, pkg)
+
+        assert [(r.name, r.value) for r in resolved.inputs] == [
+            ("in_1", "v1"),
+            ("missing", "<unresolved:missing>"),
+        ]
+
 
 class TestPlanManager:
     """Tests for PlanManager class."""
 
     @pytest.fixture
-    def workspace(self):
+    def workspace(self, tmp_path):
         """Create temporary workspace for testing."""
-        with TemporaryDirectory() as tmpdir:
-            ws = Workspace(tmpdir)
-            ws.initialize()
-            yield tmpdir
+        Workspace(str(tmp_path)).initialize()
+        return str(tmp_path)
 
     @pytest.fixture
     def plan_manager(self, workspace):
@@ -431,6 +524,19 @@ class TestPlanManager:
         assert loaded.plan_id == sample_plan.plan_id
         assert loaded.job_id == sample_plan.job_id
 
+    def test_plan_manager_saves_json_and_reads_legacy_yaml(self, plan_manager, sample_plan):
+        """Test plans are saved as JSON while older YAML plans still load."""
+        path = plan_manager.save(sample_plan)
+        legacy_path = path.with_name("legacy-plan.yaml")
+        legacy = sample_plan.model_dump(mode="json")
+        legacy["plan_id"] = "legacy-plan"
+        legacy_path.write_text(yaml.dump(legacy, default_flow_style=False, sort_keys=False))
+
+        assert path.suffix == ".json"
+        assert json.loads(path.read_text())["plan_id"] == sample_plan.plan_id
+        assert plan_manager.load(sample_plan.job_id, "legacy-plan") is not None
+        assert len(plan_manager.list_plans(sample_plan.job_id)) == 2
+
     def test_plan_manager_list_plans(self, plan_manager, sample_plan):
         """Test listing plans for a job."""
         plan_manager.save(sample_plan)
@@ -440,6 +546,18 @@ class TestPlanManager:
         assert len(plans) == 1
         assert plans[0].plan_id == sample_plan.plan_id
 
+    def test_plan_manager_list_plans_many_sorted(self, plan_manager, sample_plan):
+        """Test listing many plans returns all of them, newest first."""
+        for i in range(12):
+            plan_manager.save(sample_plan.model_copy(update={
+                "plan_id": f"plan-{i:02d}",
+                "created_at": f"2026-02-04T00:00:{i:02d}Z",
+            }))
+
+        plans = plan_manager.list_plans(sample_plan.job_id)
+
+        assert [p.plan_id for p in plans] == [f"plan-{i:02d}" for i in reversed(range(12))]
+
     def test_plan_manager_get_latest_plan(self, plan_manager, sample_plan):
         """Test getting the latest plan."""
         plan_manager.save(sample_plan)
@@ -449,12 +567,106 @@ class TestPlanManager:
         assert latest is not None
         assert latest.plan_id == sample_plan.plan_id
 
+    def test_plan_manager_get_latest_plan_reads_one_file(self, plan_manager, sample_plan, monkeypatch):
+        """Test get_latest_plan picks the newest file by name and parses only it."""
+        for plan_id, created_at in [
+            ("plan-b", "2026-02-04T00:00:02Z"),
+            ("plan-c", "2026-02-04T00:00:03.500000Z"),
+            ("plan-a", "2026-02-04T00:00:01Z"),
+        ]:
+            path = plan_manager.save(sample_plan.model_copy(update={"plan_id": plan_id, "created_at": created_at}))
+            assert path.name.endswith(f"-{plan_id}.json")
+
+        parsed = []
+        original_parse = PlanManager._parse_plan
+
+        def counting_parse(raw, suffix, trusted=False):
+            parsed.append(suffix)
+            return original_parse(raw, suffix, trusted)
+
+        monkeypatch.setattr(PlanManager, "_parse_plan", staticmethod(counting_parse))
+
+        latest = plan_manager.get_latest_plan(sample_plan.job_id)
+
+        assert latest.plan_id == "plan-c"
+        assert len(parsed) == 1
+        assert plan_manager.load(sample_plan.job_id, "plan-a").plan_id == "plan-a"
+
     def test_plan_manager_get_latest_plan_none(self, plan_manager):
         """Test getting latest plan when none exist."""
         latest = plan_manager.get_latest_plan("nonexistent-job")
 
         assert latest is None
 
+    def test_plan_manager_reads_json_and_skips_corrupted(self, plan_manager, sample_plan):
+        """Test JSON plan files are loaded and corrupted files are skipped."""
+        plans_dir = plan_manager._ensure_job_plans_dir(sample_plan.job_id)
+        (plans_dir / f"{sample_plan.plan_id}.json").write_text(sample_plan.model_dump_json())
+        (plans_dir / "broken.yaml").write_text("plan_id: [unclosed")
+
+        loaded = plan_manager.load(sample_plan.job_id, sample_plan.plan_id)
+        plans = plan_manager.list_plans(sample_plan.job_id)
+
+        assert loaded is not None
+        assert loaded.compute_hash() == sample_plan.compute_hash()
+        assert [p.plan_id for p in plans] == [sample_plan.plan_id]
+        assert plan_manager.load(sample_plan.job_id, "broken") is None
+
+    def test_plan_manager_trusted_load_matches_validated(self, plan_manager, sample_plan):
+        """Test the unvalidated fast path yields the same plan as full validation."""
+        plan_manager.save(sample_plan)
+
+        fast = plan_manager.load(sample_plan.job_id, sample_plan.plan_id)
+        validated = plan_manager.load(sample_plan.job_id, sample_plan.plan_id, validate=True)
+
+        assert fast == validated
+        assert fast.pipeline.steps[0].worker.status == validated.pipeline.steps[0].worker.status
+        assert fast.model_dump_json() == validated.model_dump_json()
+        assert fast.compute_hash() == sample_plan.compute_hash()
+
+    def test_plan_manager_validated_load_rejects_bad_schema(self, plan_manager, sample_plan):
+        """Test validate=True returns None for schema-invalid plans."""
+        plans_dir = plan_manager._ensure_job_plans_dir(sample_plan.job_id)
+        data = sample_plan.model_dump(mode="json")
+        data["matched_confidence"] = "not-a-number"
+        (plans_dir / f"{sample_plan.plan_id}.json").write_text(json.dumps(data))
+
+        assert plan_manager.load(sample_plan.job_id, sample_plan.plan_id, validate=True) is None
+
+    def test_plan_manager_validates_files_it_did_not_save(self, plan_manager, sample_plan):
+        """Test malformed plan files are rejected even without validate=True."""
+        plans_dir = plan_manager._ensure_job_plans_dir(sample_plan.job_id)
+        bad_type = sample_plan.model_dump(mode="json")
+        bad_type["matched_confidence"] = "not-a-number"
+        (plans_dir / "bad-type.json").write_text(json.dumps(bad_type))
+        missing = sample_plan.model_dump(mode="json")
+        del missing["pipeline"]
+        (plans_dir / "missing.yaml").write_text(yaml.safe_dump(missing))
+
+        assert plan_manager.load(sample_plan.job_id, "bad-type") is None
+        assert plan_manager.load(sample_plan.job_id, "missing") is None
+        assert plan_manager.list_plans(sample_plan.job_id) == []
+
+    def test_plan_manager_validates_saved_file_edited_on_disk(self, plan_manager, sample_plan):
+        """Test a saved plan rewritten by hand is no longer trusted."""
+        path = plan_manager.save(sample_plan)
+        data = json.loads(path.read_text())
+        data["matched_confidence"] = "not-a-number"
+        path.write_text(json.dumps(data))
+
+        assert plan_manager.load(sample_plan.job_id, sample_plan.plan_id) is None
+
+    def test_execution_plan_hash_ignores_params_key_order(self, sample_plan):
+        """Test plans differing only in dict key insertion order hash the same."""
+        def with_params(params):
+            step = sample_plan.pipeline.steps[0].model_copy(update={"params": params})
+            return sample_plan.model_copy(update={"pipeline": Pipeline(steps=[step])})
+
+        forward = with_params({"a": 1, "b": {"x": 1, "y": 2}})
+        backward = with_params({"b": {"y": 2, "x": 1}, "a": 1})
+
+        assert forward.compute_hash() == backward.compute_hash()
+
     def test_execution_plan_hash_deterministic(self, sample_plan):
         """Test that plan hash is deterministic."""
         hash1 = sample_plan.compute_hash()
@@ -2,14 +2,15 @@
 
 import pytest
 from pathlib import Path
-from tempfile import TemporaryDirectory
 import json
+import re
+from datetime import datetime, UTC
 
 from bit.workspace import Workspace
 from bit.plan import ExecutionPlan, ResolvedInputs, ResolvedInput, ResourceRequirements
 from bit.packages import Pipeline, PipelineStep, Worker
-from bit.router import Router, RuntimeContext
-from bit.events import Event, EventType, EventLog, RunRecord
+from bit.router import Router, RuntimeContext, _COMPILED_CACHE_SIZE
+from bit.events import Event, EventType, EventLog, RunRecord, utc_now_iso
 from bit.workers_stub import EchoWorker, FileWorker
 
 
@@ -81,15 +82,25 @@ class TestEvent:
         assert data["type"] == "job.started"
         assert data["run_id"] == "run-1"
 
+    def test_utc_now_iso_format(self):
+        """Test timestamps carry microseconds, a Z suffix and the current time."""
+        before = datetime.now(UTC)
+        stamps = [utc_now_iso() for _ in range(3)]
+
+        for stamp in stamps:
+            assert re.fullmatch(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}Z", stamp)
+        assert stamps == sorted(stamps)
+        parsed = datetime.fromisoformat(stamps[0].replace("Z", "+00:00"))
+        assert abs((parsed - before).total_seconds()) < 5
+
 
 class TestEventLog:
     """Tests for EventLog."""
 
     @pytest.fixture
-    def temp_dir(self):
+    def temp_dir(self, tmp_path):
         """Create temporary directory for testing."""
-        with TemporaryDirectory() as tmpdir:
-            yield tmpdir
+        return str(tmp_path)
 
     def test_event_log_emit(self, temp_dir):
         """Test emitting events to log."""
@@ -198,6 +209,33 @@ class TestEventLog:
 
         assert len(last_3) == 3
 
+    def test_event_log_emit_batch(self, temp_dir):
+        """Test emitting a batch appends all events in order."""
+        log_path = Path(temp_dir) / "test.jsonl"
+        log = EventLog(log_path)
+
+        log.emit(Event(
+            type=EventType.JOB_STARTED,
+            timestamp="2026-02-04T00:00:00Z",
+            run_id="run-1",
+            job_id="job-1",
+        ))
+        log.emit_batch([
+            Event(
+                type=EventType.STEP_STARTED,
+                timestamp=f"2026-02-04T00:00:{i:02d}Z",
+                run_id="run-1",
+                job_id="job-1",
+                step_id=f"step-{i}",
+            )
+            for i in range(1, 4)
+        ])
+        log.emit_batch([])
+
+        events = log.read()
+
+        assert [e.step_id for e in events] == [None, "step-1", "step-2", "step-3"]
+
 
 class TestRunRecord:
     """Tests for RunRecord."""
@@ -222,21 +260,44 @@ class TestRunRecord:
         assert record.completed_at is not None
 
 
-class TestRouter:
-    """Tests for Router."""
+class TestFileWorker:
+    """Tests for FileWorker stub."""
 
-    @pytest.fixture
-    def workspace(self):
-        """Create temporary workspace for testing."""
-        with TemporaryDirectory() as tmpdir:
-            ws = Workspace(tmpdir)
-            ws.initialize()
-            yield tmpdir
+    def test_file_worker_returns_absolute_path(self, tmp_path, monkeypatch):
+        """Test absolute destinations pass through and relative ones resolve against cwd."""
+        worker = FileWorker()
+        absolute_dest = tmp_path / "out" / "a.txt"
 
-    @pytest.fixture
-    def router(self, workspace):
-        """Create router for testing."""
-        return Router(workspace)
+        outputs = worker.execute({"source_file": "src.txt", "destination_path": str(absolute_dest)}, {})
+        assert outputs == {"copied_file": str(absolute_dest)}
+        assert absolute_dest.exists()
+
+        monkeypatch.chdir(tmp_path)
+        outputs = worker.execute({"source_file": "src.txt", "destination_path": "rel/b.txt"}, {})
+        assert outputs == {"copied_file": str(tmp_path / "rel" / "b.txt")}
+        assert (tmp_path / "rel" / "b.txt").exists()
+
+
+@pytest.fixture(scope="module")
+def workspace(tmp_path_factory):
+    """Workspace shared by the router tests; every run writes its own run_id log."""
+    tmpdir = str(tmp_path_factory.mktemp("router_ws"))
+    Workspace(tmpdir).initialize()
+    return tmpdir
+
+
+@pytest.fixture(scope="module")
+def router(workspace):
+    """Router shared by the router tests.
+
+    Compiled plans are cached per plan object (checked by identity), so a fresh
+    plan fixture in each test is never served another test's steps.
+    """
+    return Router(workspace)
+
+
+class TestRouter:
+    """Tests for Router."""
 
     @pytest.fixture
     def echo_plan(self):
@@ -343,3 +404,48 @@ class TestRouter:
 
         assert success is False
         assert run_record.status == "failed"
+
+    def test_router_reuses_compiled_plan(self, router, echo_plan):
+        """Test that re-executing a plan reuses its compiled steps."""
+        first = router._compile(echo_plan)
+        assert router._compile(echo_plan) is first
+
+        success, _ = router.execute_plan(echo_plan)
+        assert success is True
+        assert router._compile(echo_plan) is first
+
+        # A different plan object with the same ID is recompiled
+        other = echo_plan.model_copy()
+        assert router._compile(other) is not first
+
+    def test_router_compiled_cache_is_bounded(self, workspace, echo_plan):
+        """Test that the compiled-plan cache drops the least recently used plan."""
+        router = Router(workspace)
+        plans = [
+            echo_plan.model_copy(update={"plan_id": f"plan-{i}"})
+            for i in range(_COMPILED_CACHE_SIZE + 1)
+        ]
+        first = router._compile(plans[0])
+        for plan in plans[1:-1]:
+            router._compile(plan)
+        # Touch the oldest so the second plan becomes the eviction candidate
+        assert router._compile(plans[0]) is first
+        router._compile(plans[-1])
+
+        assert len(router._compiled) == _COMPILED_CACHE_SIZE
+        assert "plan-0" in router._compiled
+        assert "plan-1" not in router._compiled
+
+    def test_router_unknown_worker_fails(self, router, workspace, echo_plan):
+        """Test that an unknown worker fails the run at its step."""
+        step = echo_plan.pipeline.steps[0].model_copy(
+            update={"worker": Worker(worker_id="missing_worker", version="1.0.0")}
+        )
+        plan = echo_plan.model_copy(update={"pipeline": Pipeline(steps=[step])})
+
+        success, run_record = router.execute_plan(plan)
+
+        assert success is False
+        log_path = Path(workspace) / "jobs" / plan.job_id / "logs" / f"{run_record.run_id}.jsonl"
+        failed = EventLog(log_path).get_latest(EventType.JOB_FAILED)
+        assert failed.payload["error"] == "Step step_1: Unknown worker: missing_worker"
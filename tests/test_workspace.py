@@ -1,7 +1,6 @@
 """Tests for workspace module."""
 
 import json
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -10,10 +9,9 @@ from bit.workspace import Workspace, WorkspaceConfig
 
 
 @pytest.fixture
-def temp_workspace_dir():
+def temp_workspace_dir(tmp_path):
     """Create temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield tmpdir
+    return str(tmp_path)
 
 
 def test_workspace_initialize(temp_workspace_dir):
@@ -49,6 +47,18 @@ def test_workspace_initialize_exists(temp_workspace_dir):
         ws.initialize()
 
 
+def test_workspace_initialize_skip_existing(temp_workspace_dir):
+    """Test skip_existing returns the existing config without rewriting it."""
+    ws = Workspace(temp_workspace_dir)
+    config = ws.initialize()
+    mtime = ws.config_file.stat().st_mtime_ns
+
+    again = Workspace(temp_workspace_dir).initialize(skip_existing=True)
+
+    assert again == config
+    assert ws.config_file.stat().st_mtime_ns == mtime
+
+
 def test_workspace_validate(temp_workspace_dir):
     """Test workspace validation."""
     ws = Workspace(temp_workspace_dir)
@@ -102,6 +112,35 @@ def test_workspace_load_config(temp_workspace_dir):
     assert config2.version == config1.version
 
 
+def test_workspace_load_config_cached_until_file_changes(temp_workspace_dir):
+    """Test config is parsed once and re-read after the file changes."""
+    ws = Workspace(temp_workspace_dir)
+    ws.initialize()
+
+    assert ws.validate() is True
+    config = ws.load_config()
+    assert ws.load_config() is config
+
+    data = config.model_dump()
+    data["version"] = "2.0"
+    ws.config_file.write_text(json.dumps(data, indent=4))
+
+    reloaded = ws.load_config()
+    assert reloaded is not config
+    assert reloaded.version == "2.0"
+
+
+def test_workspace_validate_invalid_config(temp_workspace_dir):
+    """Test validation fails on a corrupted config."""
+    ws = Workspace(temp_workspace_dir)
+    ws.initialize()
+
+    ws.config_file.write_text("{not json")
+
+    with pytest.raises(ValueError, match="Invalid config"):
+        ws.validate()
+
+
 def test_workspace_hash_content():
     """Test deterministic content hashing."""
     content = "test content"
@@ -119,3 +158,11 @@ def test_workspace_hash_content():
     # Hash is hex string
     assert len(hash1) == 64  # SHA256 hex
     assert all(c in "0123456789abcdef" for c in hash1)
+
+
+def test_workspace_hash_content_is_sha256():
+    """Test hashes stay SHA256 for str and bytes input (stored hashes depend on it)."""
+    expected = "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"
+
+    assert Workspace.hash_content("abc") == expected
+    assert Workspace.hash_content(b"abc") == expected